@@ -0,0 +1,31 @@
+"""google.generativeai 지연 로딩
+
+SDK 임포트만으로 1초 가까이 걸리므로 모델을 실제로 만들 때 처음 로드합니다.
+"""
+
+_genai = None
+
+
+def genai():
+    """google.generativeai 모듈 (첫 호출 시 임포트)"""
+    global _genai
+    if _genai is None:
+        import google.generativeai as module
+        _genai = module
+    return _genai
+
+
+def create_model(api_key: str, model_name: str = 'gemini-2.0-flash-exp'):
+    module = genai()
+    module.configure(api_key=api_key)
+    return module.GenerativeModel(model_name)
+
+
+def generation_config(**kwargs):
+    return genai().types.GenerationConfig(**kwargs)
+
+
+def rate_limit_error() -> type:
+    """except 절에서 쓰는 ResourceExhausted (예외가 났을 때만 임포트)"""
+    from google.api_core.exceptions import ResourceExhausted
+    return ResourceExhausted
@@ -1,19 +1,91 @@
 import os
 import json
+import random
 import asyncio
+from collections import Counter
 from typing import List, Dict
 from dotenv import load_dotenv
-import google.generativeai as genai
-import google.api_core.exceptions
+from ai import gemini
+from ai.job_quality_scorer import estimate_tokens
+from processors.job_analytics import JobAnalytics
 from utils.logger import setup_logger
 
 logger = setup_logger("job_analyzer_chatbot")
 
 load_dotenv()
 
+# 프롬프트 예산 (입력 컨텍스트는 여유를 두고 잡음)
+ANALYSIS_CONTEXT_TOKENS = 24000
+MAP_OUTPUT_TOKENS = 2048
+REPORT_OUTPUT_TOKENS = 8192
+SAMPLE_CONTEXT_TOKENS = 6000
+MAX_CONCURRENT_MAPS = 4
+TOP_KEYWORDS_PER_CATEGORY = 30
+TOP_HIGHLIGHTS = 40
+
+SKILL_CATEGORIES = [
+    '보안 기초 지식', '디지털포렌식', '프로그래밍/자동화',
+    '클라우드/인프라 보안', '자격증/학위', '소프트 스킬', '기타'
+]
+
+ANALYSIS_INSTRUCTIONS = """
+당신은 채용 공고 데이터 분석 전문가 입니다. 아래 단계에 따라 분석하십시오.
+
+## 1. 기본 구조화
+- 회사명, 직무명, 채용구분(신입/주니어/무관), 근무지역 정리
+- 주요업무 / 자격요건 / 우대사항을 명확히 구분
+
+## 2. 역량 키워드 추출 및 분류
+자격요건·우대사항에서 등장하는 **기술·지식·자격증 키워드**를 아래 카테고리별로 분류
+(빈도는 직접 세지 말고 함께 제공되는 **사전 집계 표**의 수치를 그대로 인용):
+- 🔹 **보안 기초 지식**: 네트워크, 운영체제, 암호학, 취약점 분석
+- 🔹 **디지털포렌식**: 로그 분석, 메모리 포렌식, 디스크 이미지 분석, 사고 대응(IR)
+- 🔹 **프로그래밍/자동화**: Python, C/C++, Java, Bash, PowerShell, 로그 파서 개발
+- 🔹 **클라우드/인프라 보안**: AWS, Azure, GCP, VMware, Kubernetes, 컨테이너 보안, 인프라 아키텍처 보안
+- 🔹 **자격증/학위**: 정보보안기사, CISSP, CISA, CEH, 클라우드 보안 관련 자격증
+- 🔹 **소프트 스킬**: 문제해결력, 커뮤니케이션, 분석적 사고
+
+## 3. 기업 니즈 분석
+- 공통적으로 요구되는 최소 역량 (baseline)
+- 차별화를 주는 고급 역량 (differentiator)
+- 특히 **클라우드·인프라 보안** 역량에서 강조되는 부분 별도 정리
+- 산업군(금융, IT 서비스, 제조, 게임 등)에 따른 차이
+
+## 4. 학습/준비 로드맵 제안
+- 위 분석 기반으로 신입·주니어 취업 준비생이 갖춰야 할 **공부 우선순위** 제시
+- 단계별 로드맵 (예: 1단계 네트워크·리눅스, 2단계 Python 로그 분석, 3단계 클라우드 보안·인프라 아키텍처, 4단계 자격증·CTF 실습)
+- 각 역량별 실습 아이디어와 추천 리소스(CTF, 강의, 교재, 프로젝트 주제 등) 포함
+
+## 5. 최종 산출물 형식
+- 📊 표: 회사별 요구사항 정리
+- 📌 bullet: 핵심 키워드 및 빈도
+- 📝 요약: 기업이 원하는 인재상과 공부 방향
+
+출력은 한국어로, 구조화된 보고서 형태로 작성하십시오.
+"""
+
+MAP_PROMPT = """
+아래 채용 공고들의 자격요건·우대사항에 등장하는 기술·지식·자격증 키워드를 추출하십시오.
+빈도는 세지 마십시오 (공고에 적힌 표기 그대로 키워드만 나열하면 빈도는 따로 집계합니다).
+키워드는 다음 카테고리 중 하나로 분류합니다: {categories}
+
+JSON 객체 하나만 출력하십시오. 형식:
+{{
+  "keywords": {{"카테고리": ["키워드", ...]}},
+  "industries": {{"공고 번호": "산업군"}},
+  "highlights": [{{"company": "회사명", "title": "직무명", "differentiator": "차별화 요구역량 한 줄"}}]
+}}
+highlights 는 눈에 띄는 공고 최대 5개만 포함하십시오.
+
+---
+{postings}
+"""
+
+
 class JobAnalyzerChatbot:
     def __init__(self):
         self.ai_model = None
+        self.analytics = JobAnalytics()
         self.setup_gemini()
 
     def setup_gemini(self):
@@ -23,18 +95,38 @@ class JobAnalyzerChatbot:
             logger.warning("GEMINI_API_KEY가 없습니다. AI 기능이 비활성화됩니다.")
             self.ai_model = None
             return
-            
+
         try:
-            genai.configure(api_key=api_key)
-            self.ai_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.ai_model = gemini.create_model(api_key)
             logger.info("Gemini AI 초기화 완료")
         except Exception as e:
             logger.error(f"Gemini AI 초기화 실패: {e}")
             self.ai_model = None
 
-    async def analyze_job_postings(self, job_postings: List[Dict]) -> str:
+    @staticmethod
+    def summarize_job(number: int, job: Dict) -> str:
+        """프롬프트용 채용 공고 요약"""
+        return f"""
+--- 채용 공고 {number} ---
+회사명: {job.get('company_name', 'N/A')}
+직무명: {job.get('job_title', 'N/A')}
+채용구분: {job.get('experience', 'N/A')}
+근무지역: {job.get('work_location', 'N/A')}
+주요업무: {job.get('description', 'N/A')}
+자격요건: {job.get('requirements', 'N/A')}
+우대사항: {job.get('preferences', 'N/A')}
+"""
+
+    async def analyze_job_postings(self, job_postings: List[Dict], mode: str = 'auto') -> str:
         """
         채용 공고 데이터를 분석하여 구조화된 보고서 형태로 반환합니다.
+
+        키워드/기술스택/지역/경력 분포는 로컬에서 미리 집계해 프롬프트에 넣고,
+        모델은 서술만 작성합니다. mode 가 'auto' 이면 전체 공고 프롬프트가 예산
+        (ANALYSIS_CONTEXT_TOKENS) 안이면 한 번에, 넘으면 map-reduce 로 분석합니다.
+        'single' 은 항상 한 번에 호출하되 예산을 넘으면 대표 공고만 남기고, 'sample' 은 집계 표와
+        SAMPLE_CONTEXT_TOKENS 안의 대표 공고만, 'map_reduce' 는 청크별로 모델이 키워드만 추출하고
+        빈도는 로컬에서 센 뒤 종합합니다.
         """
         if not self.ai_model:
             logger.error("Gemini AI 모델이 초기화되지 않았습니다. 분석을 수행할 수 없습니다.")
@@ -43,61 +135,210 @@ class JobAnalyzerChatbot:
         if not job_postings:
             return "분석할 채용 공고 데이터가 없습니다."
 
+        tables_text = self.analytics.format_for_prompt(
+            self.analytics.summary_tables(job_postings), len(job_postings)
+        )
+
         # 채용 공고 데이터를 텍스트로 요약
-        summarized_jobs = []
-        for i, job in enumerate(job_postings):
-            summary = f"""
---- 채용 공고 {i+1} ---
-회사명: {job.get('company_name', 'N/A')}
-직무명: {job.get('job_title', 'N/A')}
-채용구분: {job.get('experience', 'N/A')}
-근무지역: {job.get('work_location', 'N/A')}
-주요업무: {job.get('description', 'N/A')}
-자격요건: {job.get('requirements', 'N/A')}
-우대사항: {job.get('preferences', 'N/A')}
-"""
-            summarized_jobs.append(summary)
+        summarized_jobs = [self.summarize_job(i + 1, job) for i, job in enumerate(job_postings)]
 
-        # 사용자 제공 프롬프트
-        prompt = f"""
-당신은 채용 공고 데이터 분석 전문가 입니다. 아래 단계에 따라 분석하십시오.
+        if mode == 'map_reduce':
+            logger.info(f"map-reduce 분석: {len(job_postings)}개 공고")
+            return await self._analyze_map_reduce(job_postings, summarized_jobs, tables_text)
 
-## 1. 기본 구조화
-- 회사명, 직무명, 채용구분(신입/주니어/무관), 근무지역 정리  
-- 주요업무 / 자격요건 / 우대사항을 명확히 구분  
+        if mode == 'sample':
+            summarized_jobs = self.sample_summaries(summarized_jobs, SAMPLE_CONTEXT_TOKENS)
 
-## 2. 역량 키워드 추출 및 분류
-자격요건·우대사항에서 등장하는 **기술·지식·자격증 키워드**를 빈도 분석 후 아래 카테고리별로 분류:  
-- 🔹 **보안 기초 지식**: 네트워크, 운영체제, 암호학, 취약점 분석  
-- 🔹 **디지털포렌식**: 로그 분석, 메모리 포렌식, 디스크 이미지 분석, 사고 대응(IR)  
-- 🔹 **프로그래밍/자동화**: Python, C/C++, Java, Bash, PowerShell, 로그 파서 개발  
-- 🔹 **클라우드/인프라 보안**: AWS, Azure, GCP, VMware, Kubernetes, 컨테이너 보안, 인프라 아키텍처 보안  
-- 🔹 **자격증/학위**: 정보보안기사, CISSP, CISA, CEH, 클라우드 보안 관련 자격증  
-- 🔹 **소프트 스킬**: 문제해결력, 커뮤니케이션, 분석적 사고  
+        prompt = self.build_prompt(tables_text, summarized_jobs, len(job_postings))
+        prompt_tokens = estimate_tokens(prompt)
+        if prompt_tokens > ANALYSIS_CONTEXT_TOKENS:
+            if mode == 'auto':
+                logger.info(f"프롬프트 약 {prompt_tokens} 토큰으로 예산 초과: map-reduce 분석 ({len(job_postings)}개 공고)")
+                return await self._analyze_map_reduce(job_postings, summarized_jobs, tables_text)
+            # 한 번 호출은 유지하되 예산 안에 들어가는 대표 공고만 남김
+            fixed_tokens = estimate_tokens(self.build_prompt(tables_text, [], len(job_postings)))
+            summarized_jobs = self.sample_summaries(summarized_jobs, max(ANALYSIS_CONTEXT_TOKENS - fixed_tokens, 0))
+            logger.warning(f"프롬프트 약 {prompt_tokens} 토큰으로 예산 초과: 대표 공고 {len(summarized_jobs)}개만 사용")
+            prompt = self.build_prompt(tables_text, summarized_jobs, len(job_postings))
 
-## 3. 기업 니즈 분석
-- 공통적으로 요구되는 최소 역량 (baseline)  
-- 차별화를 주는 고급 역량 (differentiator)  
-- 특히 **클라우드·인프라 보안** 역량에서 강조되는 부분 별도 정리  
-- 산업군(금융, IT 서비스, 제조, 게임 등)에 따른 차이  
+        logger.info(f"분석 프롬프트 약 {estimate_tokens(prompt)} 토큰")
+        return await self._generate_report(prompt)
 
-## 4. 학습/준비 로드맵 제안
-- 위 분석 기반으로 신입·주니어 취업 준비생이 갖춰야 할 **공부 우선순위** 제시  
-- 단계별 로드맵 (예: 1단계 네트워크·리눅스, 2단계 Python 로그 분석, 3단계 클라우드 보안·인프라 아키텍처, 4단계 자격증·CTF 실습)  
-- 각 역량별 실습 아이디어와 추천 리소스(CTF, 강의, 교재, 프로젝트 주제 등) 포함  
+    @staticmethod
+    def build_prompt(tables_text: str, summaries: List[str], total: int) -> str:
+        return f"""{ANALYSIS_INSTRUCTIONS}
+---
+**사전 집계 표:**
+{tables_text}
 
-## 5. 최종 산출물 형식
-- 📊 표: 회사별 요구사항 정리  
-- 📌 bullet: 핵심 키워드 및 빈도  
-- 📝 요약: 기업이 원하는 인재상과 공부 방향  
+**분석할 채용 공고 데이터 (전체 {total}개 중 {len(summaries)}개):**
+{chr(10).join(summaries)}
+"""
 
-출력은 한국어로, 구조화된 보고서 형태로 작성하십시오.
+    @staticmethod
+    def sample_summaries(summaries: List[str], budget: int) -> List[str]:
+        """토큰 예산 안에 들어가는 대표 공고만 고르게 선택"""
+        if not summaries:
+            return summaries
+        average = sum(estimate_tokens(summary) for summary in summaries) / len(summaries)
+        count = max(1, min(len(summaries), int(budget // max(average, 1))))
+        step = len(summaries) / count
+        return [summaries[int(i * step)] for i in range(count)]
+
+    def chunk_summaries(self, summaries: List[str]) -> List[List[str]]:
+        """토큰 예산에 맞춰 공고 요약을 청크로 분할"""
+        budget = ANALYSIS_CONTEXT_TOKENS - estimate_tokens(MAP_PROMPT)
+        chunks = []
+        current = []
+        current_tokens = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if current and current_tokens + tokens > budget:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(summary)
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _analyze_map_reduce(self, job_postings: List[Dict], summaries: List[str], tables_text: str) -> str:
+        """청크별 키워드 추출(map) → 로컬 빈도 집계·병합(reduce) → 최종 종합 호출"""
+        chunks = self.chunk_summaries(summaries)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_MAPS)
+
+        async def map_chunk(chunk: List[str], jobs: List[Dict], first_number: int):
+            async with semaphore:
+                extracted = await self._extract_chunk_stats(chunk)
+            return self.count_chunk_stats(extracted, jobs, first_number) if extracted is not None else None
 
+        tasks = []
+        start = 0
+        for chunk in chunks:
+            tasks.append(map_chunk(chunk, job_postings[start:start + len(chunk)], start + 1))
+            start += len(chunk)
+        results = await asyncio.gather(*tasks)
+        merged = self.merge_chunk_stats([result for result in results if result is not None])
+        failed = sum(1 for result in results if result is None)
+        if failed:
+            logger.warning(f"map 단계 실패 청크: {failed}/{len(chunks)}")
+
+        prompt = f"""{ANALYSIS_INSTRUCTIONS}
 ---
-**분석할 채용 공고 데이터:**
-{chr(10).join(summarized_jobs)}
+아래는 총 {len(summaries)}개 채용 공고를 {len(chunks)}개 묶음으로 나누어 미리 집계한 결과입니다.
+(집계 실패 묶음: {failed}개) 개별 공고를 다시 나열하지 말고, 집계 결과를 근거로 보고서를 작성하십시오.
+"회사별 요구사항 정리" 표는 대표 공고(highlights)로 작성하십시오.
+
+**사전 집계 표:**
+{tables_text}
+
+**카테고리별 키워드 빈도 (모델이 추출한 키워드의 등장 공고 수, 로컬 집계):**
+{json.dumps(merged['keywords'], ensure_ascii=False, indent=1)}
+
+**산업군 분포:**
+{json.dumps(merged['industries'], ensure_ascii=False)}
+
+**대표 공고:**
+{json.dumps(merged['highlights'], ensure_ascii=False, indent=1)}
 """
-        
+        return await self._generate_report(prompt)
+
+    async def _extract_chunk_stats(self, chunk: List[str]):
+        """한 청크의 카테고리별 키워드·공고별 산업군·대표 공고 추출 (실패 시 None)"""
+        prompt = MAP_PROMPT.format(
+            categories=', '.join(SKILL_CATEGORIES),
+            postings=chr(10).join(chunk)
+        )
+        try:
+            text = await self._generate(prompt, temperature=0.1, max_output_tokens=MAP_OUTPUT_TOKENS)
+            if text.startswith('```'):
+                text = '\n'.join(text.split('\n')[1:-1])
+            stats = json.loads(text)
+            return stats if isinstance(stats, dict) else None
+        except Exception as e:
+            logger.warning(f"청크 키워드 추출 실패: {e}")
+            return None
+
+    def count_chunk_stats(self, extracted: Dict, jobs: List[Dict], first_number: int) -> Dict:
+        """모델이 추출한 키워드를 청크 공고에서 직접 세어 merge_chunk_stats 형식으로 변환
+
+        키워드 빈도는 JobAnalytics 로, 산업군은 공고 번호별 분류를 세어 구하므로 최종 프롬프트의
+        사전 집계 표와 같은 기준(등장 공고 수)이 됩니다.
+        """
+        frame = self.analytics.build_frame(jobs)
+        keywords = {}
+        for category, names in (extracted.get('keywords') or {}).items():
+            if isinstance(names, dict):
+                names = list(names)
+            if not isinstance(names, list):
+                continue
+            counts = self.analytics.posting_counts(frame, [name for name in names if isinstance(name, str)])
+            keywords[category] = {name: count for name, count in counts.items() if count}
+
+        numbers = range(first_number, first_number + len(jobs))
+        industries = Counter()
+        for number, industry in (extracted.get('industries') or {}).items():
+            if str(number).strip().isdigit() and int(str(number).strip()) in numbers and isinstance(industry, str):
+                industries[industry.strip()] += 1
+
+        return {
+            'keywords': keywords,
+            'industries': dict(industries),
+            'highlights': extracted.get('highlights') or [],
+        }
+
+    @staticmethod
+    def merge_chunk_stats(results: List[Dict]) -> Dict:
+        """청크별 집계를 합산하고 상위 항목만 남김"""
+        keywords: Dict[str, Counter] = {}
+        industries = Counter()
+        highlights = []
+
+        for stats in results:
+            for category, counts in (stats.get('keywords') or {}).items():
+                if not isinstance(counts, dict):
+                    continue
+                counter = keywords.setdefault(category, Counter())
+                for keyword, count in counts.items():
+                    if isinstance(count, (int, float)):
+                        counter[keyword.strip()] += int(count)
+            for industry, count in (stats.get('industries') or {}).items():
+                if isinstance(count, (int, float)):
+                    industries[industry.strip()] += int(count)
+            highlights.extend(h for h in (stats.get('highlights') or []) if isinstance(h, dict))
+
+        return {
+            'keywords': {
+                category: dict(counter.most_common(TOP_KEYWORDS_PER_CATEGORY))
+                for category, counter in keywords.items()
+            },
+            'industries': dict(industries.most_common()),
+            'highlights': highlights[:TOP_HIGHLIGHTS],
+        }
+
+    async def _generate_report(self, prompt: str) -> str:
+        """최종 보고서 생성 (실패 시 오류 메시지 반환)"""
+        try:
+            analysis_text = await self._generate(
+                prompt, temperature=0.2, max_output_tokens=REPORT_OUTPUT_TOKENS
+            )
+            if analysis_text.startswith('```'):
+                analysis_text = analysis_text.split('\n')[1:-1]
+                analysis_text = '\n'.join(analysis_text)
+
+            logger.info("AI 채용 공고 분석 완료")
+            return analysis_text
+
+        except gemini.rate_limit_error() as e:
+            return f"API 호출 실패: {e}"
+
+        except Exception as e:
+            logger.error(f"채용 공고 분석 실패: {e}")
+            return f"채용 공고 분석 중 오류 발생: {e}"
+
+    async def _generate(self, prompt: str, temperature: float, max_output_tokens: int) -> str:
+        """Gemini 호출 (rate limit 시 지수 백오프 재시도)"""
         max_retries = 5
         base_delay = 5  # seconds
         for i in range(max_retries):
@@ -105,30 +346,18 @@ class JobAnalyzerChatbot:
                 response = await asyncio.to_thread(
                     self.ai_model.generate_content,
                     prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.2,
-                        max_output_tokens=2000 # Increased output tokens for detailed report
+                    generation_config=gemini.generation_config(
+                        temperature=temperature,
+                        max_output_tokens=max_output_tokens
                     )
                 )
-                
-                analysis_text = response.text.strip()
-                if analysis_text.startswith('```'):
-                    analysis_text = analysis_text.split('\n')[1:-1]
-                    analysis_text = '\n'.join(analysis_text)
-                
-                logger.info("AI 채용 공고 분석 완료")
-                return analysis_text
-
-            except google.api_core.exceptions.ResourceExhausted as e:
+                return response.text.strip()
+
+            except gemini.rate_limit_error() as e:
                 if i == max_retries - 1:
                     logger.error(f"API call failed after {max_retries} retries: {e}")
-                    return f"API 호출 실패: {e}"
-                
+                    raise
+
                 delay = base_delay * (2 ** i) + random.uniform(0, 1)
                 logger.warning(f"Rate limit exceeded. Retrying in {delay:.2f} seconds...")
                 await asyncio.sleep(delay)
-            
-            except Exception as e:
-                logger.error(f"채용 공고 분석 실패: {e}")
-                return f"채용 공고 분석 중 오류 발생: {e}"
-        return "알 수 없는 오류로 채용 공고 분석에 실패했습니다."
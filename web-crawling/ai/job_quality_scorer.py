@@ -0,0 +1,301 @@
+import json
+import asyncio
+import hashlib
+import random
+import weakref
+from typing import List, Dict, Optional, Iterable
+from ai import gemini
+from database.mongo_client import mongo_client
+from utils.logger import setup_logger
+
+logger = setup_logger("job_quality_scorer")
+
+# gemini-2.0-flash 기준 한도 (입력 컨텍스트는 여유를 두고 잡음)
+SCORE_CONTEXT_TOKENS = 32000
+SCORE_OUTPUT_TOKENS = 8192
+TOKENS_PER_SCORE = 8          # '"123": 85, ' 한 항목당 출력 토큰
+SCORE_OUTPUT_OVERHEAD = 32    # 중괄호, 코드블록 등
+MAX_CONCURRENT_BATCHES = 4
+MAX_SCORE_ATTEMPTS = 3
+MAX_RATE_LIMIT_RETRIES = 5
+AI_SCORE_THRESHOLD = 70
+
+# 프롬프트/평가 기준이 바뀌면 올려서 기존 캐시 점수를 무효화
+SCORE_PROMPT_VERSION = 2
+MEMORY_CACHE_SIZE = 50000
+
+SCORE_PROMPT_HEADER = """
+다음 채용공고들의 품질을 각각 0-100점으로 평가해주세요.
+
+평가 기준:
+- 정보의 구체성 (30점): 직무, 요구사항이 명확한가?
+- 회사 신뢰성 (25점): 회사명이 명확하고 신뢰할 만한가?
+- 급여 정보 (25점): 급여 정보가 투명한가?
+- 기술스택 적합성 (20점): 관련 기술스택이 명시되어 있는가?
+
+응답 형식: 공고 번호를 키로, 점수를 값으로 하는 JSON 객체만 출력
+예시: {"1": 85, "2": 72, "3": 90}
+
+채용공고 목록:
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한글은 글자당 1토큰에 가까우므로 보수적으로 2글자당 1토큰)"""
+    return len(text) // 2 + 1
+
+
+def job_prompt_fields(job: Dict) -> Dict:
+    """프롬프트에 들어가는 필드 추출 (크롤러 원본 키도 허용)"""
+    return {
+        'company': job.get('company_name') or job.get('company') or 'Unknown',
+        'title': job.get('job_title') or job.get('title') or '미명시',
+        'location': job.get('work_location') or job.get('location') or '미명시',
+        'salary': job.get('salary_range') or job.get('salary') or '미명시',
+        'keywords': job.get('keywords') or job.get('tags') or [],
+    }
+
+
+def summarize_job(number: int, job: Dict) -> str:
+    """프롬프트용 채용공고 요약"""
+    fields = job_prompt_fields(job)
+    return f"""
+{number}. 회사: {fields['company']}
+   직무: {fields['title']}
+   위치: {fields['location']}
+   급여: {fields['salary']}
+   키워드: {fields['keywords']}
+"""
+
+
+class JobQualityScorer:
+    """Gemini 기반 채용공고 품질 평가기
+
+    모델의 입력 컨텍스트와 출력 토큰 한도 안에서 최대한 많은 공고를 한 프롬프트에
+    담고, 여러 배치를 공유 쿼터(세마포어) 아래에서 동시에 평가합니다.
+    응답에서 누락되거나 잘못된 점수는 해당 공고만 다시 요청합니다.
+
+    점수는 프롬프트에 들어가는 필드와 프롬프트/모델 버전의 해시로 캐시되며,
+    job_postings 문서의 ai_score_hash/ai_quality_score 필드에 함께 저장됩니다.
+    """
+
+    # 같은 이벤트 루프의 모든 인스턴스가 공유하는 동시 요청 쿼터
+    _quotas = weakref.WeakKeyDictionary()
+
+    def __init__(self, ai_model, collection=None, max_concurrency: int = MAX_CONCURRENT_BATCHES):
+        self.ai_model = ai_model
+        self.collection = collection if collection is not None else mongo_client.get_collection('job_postings')
+        self.max_concurrency = max_concurrency
+        self.model_version = f"{getattr(ai_model, 'model_name', 'none')}:v{SCORE_PROMPT_VERSION}"
+        self._memory_cache: Dict[str, float] = {}
+
+    @classmethod
+    def _get_quota(cls, max_concurrency: int) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in cls._quotas:
+            cls._quotas[loop] = asyncio.Semaphore(max_concurrency)
+        return cls._quotas[loop]
+
+    def pack_batches(self, jobs: List[Dict], indices: List[int]) -> List[List[int]]:
+        """컨텍스트/출력 토큰 한도에 맞춰 공고 인덱스를 배치로 묶기"""
+        header_tokens = estimate_tokens(SCORE_PROMPT_HEADER)
+        max_per_batch = max(1, (SCORE_OUTPUT_TOKENS - SCORE_OUTPUT_OVERHEAD) // TOKENS_PER_SCORE)
+
+        batches = []
+        current = []
+        current_tokens = header_tokens
+        for idx in indices:
+            job_tokens = estimate_tokens(summarize_job(len(current) + 1, jobs[idx]))
+            if current and (
+                current_tokens + job_tokens > SCORE_CONTEXT_TOKENS
+                or len(current) >= max_per_batch
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = header_tokens
+            current.append(idx)
+            current_tokens += job_tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def content_hash(self, job: Dict) -> str:
+        """프롬프트 입력 필드 + 프롬프트/모델 버전 기반 콘텐츠 해시"""
+        payload = json.dumps(
+            [self.model_version, job_prompt_fields(job)],
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def lookup_cached_scores(self, hashes: Iterable[str]) -> Dict[str, float]:
+        """메모리 캐시 → MongoDB 순으로 기존 점수 조회"""
+        found = {h: self._memory_cache[h] for h in hashes if h in self._memory_cache}
+        missing = [h for h in hashes if h not in found]
+        if not missing or self.collection is None:
+            return found
+
+        try:
+            cursor = self.collection.find(
+                {'ai_score_hash': {'$in': missing}, 'ai_quality_score': {'$ne': None}},
+                {'_id': 0, 'ai_score_hash': 1, 'ai_quality_score': 1}
+            )
+            async for doc in cursor:
+                found[doc['ai_score_hash']] = float(doc['ai_quality_score'])
+                self._remember(doc['ai_score_hash'], float(doc['ai_quality_score']))
+        except Exception as e:
+            # 저장소 장애 시 이번 실행에서는 메모리 캐시만 사용
+            logger.warning(f"AI 점수 캐시 조회 실패, 저장소 캐시 비활성화: {e}")
+            self.collection = None
+
+        return found
+
+    def _remember(self, content_hash: str, score: float):
+        if len(self._memory_cache) >= MEMORY_CACHE_SIZE:
+            self._memory_cache.pop(next(iter(self._memory_cache)))
+        self._memory_cache[content_hash] = score
+
+    async def score_jobs(self, jobs: List[Dict]) -> List[Optional[float]]:
+        """공고별 점수 반환 (끝내 평가하지 못한 공고는 None)
+
+        평가된 공고에는 ai_quality_score와 ai_score_hash가 기록되어
+        공고와 함께 저장됩니다.
+        """
+        scores: List[Optional[float]] = [None] * len(jobs)
+        if not jobs:
+            return scores
+
+        hashes = [self.content_hash(job) for job in jobs]
+        cached = await self.lookup_cached_scores(set(hashes))
+
+        # 캐시에 없는 내용만, 같은 내용은 대표 공고 하나만 평가
+        uncached = {}
+        for idx, content_hash in enumerate(hashes):
+            if content_hash not in cached and content_hash not in uncached:
+                uncached[content_hash] = idx
+
+        logger.info(
+            f"AI 점수 캐시: {len(jobs) - len(uncached)}/{len(jobs)}개 적중, 신규 평가 {len(uncached)}개"
+        )
+        if uncached and self.ai_model:
+            fresh = await self._score_uncached([jobs[idx] for idx in uncached.values()])
+            for content_hash, score in zip(uncached, fresh):
+                if score is not None:
+                    cached[content_hash] = score
+                    self._remember(content_hash, score)
+
+        for idx, (job, content_hash) in enumerate(zip(jobs, hashes)):
+            score = cached.get(content_hash)
+            if score is not None:
+                scores[idx] = score
+                job['ai_quality_score'] = score
+                job['ai_score_hash'] = content_hash
+                job['ai_score_source'] = 'gemini'
+
+        return scores
+
+    async def _score_uncached(self, jobs: List[Dict]) -> List[Optional[float]]:
+        """Gemini로 점수 평가 (누락분 재요청 포함)"""
+        scores: List[Optional[float]] = [None] * len(jobs)
+
+        pending = list(range(len(jobs)))
+        for attempt in range(MAX_SCORE_ATTEMPTS):
+            if not pending:
+                break
+
+            batches = self.pack_batches(jobs, pending)
+            logger.info(
+                f"AI 품질 평가 {attempt + 1}회차: {len(pending)}개 공고, {len(batches)}개 배치"
+            )
+            results = await asyncio.gather(
+                *(self.evaluate_batch([jobs[idx] for idx in batch]) for batch in batches)
+            )
+
+            for batch, batch_scores in zip(batches, results):
+                for position, idx in enumerate(batch):
+                    if batch_scores[position] is not None:
+                        scores[idx] = batch_scores[position]
+
+            pending = [idx for idx in pending if scores[idx] is None]
+            if pending:
+                logger.warning(f"점수 누락 {len(pending)}개 공고 재평가 필요")
+
+        if pending:
+            logger.error(f"AI 품질 평가 최종 실패: {len(pending)}개 공고 미평가")
+        return scores
+
+    async def evaluate_batch(self, jobs: List[Dict]) -> List[Optional[float]]:
+        """단일 배치 평가 (공고 순서대로 점수, 누락/오류는 None)"""
+        prompt = SCORE_PROMPT_HEADER + ''.join(
+            summarize_job(i + 1, job) for i, job in enumerate(jobs)
+        )
+        max_output_tokens = min(
+            SCORE_OUTPUT_TOKENS, SCORE_OUTPUT_OVERHEAD + TOKENS_PER_SCORE * len(jobs)
+        )
+
+        base_delay = 5  # seconds
+        quota = self._get_quota(self.max_concurrency)
+        for i in range(MAX_RATE_LIMIT_RETRIES):
+            try:
+                async with quota:
+                    response = await asyncio.to_thread(
+                        self.ai_model.generate_content,
+                        prompt,
+                        generation_config=gemini.generation_config(
+                            temperature=0.1,
+                            max_output_tokens=max_output_tokens
+                        )
+                    )
+                return self.parse_scores(response.text, len(jobs))
+
+            except gemini.rate_limit_error() as e:
+                if i == MAX_RATE_LIMIT_RETRIES - 1:
+                    logger.error(f"API call failed after {MAX_RATE_LIMIT_RETRIES} retries: {e}")
+                    break
+
+                delay = base_delay * (2 ** i) + random.uniform(0, 1)
+                logger.warning(f"Rate limit exceeded. Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+
+            except Exception as e:
+                logger.warning(f"배치 평가 실패: {e}")
+                break
+
+        return [None] * len(jobs)
+
+    @staticmethod
+    def parse_scores(text: str, count: int) -> List[Optional[float]]:
+        """모델 응답을 공고 순서의 점수 리스트로 변환"""
+        scores: List[Optional[float]] = [None] * count
+
+        scores_text = text.strip()
+        if scores_text.startswith('```'):
+            scores_text = '\n'.join(scores_text.split('\n')[1:-1])
+
+        try:
+            parsed = json.loads(scores_text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"JSON 디코딩 실패: {e}, 원시 응답: {text[:200]}")
+            return scores
+
+        if isinstance(parsed, list):
+            # 배열 응답은 길이가 맞을 때만 순서를 신뢰할 수 있음
+            if len(parsed) != count:
+                logger.warning(f"점수 개수 불일치: {len(parsed)}/{count}")
+                return scores
+            parsed = {str(i + 1): score for i, score in enumerate(parsed)}
+
+        if not isinstance(parsed, dict):
+            logger.warning(f"예상하지 못한 응답 형식: {type(parsed).__name__}")
+            return scores
+
+        for key, score in parsed.items():
+            try:
+                position = int(key) - 1
+                value = float(score)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= position < count:
+                scores[position] = min(max(value, 0), 100)
+
+        return scores
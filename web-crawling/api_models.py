@@ -1,6 +1,17 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Dict, Any, Optional
 
 class CrawlRequest(BaseModel):
     sites: List[str]
     keywords: List[str]
+
+class CrawlJobStatus(BaseModel):
+    id: str
+    status: str
+    sites: List[str]
+    keywords: List[str]
+    counts: Dict[str, Any] = {}
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
@@ -18,11 +18,30 @@ class Settings:
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 30))
     HEADLESS_BROWSER = os.getenv('HEADLESS_BROWSER', 'true').lower() == 'true'
+    # 새 워크넷(work24) 폼 POST 크롤러 (실사이트 폼 검증 전까지 기본 대상에서 제외)
+    ENABLE_WORKNET_NEW = os.getenv('ENABLE_WORKNET_NEW', 'false').lower() == 'true'
+    # 브라우저 이미지/폰트/광고 요청 차단 (GLOBAL_CONFIG['resource_policy'])
+    BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+    HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', '.http_cache')  # requests 경로 디스크 캐시
+    # SPA 사이트에서 찾은 JSON API 템플릿 (만료되면 브라우저로 다시 탐색)
+    API_ENDPOINTS_PATH = os.getenv('API_ENDPOINTS_PATH', '.api_endpoints.json')
+    API_ENDPOINT_TTL_HOURS = float(os.getenv('API_ENDPOINT_TTL_HOURS', 24))
+    
+    # 페이지 소스 스냅샷 (디버깅/벤치마크용, 타임아웃은 항상 저장)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'snapshots')
+    SNAPSHOT_SAMPLE_RATE = float(os.getenv('SNAPSHOT_SAMPLE_RATE', 0.1))
+    SNAPSHOT_MAX_MB = int(os.getenv('SNAPSHOT_MAX_MB', 200))
+    SNAPSHOT_MAX_AGE_DAYS = float(os.getenv('SNAPSHOT_MAX_AGE_DAYS', 7))
     
     # 품질 관리
     MIN_QUALITY_SCORE = float(os.getenv('MIN_QUALITY_SCORE', 0.5))
     MAX_SIMILARITY_SCORE = float(os.getenv('MAX_SIMILARITY_SCORE', 0.8))
     
+    # AI 품질 평가 (로컬 점수로 확실한 공고는 바로 판정, 경계 구간만 Gemini로 - 오프라인이면 경계 구간도 통과)
+    AI_OFFLINE = os.getenv('AI_OFFLINE', 'false').lower() == 'true'
+    LOCAL_SCORE_REJECT = float(os.getenv('LOCAL_SCORE_REJECT', 40))
+    LOCAL_SCORE_ACCEPT = float(os.getenv('LOCAL_SCORE_ACCEPT', 85))
+    
     # User Agents
     USER_AGENTS = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
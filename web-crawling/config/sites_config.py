@@ -15,6 +15,22 @@ GLOBAL_CONFIG = {
         'job_posts': 3600,      # 1 hour
         'analysis': 21600,      # 6 hours
         'trends': 86400        # 24 hours
+    },
+    # 브라우저에서 받지 않을 리소스 (CDP Network.setBlockedURLs 패턴)
+    # 사이트별로 'resource_policy': {'allow': [...], 'deny': [...]} 로 조정
+    'resource_policy': {
+        'deny': [
+            # 이미지/미디어/폰트
+            '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp', '*.avif',
+            '*.mp4', '*.webm', '*.mp3', '*.m3u8',
+            '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+            # 광고/추적/위젯 (서드파티)
+            '*google-analytics.com*', '*googletagmanager.com*', '*googlesyndication.com*',
+            '*doubleclick.net*', '*googleadservices.com*', '*facebook.net*', '*connect.facebook.com*',
+            '*analytics.tiktok.com*', '*hotjar.com*', '*clarity.ms*', '*criteo.*', '*wcs.naver.net*',
+            '*kakao.com/js/*', '*channel.io*', '*amplitude.com*', '*mixpanel.com*', '*sentry.io*',
+            '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+        ],
     }
 }
 
@@ -25,6 +41,7 @@ VALIDATION_RULES = {
     'keyword_min_length': 2
 }
 
+# rate_limit: 사이트별 초당 요청 수 (utils.rate_limiter, 페이지·API 요청 시작 간격 = 1/rate 초)
 SITES_CONFIG = {
     'saramin': {
         'base_url': 'https://www.saramin.co.kr',
@@ -40,7 +57,8 @@ SITES_CONFIG = {
             'url': '.job_tit a'
         },
         'rate_limit': 3,
-        'max_pages': 10
+        'max_pages': 10,
+        'cache_ttl': 600
     },
     'worknet': {
         'base_url': 'https://www.work24.go.kr',
@@ -57,7 +75,8 @@ SITES_CONFIG = {
             'tags': 'td:nth-child(7)'
         },
         'rate_limit': 2,
-        'max_pages': 5
+        'max_pages': 5,
+        'cache_ttl': 1800
     },
     'worknet_new': {
         'base_url': 'https://www.work24.go.kr',
@@ -93,7 +112,7 @@ SITES_CONFIG = {
         'base_url': 'https://comento.kr',
         'search_path': '/career/recruit',
         'selectors': {
-            'job_list': 'div, article, li, section',
+            'job_list': 'a[href^="/career/recruit/"]',
             'title': 'h1, h2, h3, h4, a, span',
             'company': 'div, span, p, a',
             'location': 'div, span, p',
@@ -108,13 +127,14 @@ SITES_CONFIG = {
         'max_pages': 5,
         'priority': 2,
         'wait_time': 5,
-        'scroll_enabled': True
+        'scroll_enabled': True,
+        'cache_ttl': 1800
     },
     'securityfarm': {
         'base_url': 'https://securityfarm.co.kr',
         'search_path': '/job',
         'selectors': {
-            'job_list': 'div, article, li, section',
+            'job_list': 'div.shadow-card-sm',
             'title': 'h1, h2, h3, h4, a, span',
             'company': 'div, span, p, a',
             'location': 'div, span, p',
@@ -129,7 +149,8 @@ SITES_CONFIG = {
         'rate_limit': 2,
         'max_pages': 5,
         'wait_time': 10,
-        'scroll_enabled': True
+        'scroll_enabled': True,
+        'cache_ttl': 1800
     }
 }
 
@@ -0,0 +1,188 @@
+import asyncio
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+from crawler_runner import crawl_and_send, iter_crawl_events
+from utils.logger import setup_logger
+
+logger = setup_logger("crawl_job_manager")
+
+
+class CrawlQueueFullError(Exception):
+    """대기 중인 크롤링 작업이 한도를 넘었을 때"""
+
+
+@dataclass
+class CrawlJobState:
+    """API로 접수된 크롤링 작업 상태"""
+    id: str
+    sites: List[str]
+    keywords: List[str]
+    status: str = 'queued'  # queued → running → completed | failed | cancelled
+    counts: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+
+class CrawlJobManager:
+    """프로세스 내 크롤링 작업 실행기
+
+    각 작업은 제한된 스레드 풀에서 자체 이벤트 루프로 실행되므로, Selenium 의
+    블로킹 호출이 API 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = int(os.getenv('CRAWL_API_MAX_WORKERS', 2)),
+        max_pending: int = int(os.getenv('CRAWL_API_MAX_PENDING', 20)),
+        max_history: int = 200,
+        stream_start_timeout: float = float(os.getenv('CRAWL_API_STREAM_START_TIMEOUT', 30)),
+    ):
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self.stream_start_timeout = stream_start_timeout
+        self._unstarted_streams: Dict[str, threading.Timer] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawl-job')
+        self.jobs: "OrderedDict[str, CrawlJobState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pending_count(self) -> int:
+        return sum(1 for job in self.jobs.values() if job.status in ('queued', 'running'))
+
+    def _register(self, sites: List[str], keywords: List[str]) -> CrawlJobState:
+        with self._lock:
+            if self.pending_count() >= self.max_pending:
+                raise CrawlQueueFullError(f"대기 중인 크롤링 작업이 {self.max_pending}개를 넘었습니다.")
+
+            state = CrawlJobState(id=uuid.uuid4().hex, sites=list(sites), keywords=list(keywords))
+            self.jobs[state.id] = state
+            self._trim_history()
+
+        logger.info(f"크롤링 작업 등록: {state.id} ({sites}, {keywords})")
+        return state
+
+    def submit(self, sites: List[str], keywords: List[str]) -> CrawlJobState:
+        """작업 등록 후 즉시 반환"""
+        state = self._register(sites, keywords)
+        self.executor.submit(self._execute, state, crawl_and_send(state.sites, state.keywords, progress=state.counts))
+        return state
+
+    def register_stream(self, sites: List[str], keywords: List[str]) -> CrawlJobState:
+        """스트리밍 작업 등록 (한도 초과 시 CrawlQueueFullError)
+
+        응답 본문이 stream_start_timeout 안에 읽히지 않으면(연결이 먼저 끊긴 경우 등)
+        작업을 취소해 대기 한도 자리를 돌려줍니다.
+        """
+        state = self._register(sites, keywords)
+        timer = threading.Timer(self.stream_start_timeout, self._expire_stream, args=(state,))
+        timer.daemon = True
+        with self._lock:
+            self._unstarted_streams[state.id] = timer
+        timer.start()
+        return state
+
+    def _expire_stream(self, state: CrawlJobState):
+        with self._lock:
+            if self._unstarted_streams.pop(state.id, None) is None:
+                return
+            state.status = 'cancelled'
+            state.error = '스트림이 시작되지 않았습니다.'
+            state.finished_at = time.time()
+        logger.warning(f"스트리밍 작업 취소 (본문을 읽지 않음): {state.id}")
+
+    async def stream(self, state: CrawlJobState, queue_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """등록된 작업을 실행하며 이벤트를 생성 순서대로 전달
+
+        작업 스레드와 호출 측 이벤트 루프 사이에는 크기가 제한된 큐를 두어,
+        소비가 느리면 크롤링 쪽이 기다리고(backpressure) 연결이 끊기면 중단합니다.
+        """
+        with self._lock:
+            if state.id not in self._unstarted_streams:
+                # 시작 대기 시간이 지나 이미 취소된 작업
+                yield {'event': 'error', 'id': state.id, 'error': state.error}
+                return
+            self._unstarted_streams.pop(state.id).cancel()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        cancelled = threading.Event()
+
+        async def put(event):
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(queue.put(event), loop))
+
+        async def pump():
+            try:
+                async for event in iter_crawl_events(state.sites, state.keywords, progress=state.counts):
+                    if cancelled.is_set():
+                        break
+                    await put(event)
+            except Exception as e:
+                # 작업 스레드의 상태 갱신을 기다리지 않고 실패를 이벤트로 바로 전달
+                if not cancelled.is_set():
+                    await put({'event': 'error', 'id': state.id, 'error': str(e)})
+                raise
+            finally:
+                if not cancelled.is_set():
+                    await put(None)
+
+        self.executor.submit(self._execute, state, pump(), cancelled)
+
+        finished = False
+        try:
+            yield {'event': 'accepted', 'id': state.id}
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            finished = True
+        finally:
+            if not finished:
+                cancelled.set()
+            # 생산자가 꽉 찬 큐에서 기다리지 않도록 비워줌
+            while not queue.empty():
+                queue.get_nowait()
+
+    def get(self, job_id: str) -> Optional[CrawlJobState]:
+        return self.jobs.get(job_id)
+
+    def _trim_history(self):
+        """완료된 오래된 작업부터 기록 정리"""
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= self.max_history:
+                break
+            if self.jobs[job_id].status in ('completed', 'failed', 'cancelled'):
+                del self.jobs[job_id]
+
+    def _execute(self, state: CrawlJobState, coro, cancelled: Optional[threading.Event] = None):
+        state.status = 'running'
+        state.started_at = time.time()
+        try:
+            asyncio.run(coro)
+            if cancelled is not None and cancelled.is_set():
+                state.status = 'cancelled'
+                logger.info(f"크롤링 작업 취소 (스트림 연결 종료): {state.id} {state.counts}")
+            else:
+                state.status = 'completed'
+                logger.info(f"크롤링 작업 완료: {state.id} {state.counts}")
+        except Exception as e:
+            state.status = 'failed'
+            state.error = str(e)
+            logger.error(f"크롤링 작업 실패: {state.id} - {e}")
+        finally:
+            state.finished_at = time.time()
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            timers, self._unstarted_streams = list(self._unstarted_streams.values()), {}
+        for timer in timers:
+            timer.cancel()
+        self.executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,75 +1,128 @@
 import asyncio
-import itertools
-from typing import List, Dict, Any
-
-from crawlers.saramin_crawler import SaraminCrawler
-from crawlers.comento_crawler import ComentoCrawler
-from crawlers.worknet_crawler import WorknetCrawler
-from crawlers.securityfarm_crawler import SecurityfarmCrawler
-from processors.data_normalizer import DataNormalizer
+from contextlib import suppress
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+from crawlers.registry import create_crawler, enabled_sites
+from crawlers.manager.pipeline import CrawlPipeline
 from database.mongodb_connector import mongodb_connector
 from utils.logger import setup_logger
 
 logger = setup_logger("crawler_runner")
 
+# API 로 요청 가능한 사이트 (크롤러 모듈은 요청된 사이트만 임포트, worknet_new 는 ENABLE_WORKNET_NEW 일 때만)
+CRAWLER_SITES = tuple(enabled_sites())
 
-async def run_crawlers(sites: List[str], keywords: List[str]) -> List[Dict[str, Any]]:
-    """
-    Run crawlers for the given sites and keywords in parallel.
-    """
-    tasks = []
-    total_jobs = []
 
-    crawler_map = {
-        "saramin": SaraminCrawler,
-        "comento": ComentoCrawler,
-        "worknet": WorknetCrawler,
-        "securityfarm": SecurityfarmCrawler,
-    }
-
-    crawlers = {site: crawler_map[site]() for site in sites if site in crawler_map}
+async def iter_crawl_events(
+    sites: List[str],
+    keywords: List[str],
+    progress: Optional[Dict[str, Any]] = None,
+    queue_size: int = 100,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Crawl the given sites and keywords, yielding events as results arrive.
 
-    for keyword in keywords:
-        for site, crawler in crawlers.items():
-            tasks.append(crawler.crawl_with_keyword(keyword))
+    Jobs go through the same CrawlPipeline as crawl_and_send (keywords run one
+    after another per site, then validation, normalization and dedup), and each
+    posting is yielded as a 'job' event as soon as it leaves the pipeline. Every
+    finished site/keyword yields a 'progress' event and a final 'done' event
+    carries the totals. Memory is bounded by the pipeline and event queue sizes.
+    """
+    if progress is None:
+        progress = {}
+
+    crawlers = {site: create_crawler(site) for site in sites if site in CRAWLER_SITES}
+    events: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def emit(batch: List[Dict[str, Any]]) -> int:
+        for job in batch:
+            await events.put({'event': 'job', 'site': job.get('source_site'), 'data': job})
+        return len(batch)
+
+    async def task_done(site: str, keyword: str, crawled: int, error: Optional[str]):
+        await events.put({
+            'event': 'progress',
+            'site': site,
+            'keyword': keyword,
+            'crawled': crawled,
+            'error': error,
+            'tasks_done': progress.get('tasks_done', 0),
+            'tasks_total': progress.get('tasks_total', 0),
+        })
+
+    pipeline = CrawlPipeline(crawlers, emit, batch_size=1, progress=progress, on_task_done=task_done)
+
+    async def run():
+        # 취소되면(소비 중단) 끝 표시를 넣지 않음: 아무도 읽지 않는 꽉 찬 큐에서 기다리게 됨
+        error = None
+        try:
+            await pipeline.run(keywords)
+        except Exception as e:
+            error = e
+        await events.put(None)
+        if error:
+            raise error
+
+    runner = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+        # 파이프라인 예외는 호출 측으로 전달
+        await runner
+        yield {'event': 'done', **progress}
+    finally:
+        if not runner.done():
+            # 소비가 중단되면 파이프라인을 취소 (추출 단계가 드라이버를 닫음)
+            runner.cancel()
+            with suppress(asyncio.CancelledError):
+                await runner
+
+
+async def crawl_and_send(
+    sites: List[str],
+    keywords: List[str],
+    progress: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Crawl, normalize and push jobs to the server, returning the final counts.
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    Jobs flow through a CrawlPipeline one at a time, so memory stays bounded by
+    the queue sizes and the send batch rather than by the size of the crawl.
+    """
+    if progress is None:
+        progress = {}
 
-    for result in results:
-        if isinstance(result, list):
-            total_jobs.extend(result)
-        elif isinstance(result, Exception):
-            logger.error(f"Crawler failed with exception: {result}")
+    crawlers = {site: create_crawler(site) for site in sites if site in CRAWLER_SITES}
 
-    # Close the drivers after all crawling is done
-    for crawler in crawlers.values():
-        crawler.close_driver()
+    async def send(batch: List[Dict[str, Any]]) -> int:
+        response = await mongodb_connector.send_jobs_to_server(batch)
+        if not response:
+            return 0
+        summary = response.get('data', {})
+        progress['created'] = progress.get('created', 0) + summary.get('created', 0)
+        progress['updated'] = progress.get('updated', 0) + summary.get('updated', 0)
+        return len(batch) - summary.get('failed', 0)
 
-    logger.info(f"Total {len(total_jobs)} jobs crawled.")
-    return total_jobs
+    pipeline = CrawlPipeline(
+        crawlers,
+        send,
+        batch_size=mongodb_connector.chunk_size * mongodb_connector.max_concurrency,
+        progress=progress,
+    )
+    return await pipeline.run(keywords)
 
 
 async def main():
     """
     Main function to run the crawlers and send data to the server.
     """
-    sites_to_crawl = ["saramin", "comento", "worknet", "securityfarm"]
+    sites_to_crawl = list(CRAWLER_SITES)
     keywords_to_search = [""]
 
     logger.info(f"Starting crawl for sites: {sites_to_crawl} and keywords: {keywords_to_search}")
 
-    crawled_jobs = await run_crawlers(sites_to_crawl, keywords_to_search)
-
-    if crawled_jobs:
-        logger.info(f"{len(crawled_jobs)}개의 원본 데이터를 정규화합니다...")
-        normalizer = DataNormalizer()
-        normalized_jobs = [await normalizer.normalize(job) for job in crawled_jobs]
-        
-        logger.info("Sending normalized jobs to the server...")
-        await mongodb_connector.send_jobs_to_server(normalized_jobs)
-    else:
-        logger.info("No jobs were crawled.")
+    await crawl_and_send(sites_to_crawl, keywords_to_search)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
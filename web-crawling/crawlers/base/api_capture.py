@@ -0,0 +1,427 @@
+"""SPA 목록 페이지 뒤의 JSON API 를 찾아 직접 호출하기 위한 템플릿
+
+Comento / Securityfarm 처럼 목록을 XHR/fetch 로 받아 그리는 사이트는 DOM 을 긁는 대신
+그 JSON 응답을 바로 쓰면 브라우저 없이 페이지당 HTTP 요청 하나로 끝나고 필드도 구조화되어 옵니다.
+
+- discover: 브라우저로 검색 페이지를 한 번 열고 성능 로그(CDP Network 이벤트)에서 XHR/Fetch
+  JSON 응답을 모아, 제목 같은 키를 가진 dict 배열을 가장 많이 담은 응답을 고름
+- ApiEndpoint: 그 요청을 검색어({keyword})와 페이지 파라미터를 바꿔 끼울 수 있는 템플릿으로 보관
+  (메서드, 쿼리/본문, 인증 헤더와 쿠키, 목록 위치, 필드 매핑)
+- ApiEndpointStore: 사이트별 템플릿을 JSON 파일에 저장하고 ttl 이 지나면 다시 탐색하게 함
+
+템플릿으로 페이지를 넘기며 호출하는 부분은 SpecCrawler 가 담당하고, 브라우저는 템플릿이
+없거나 만료됐거나 인증이 거부(401/403)됐을 때만 다시 씁니다.
+"""
+import base64
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urljoin, urlsplit, urlunsplit
+
+from config.settings import settings
+from utils.logger import setup_logger
+from utils.serialization import DecodeError, dumps, loads
+
+logger = setup_logger("api_capture")
+
+RESOURCE_TYPES = ('XHR', 'Fetch')
+MIN_ITEMS = 2          # 목록으로 볼 최소 dict 개수
+MAX_DEPTH = 4          # JSON 안에서 목록을 찾을 최대 깊이
+
+PAGE_PARAMS = ('page', 'pageno', 'pageindex', 'pagenum', 'currentpage', 'offset', 'start', 'skip')
+OFFSET_PARAMS = ('offset', 'start', 'skip')
+
+# 인증/세션 유지에 필요한 요청 헤더만 재사용 (x-* 는 CSRF 토큰 등)
+FORWARD_HEADERS = ('authorization', 'accept', 'accept-language', 'content-type', 'referer', 'origin')
+
+# 공고 필드 → 후보 JSON 키 (소문자, 영숫자만; 앞쪽이 우선)
+FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    'title': ('title', 'jobtitle', 'recruittitle', 'recruitname', 'subject', 'positionname', 'position', 'name'),
+    'company': ('companyname', 'company', 'corpname', 'compname', 'employer', 'companytitle'),
+    'location': ('location', 'address', 'region', 'area', 'workplace', 'city'),
+    'experience': ('experience', 'career', 'careerlevel', 'careertype', 'exp'),
+    'salary': ('salary', 'pay', 'wage'),
+    'deadline': ('deadline', 'enddate', 'duedate', 'closedate', 'expiredate', 'endat', 'closingdate'),
+    'url': ('url', 'link', 'href', 'detailurl', 'applyurl'),
+    'tags': ('tags', 'skills', 'techstack', 'stacks', 'keywords'),
+}
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+def _normalize(key: str) -> str:
+    return _NON_ALNUM.sub('', key.lower())
+
+
+def _flatten(item: Dict[str, Any], prefix: str = '', depth: int = 2) -> Dict[str, Any]:
+    """중첩 dict → {'company.name': 값} (같은 깊이의 값이 중첩된 값보다 앞)"""
+    flat, nested = {}, {}
+    for key, value in item.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            if depth > 1:
+                nested.update(_flatten(value, f'{path}.', depth - 1))
+        else:
+            flat[path] = value
+    flat.update(nested)
+    return flat
+
+
+def get_path(item: Dict[str, Any], path: str) -> Any:
+    value: Any = item
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def guess_field_map(item: Dict[str, Any]) -> Dict[str, str]:
+    """JSON 항목 하나로 공고 필드 → 키 경로 매핑을 추정"""
+    flat = _flatten(item)
+    paths = [(path, _normalize(path), _normalize(path.rsplit('.', 1)[-1])) for path, value in flat.items()
+             if value not in (None, '', [])]
+    field_map, used = {}, set()
+    for name, candidates in FIELD_KEYS.items():
+        for candidate in candidates:
+            match = next((path for path, full, last in paths
+                          if path not in used and candidate in (full, last)), None)
+            if match:
+                field_map[name] = match
+                used.add(match)
+                break
+    return field_map
+
+
+def _listings(data: Any, path: Tuple[str, ...] = (), depth: int = 0):
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(data, list):
+        items = [item for item in data if isinstance(item, dict)]
+        if len(items) >= MIN_ITEMS:
+            yield path, items
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from _listings(value, (*path, key), depth + 1)
+
+
+def find_listing(data: Any) -> Optional[Dict[str, Any]]:
+    """JSON 응답에서 공고 목록으로 보이는 배열 → {'path', 'field_map', 'count', 'score'}
+
+    제목으로 쓸 키가 있는 dict 배열 중 항목 수 × 매핑된 필드 수가 가장 큰 것.
+    """
+    best = None
+    for path, items in _listings(data):
+        field_map = guess_field_map(items[0])
+        if 'title' not in field_map:
+            continue
+        score = len(items) * len(field_map)
+        if best is None or score > best['score']:
+            best = {'path': path, 'field_map': field_map, 'count': len(items), 'score': score}
+    return best
+
+
+def _template(value: Any, keyword: str) -> Any:
+    """검색어와 같은 값 또는 검색어가 낱말로 들어간 값만 '{keyword}' 로 (sort=CREATED 의 'C' 는 그대로)"""
+    if not keyword or not isinstance(value, str):
+        return value
+    if value == keyword:
+        return '{keyword}'
+    return re.sub(rf'(?<!\w){re.escape(keyword)}(?!\w)', '{keyword}', value)
+
+
+def _fill(value: Any, keyword: str) -> Any:
+    return value.replace('{keyword}', keyword) if isinstance(value, str) else value
+
+
+def _page_param(names: List[str]) -> Optional[str]:
+    by_normalized = {_normalize(name): name for name in names}
+    return next((by_normalized[name] for name in PAGE_PARAMS if name in by_normalized), None)
+
+
+@dataclass
+class ApiEndpoint:
+    """목록 JSON API 요청 템플릿
+
+    params / body 의 '{keyword}' 는 검색어로 바뀌고, page_param 이 있으면 n번째(0부터) 페이지에
+    page_start + n × page_step 을 넣습니다 (offset 방식은 page_step 이 한 페이지 항목 수).
+    """
+    url: str
+    method: str = 'GET'
+    params: Dict[str, Any] = field(default_factory=dict)
+    body: Optional[Dict[str, Any]] = None
+    body_type: str = 'json'            # 'json' | 'form'
+    headers: Dict[str, str] = field(default_factory=dict)
+    page_param: Optional[str] = None
+    page_in_body: bool = False
+    page_start: int = 1
+    page_step: int = 1
+    items_path: Tuple[str, ...] = ()
+    field_map: Dict[str, str] = field(default_factory=dict)
+
+    def request(self, keyword: str, page_index: int = 0) -> Dict[str, Any]:
+        """aiohttp session.request(**kwargs) 인자"""
+        params = {name: _fill(value, keyword) for name, value in self.params.items()}
+        body = {name: _fill(value, keyword) for name, value in self.body.items()} if self.body is not None else None
+        if self.page_param:
+            page = self.page_start + page_index * self.page_step
+            (body if self.page_in_body and body is not None else params)[self.page_param] = page
+        kwargs: Dict[str, Any] = {'method': self.method, 'url': self.url, 'params': params}
+        if body is not None:
+            kwargs['json' if self.body_type == 'json' else 'data'] = body
+        return kwargs
+
+    def items(self, data: Any) -> List[Dict[str, Any]]:
+        for key in self.items_path:
+            if not isinstance(data, dict):
+                return []
+            data = data.get(key)
+        return [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+
+    def to_job(self, item: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        """JSON 항목 → 엔진 추출 결과와 같은 모양의 공고 dict"""
+        job: Dict[str, Any] = {}
+        for name in FIELD_KEYS:
+            value = get_path(item, self.field_map[name]) if name in self.field_map else None
+            if name == 'tags':
+                if isinstance(value, str):
+                    value = [part.strip() for part in value.split(',')]
+                elif isinstance(value, list):
+                    value = [str(part.get('name', '')) if isinstance(part, dict) else str(part) for part in value]
+                else:
+                    value = []
+                job[name] = [part for part in value if part]
+            elif name == 'url':
+                job[name] = urljoin(base_url, str(value)) if value else ''
+            else:
+                job[name] = '' if value is None else str(value).strip()
+        return job
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ApiEndpoint':
+        data = dict(data)
+        data['items_path'] = tuple(data.get('items_path', ()))
+        return cls(**data)
+
+
+def build_endpoint(
+    request: Dict[str, Any],
+    listing: Dict[str, Any],
+    keyword: str,
+    default_page_param: Optional[str] = None,
+    cookies: str = '',
+    user_agent: str = '',
+) -> ApiEndpoint:
+    """CDP 요청(Network.Request) + find_listing 결과 → 템플릿"""
+    parts = urlsplit(request['url'])
+    params = {name: _template(value, keyword) for name, value in parse_qsl(parts.query, keep_blank_values=True)}
+
+    body, body_type = None, 'json'
+    post_data = request.get('postData')
+    if post_data:
+        try:
+            body = loads(post_data)
+        except DecodeError:
+            body, body_type = dict(parse_qsl(post_data, keep_blank_values=True)), 'form'
+        if not isinstance(body, dict):
+            body = None
+        else:
+            body = {name: _template(value, keyword) for name, value in body.items()}
+
+    headers = {name: value for name, value in request.get('headers', {}).items()
+               if name.lower() in FORWARD_HEADERS or name.lower().startswith('x-')}
+    if cookies:
+        headers['Cookie'] = cookies
+    if user_agent:
+        # 토큰이 User-Agent 에 묶인 사이트가 있어 브라우저와 같은 값을 씀
+        headers['User-Agent'] = user_agent
+
+    endpoint = ApiEndpoint(
+        url=urlunsplit((parts.scheme, parts.netloc, parts.path, '', '')),
+        method=request.get('method', 'GET').upper(),
+        params=params,
+        body=body,
+        body_type=body_type,
+        headers=headers,
+        items_path=tuple(listing['path']),
+        field_map=listing['field_map'],
+    )
+
+    page_param = _page_param(list(params))
+    in_body = False
+    if page_param is None and body is not None:
+        page_param, in_body = _page_param(list(body)), True
+    if page_param is not None:
+        source = body if in_body else params
+        value = source.pop(page_param)
+        endpoint.page_param, endpoint.page_in_body = page_param, in_body
+        try:
+            endpoint.page_start = int(value)
+        except (TypeError, ValueError):
+            endpoint.page_start = 0 if _normalize(page_param) in OFFSET_PARAMS else 1
+        if _normalize(page_param) in OFFSET_PARAMS:
+            endpoint.page_step = listing['count']
+    elif default_page_param:
+        # 첫 요청에 페이지 파라미터가 없으면 HTML 페이지와 같은 이름으로 가정
+        endpoint.page_param = default_page_param
+    return endpoint
+
+
+def _response_body(driver, request_id: str) -> Optional[Any]:
+    try:
+        result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+    except Exception as e:
+        logger.debug(f"응답 본문 읽기 실패 ({request_id}): {e}")
+        return None
+    body = result.get('body', '')
+    if result.get('base64Encoded'):
+        body = base64.b64decode(body).decode('utf-8', errors='replace')
+    try:
+        return loads(body)
+    except DecodeError:
+        return None
+
+
+def discover(
+    driver,
+    page_url: str,
+    keyword: str,
+    default_page_param: Optional[str] = None,
+    timeout: float = 15,
+) -> Optional[ApiEndpoint]:
+    """브라우저로 page_url 을 열어 목록 JSON 을 돌려준 XHR/Fetch 요청을 템플릿으로 (없으면 None)
+
+    드라이버는 성능 로그가 켜진 상태여야 합니다 (browser_profile.chrome_options(network_log=True)).
+    """
+    # selenium 을 쓰는 waits 는 탐색할 때만 (main_api 는 템플릿 현황만 읽음)
+    from crawlers.base.waits import NetworkMonitor
+
+    sent: Dict[str, Dict[str, Any]] = {}
+    responses: List[str] = []
+
+    def collect(message: Dict[str, Any]):
+        params = message.get('params', {})
+        if message['method'] == 'Network.requestWillBeSent':
+            sent[params['requestId']] = params.get('request', {})
+        elif (message['method'] == 'Network.responseReceived'
+              and params.get('type') in RESOURCE_TYPES
+              and 'json' in params.get('response', {}).get('mimeType', '')):
+            responses.append(params['requestId'])
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    monitor = NetworkMonitor(driver)
+    monitor.poll()  # 이전 페이지의 이벤트는 버림
+    monitor.listeners.append(collect)
+    driver.get(page_url)
+    monitor.wait_idle(timeout=timeout)
+
+    best = None
+    for request_id in responses:
+        if request_id not in sent:
+            continue
+        data = _response_body(driver, request_id)
+        listing = find_listing(data) if data is not None else None
+        if listing and (best is None or listing['score'] > best[1]['score']):
+            best = (sent[request_id], listing)
+    if best is None:
+        logger.info(f"목록 JSON API 를 찾지 못함 ({len(responses)}개 JSON 응답): {page_url}")
+        return None
+
+    request, listing = best
+    cookies = '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in driver.get_cookies())
+    user_agent = driver.execute_script('return navigator.userAgent;') or ''
+    endpoint = build_endpoint(request, listing, keyword, default_page_param, cookies, user_agent)
+    logger.info(f"목록 JSON API 발견: {endpoint.method} {endpoint.url} "
+                f"(항목 {listing['count']}개, 필드 {sorted(listing['field_map'])}, 페이지 {endpoint.page_param})")
+    return endpoint
+
+
+class ApiEndpointStore:
+    """사이트별 API 템플릿 저장소 (JSON 파일)
+
+    찾지 못한 사이트도 기록해 ttl 동안은 다시 탐색하지 않습니다. 항목은 탐색한 base_url 과
+    함께 저장되어 모의 서버 등 다른 호스트로 바꾸면 쓰이지 않습니다. 쿠키/인증 헤더가
+    들어가므로 파일은 소유자만 읽을 수 있게 씁니다.
+    """
+
+    def __init__(self, path: str = settings.API_ENDPOINTS_PATH, ttl_hours: float = settings.API_ENDPOINT_TTL_HOURS):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, 'rb') as f:
+                    self._entries = loads(f.read())
+            except (OSError, DecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        tmp = f'{self.path}.tmp'
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(dumps(self._entries))
+        os.replace(tmp, self.path)
+
+    def _entry(self, site: str, base_url: str) -> Optional[Dict[str, Any]]:
+        entry = self._load().get(site)
+        if entry is None or entry.get('base_url') != base_url:
+            return None
+        if time.time() - entry['discovered_at'] >= self.ttl:
+            return None
+        return entry
+
+    def get(self, site: str, base_url: str) -> Optional[ApiEndpoint]:
+        entry = self._entry(site, base_url)
+        if entry is None or 'endpoint' not in entry:
+            return None
+        return ApiEndpoint.from_dict(entry['endpoint'])
+
+    def known_missing(self, site: str, base_url: str) -> bool:
+        """최근 탐색에서 목록 API 가 없던 사이트인지"""
+        entry = self._entry(site, base_url)
+        return entry is not None and 'endpoint' not in entry
+
+    def put(self, site: str, base_url: str, endpoint: Optional[ApiEndpoint]):
+        """템플릿 저장 (None 이면 '없음' 으로 기록)"""
+        entry: Dict[str, Any] = {'base_url': base_url, 'discovered_at': time.time()}
+        if endpoint is not None:
+            entry['endpoint'] = endpoint.to_dict()
+        with self._lock:
+            self._load()[site] = entry
+            self._save()
+
+    def forget(self, site: str):
+        with self._lock:
+            if self._load().pop(site, None) is not None:
+                self._save()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """사이트별 템플릿 요약 (쿠키/헤더 값은 제외)"""
+        result = {}
+        for site, entry in self._load().items():
+            endpoint = entry.get('endpoint')
+            result[site] = {
+                'base_url': entry['base_url'],
+                'found': endpoint is not None,
+                'age_sec': round(time.time() - entry['discovered_at']),
+            }
+            if endpoint is not None:
+                result[site].update({
+                    'method': endpoint['method'],
+                    'url': endpoint['url'],
+                    'page_param': endpoint['page_param'],
+                    'fields': sorted(endpoint['field_map']),
+                })
+        return result
+
+
+api_endpoints = ApiEndpointStore()
@@ -0,0 +1,94 @@
+"""리소스를 덜 받는 Chrome 프로필과 CDP 요청 차단
+
+목록 페이지에서 필요한 것은 DOM 뿐이므로 이미지·미디어·폰트와 광고/추적 도메인은
+받지 않습니다. 차단은 Chrome DevTools Protocol 의 Network.setBlockedURLs 로 하고,
+패턴은 GLOBAL_CONFIG['resource_policy'] 기본값에 사이트별 resource_policy 의
+deny 를 더하고 allow 와 겹치는 기본 패턴을 뺀 목록입니다. 이미지가 필요한 사이트는
+allow 에 이미지 패턴(예: '*.png')을 넣으면 콘텐츠 설정의 이미지 차단도 꺼집니다.
+"""
+import fnmatch
+import random
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from config.settings import settings
+from config.sites_config import GLOBAL_CONFIG
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+
+IMAGE_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp', '*.avif')
+
+LEAN_ARGUMENTS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--disable-extensions',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--mute-audio',
+    '--no-first-run',
+)
+
+
+def blocked_url_patterns(site_config: Dict[str, Any]) -> List[str]:
+    """사이트에 적용할 차단 URL 패턴 (기본 deny + 사이트 deny - 사이트 allow)"""
+    defaults = GLOBAL_CONFIG['resource_policy']
+    policy = site_config.get('resource_policy', {})
+    allow = policy.get('allow', [])
+    patterns = []
+    for pattern in [*defaults['deny'], *policy.get('deny', [])]:
+        if pattern in patterns:
+            continue
+        if any(pattern == allowed or fnmatch.fnmatch(pattern, allowed) for allowed in allow):
+            continue
+        patterns.append(pattern)
+    return patterns
+
+
+def images_blocked(site_config: Dict[str, Any]) -> bool:
+    """이미지 패턴을 하나라도 허용한 사이트는 콘텐츠 설정 차단을 하지 않음"""
+    patterns = blocked_url_patterns(site_config)
+    return all(pattern in patterns for pattern in IMAGE_PATTERNS)
+
+
+def chrome_options(site_config: Dict[str, Any], network_log: bool = False) -> 'Options':
+    """사이트용 Chrome 옵션 (헤드리스, 불필요한 백그라운드 기능 끔)
+
+    network_log 이면 성능 로그(CDP Network 이벤트)를 켭니다. 모든 요청 이벤트가 쌓이므로
+    API 탐색(waits.NetworkMonitor) 세션에서만 켭니다.
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument(f'--user-agent={random.choice(settings.USER_AGENTS)}')
+    if settings.HEADLESS_BROWSER:
+        options.add_argument('--headless=new')
+    for argument in LEAN_ARGUMENTS:
+        options.add_argument(argument)
+
+    if settings.BLOCK_RESOURCES and images_blocked(site_config):
+        # CDP 차단 전에 시작되는 요청과 CSS 배경 이미지까지 막도록 콘텐츠 설정으로도 차단
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.add_argument('--blink-settings=imagesEnabled=false')
+
+    # DOMContentLoaded 까지만 기다리고 목록은 선택자/DOM 안정 대기로 판단
+    options.page_load_strategy = 'eager'
+    if network_log:
+        # 네트워크 유휴 대기(waits.NetworkMonitor)용 CDP Network 이벤트
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def apply_network_policy(driver, site_config: Dict[str, Any]) -> List[str]:
+    """드라이버에 CDP 요청 차단 적용 (적용한 패턴 목록 반환)"""
+    if not settings.BLOCK_RESOURCES:
+        return []
+    patterns = blocked_url_patterns(site_config)
+    if patterns:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    return patterns
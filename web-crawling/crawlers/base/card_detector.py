@@ -0,0 +1,164 @@
+"""파싱된 DOM 에서 공고 카드 목록을 구조적으로 찾기
+
+'div, article, li, section' 같은 포괄 선택자는 중첩된 모든 컨테이너를 돌려주어
+부모/자식 카드가 중복 추출됩니다. 대신 같은 부모 아래 같은 태그·클래스로 반복되는
+형제 서브트리 중 텍스트와 링크가 충분한 묶음을 카드 목록으로 보고, 그 묶음을 가리키는
+CSS 선택자(부모 > 자식)를 사이트별로 캐시합니다. 부모 시그니처만으로 다른 요소까지
+매치되면(클래스 없는 'div > div' 등) 조상의 id 나 :nth-child 경로로 부모를 고정합니다.
+
+캐시한 선택자의 카드 수가 탐지 당시의 절반 아래로 떨어지면 다시 탐지하지만, 검색 결과가
+없는 페이지에서는 푸터 같은 다른 반복 묶음이 잡히므로, 새 묶음은 유효 공고를 하나 이상
+내면서 캐시한 묶음보다 점수가 높거나 유효 공고를 더 많이 낼 때만 캐시를 교체합니다.
+"""
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from lxml.cssselect import CSSSelector
+
+MIN_REPEATS = 3        # 카드 목록으로 볼 최소 반복 횟수
+MIN_CARD_TEXT = 10     # 카드 하나의 최소 텍스트 길이
+REDETECT_RATIO = 0.5   # 탐지 당시 카드 수 대비 이 비율 아래면 다시 탐지
+
+SKIP_TAGS = {'head', 'script', 'style', 'noscript', 'template', 'svg', 'nav', 'header', 'footer', 'select'}
+_CSS_SPECIAL = re.compile(r'([^a-zA-Z0-9_-])')
+
+
+def css_escape(identifier: str) -> str:
+    """클래스 이름을 CSS 식별자로 (Tailwind 의 sm:text-lg 등)"""
+    escaped = _CSS_SPECIAL.sub(r'\\\1', identifier)
+    return f'\\3{escaped[0]} {escaped[1:]}' if escaped[:1].isdigit() else escaped
+
+
+def signature(element) -> str:
+    """태그 + 정렬된 클래스 (형제 비교와 선택자 생성에 공용)"""
+    classes = sorted(set((element.get('class') or '').split()))
+    return element.tag + ''.join(f'.{css_escape(name)}' for name in classes)
+
+
+def _position(element) -> str:
+    """형제 중 위치로 고정한 경로 조각 (id 가 있으면 id, 문서에 하나뿐인 html/body 는 태그)"""
+    if element.get('id'):
+        return f'#{css_escape(element.get("id"))}'
+    if element.tag in ('html', 'body'):
+        return element.tag
+    index = 1 + sum(1 for sibling in element.itersiblings(preceding=True) if isinstance(sibling.tag, str))
+    return f'{signature(element)}:nth-child({index})'
+
+
+def card_selector(root, parent, child_signature: str, children) -> str:
+    """children 만 정확히 가리키는 '부모 > 자식' 선택자
+
+    부모 시그니처로 충분하면 그대로 쓰고, 아니면 id 가 있는 조상 또는 문서 루트까지
+    :nth-child 경로를 붙입니다.
+    """
+    expected = set(children)
+    selector = f'{signature(parent)} > {child_signature}'
+    if set(CSSSelector(selector)(root)) == expected:
+        return selector
+    path = []
+    element = parent
+    while element is not None and isinstance(element.tag, str):
+        path.insert(0, _position(element))
+        selector = f"{' > '.join(path)} > {child_signature}"
+        if path[0].startswith('#') or set(CSSSelector(selector)(root)) == expected:
+            break
+        element = element.getparent()
+    return selector
+
+
+def _text_length(element) -> int:
+    return sum(len(part.strip()) for part in element.itertext())
+
+
+def _has_link(element) -> bool:
+    return element.tag == 'a' or next(element.iterdescendants('a'), None) is not None
+
+
+def _candidate_groups(root):
+    """(부모, 형제 시그니처, 형제 요소들) — MIN_REPEATS 번 이상 반복되는 묶음만"""
+    for parent in root.iter():
+        if not isinstance(parent.tag, str) or parent.tag in SKIP_TAGS:
+            continue
+        groups = defaultdict(list)
+        for child in parent:
+            if isinstance(child.tag, str) and child.tag not in SKIP_TAGS:
+                groups[signature(child)].append(child)
+        for child_signature, children in groups.items():
+            if len(children) >= MIN_REPEATS:
+                yield parent, child_signature, children
+
+
+def _score(children) -> float:
+    """텍스트가 있는 형제 수 × 평균 텍스트 길이(상한) × 링크 비율 가중치"""
+    lengths = [_text_length(child) for child in children]
+    rich = [length for length in lengths if length >= MIN_CARD_TEXT]
+    if len(rich) < MIN_REPEATS:
+        return 0.0
+    links = sum(1 for child in children if _has_link(child)) / len(children)
+    return len(rich) * min(sum(rich) / len(rich), 200) * (1 + links)
+
+
+def detect(root) -> Optional[Dict[str, Any]]:
+    """반복되는 카드 묶음 탐지 → {'selector', 'cards', 'score'} (없으면 None)"""
+    best = None
+    for parent, child_signature, children in _candidate_groups(root):
+        score = _score(children)
+        if score and (best is None or score > best[0]):
+            best = (score, parent, child_signature, children)
+    if best is None:
+        return None
+    score, parent, child_signature, children = best
+    return {
+        'selector': card_selector(root, parent, child_signature, children),
+        'cards': len(children),
+        'score': score,
+    }
+
+
+class CardDetector:
+    """사이트별 탐지 결과 캐시"""
+
+    def __init__(self):
+        self._detected: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, site: str) -> Optional[Dict[str, Any]]:
+        return self._detected.get(site)
+
+    def needs_redetect(self, site: str, found: int) -> bool:
+        """캐시한 선택자로 찾은 카드 수가 탐지 당시보다 크게 줄었는지"""
+        entry = self._detected.get(site)
+        return entry is None or found < entry['cards'] * REDETECT_RATIO
+
+    def detect(self, site: str, root, postings: Callable[[str], int]) -> Optional[Dict[str, Any]]:
+        """다시 탐지해 더 나은 묶음이면 캐시 교체 (교체했으면 결과, 아니면 None)
+
+        postings(selector) 는 이 페이지에서 그 선택자로 얻는 유효 공고 수입니다. 같은
+        선택자가 다시 잡히면 카드 수만 갱신합니다.
+        """
+        result = detect(root)
+        if result is None:
+            return None
+        new_postings = postings(result['selector'])
+        if not new_postings:
+            return None
+        with self._lock:
+            previous = self._detected.get(site)
+            if previous is not None and previous['selector'] != result['selector']:
+                if result['score'] <= previous['score'] and new_postings <= postings(previous['selector']):
+                    return None
+            result['detections'] = (previous or {}).get('detections', 0) + 1
+            self._detected[site] = result
+        return result
+
+    def forget(self, site: str):
+        with self._lock:
+            self._detected.pop(site, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {site: dict(entry) for site, entry in self._detected.items()}
+
+
+card_detector = CardDetector()
@@ -0,0 +1,198 @@
+"""SiteSpec 을 한 번 컴파일해 재사용하는 정적 추출 엔진
+
+페이지 HTML 을 lxml 로 한 번만 파싱하고, 미리 컴파일한 CSSSelector 로 카드와
+필드를 뽑습니다. 브라우저 왕복(find_element 호출마다 WebDriver 요청)이 없으므로
+모든 사이트가 같은 빠른 경로를 씁니다. 검증을 통과한 값을 한 번도 내지 못한 대체
+선택자는 사이트별 통계(crawlers.base.selector_plan)에 따라 뒤로 미뤄집니다.
+"""
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from crawlers.base.card_detector import card_detector
+from crawlers.base.selector_plan import SelectorPlan, selector_stats
+from crawlers.base.spec import FieldSpec, SiteSpec
+
+_WHITESPACE = re.compile(r'\s+')
+_detected_selectors: Dict[str, CSSSelector] = {}
+
+
+def _css(css: str) -> CSSSelector:
+    """탐지된 카드 선택자 컴파일 (선택자 문자열별 캐시)"""
+    selector = _detected_selectors.get(css)
+    if selector is None:
+        selector = _detected_selectors[css] = CSSSelector(css)
+    return selector
+
+
+def element_text(element) -> str:
+    """Selenium .text 와 비슷하게 공백을 정리한 텍스트"""
+    return _WHITESPACE.sub(' ', element.text_content()).strip()
+
+
+def card_text(element) -> str:
+    """카드 텍스트 (줄 단위, 빈 줄 제외)"""
+    return '\n'.join(part.strip() for part in element.itertext() if part.strip())
+
+
+class CompiledField:
+    """FieldSpec 의 선택자를 미리 컴파일한 추출기 (선택자가 없으면 카드 자체에서 읽음)"""
+
+    def __init__(self, name: str, spec: FieldSpec, plan: SelectorPlan):
+        self.name = name
+        self.spec = spec
+        self.plan = plan
+        self.selectors: List[Tuple[str, CSSSelector]] = [
+            (css, CSSSelector(css)) for css in spec.selectors
+        ]
+
+    def _value(self, element, base_url: str) -> str:
+        if self.spec.attr == 'text':
+            return element_text(element)
+        value = (element.get(self.spec.attr) or '').strip()
+        if value and self.spec.attr in ('href', 'src') and base_url:
+            return urljoin(base_url, value)
+        return value
+
+    def _try(self, selector, card, base_url: str, card_length: int):
+        """(매치 여부, 검증을 통과한 값 또는 None)
+
+        텍스트 필드 값이 min_length 보다 짧거나, 여러 텍스트 블록을 품은 요소에서 읽은 카드 텍스트
+        전체(카드 자체나 카드를 감싼 요소에 걸린 포괄 선택자)이면 검증 실패로 봅니다.
+        """
+        spec = self.spec
+        matches = selector(card)
+        if spec.many:
+            values = [
+                value for value, match in ((self._value(m, base_url), m) for m in matches)
+                if value and not self._whole_card(match, value, card_length)
+            ]
+            return bool(matches), values or None
+        if len(matches) <= spec.index:
+            return bool(matches), None
+        match = matches[spec.index]
+        value = self._value(match, base_url)
+        if len(value) < spec.min_length or self._whole_card(match, value, card_length):
+            return True, None
+        return True, value
+
+    def _whole_card(self, element, value: str, card_length: int) -> bool:
+        if self.spec.attr != 'text' or len(value) < card_length:
+            return False
+        # 제목만 있는 카드의 <strong> 처럼 텍스트 블록이 하나면 정상 값
+        return sum(1 for child in element.iterdescendants() if (child.text or '').strip()) >= 2
+
+    def first_value(self, card, base_url: str = '') -> Any:
+        """통계를 남기지 않고 명세 순서대로 찾은 값 (탐지한 카드 묶음 비교용)"""
+        card_length = len(element_text(card))
+        for _, selector in self.selectors:
+            _, value = self._try(selector, card, base_url, card_length)
+            if value is not None:
+                return value
+        return None
+
+    def default(self) -> Any:
+        return list(self.spec.default) if self.spec.many else self.spec.default
+
+    def extract(self, card, base_url: str, card_length: int) -> Any:
+        if not self.selectors:
+            value = self._value(card, base_url) if self.spec.attr != 'text' else ''
+            return value or self.default()
+        for index in self.plan.order():
+            matched, value = self._try(self.selectors[index][1], card, base_url, card_length)
+            self.plan.record(index, matched, value is not None)
+            if value is not None:
+                return value
+        self.plan.record_miss()
+        # 속성 필드는 카드 요소 자체 (예: 카드 전체가 <a> 인 경우의 href)
+        if self.spec.attr != 'text':
+            return self._value(card, base_url) or self.default()
+        return self.default()
+
+
+class CompiledSpec:
+    """카드 선택자 + 필드 추출기 묶음"""
+
+    CARDS = '_cards'
+
+    def __init__(self, spec: SiteSpec):
+        self.spec = spec
+        card_selectors = tuple(css for css in (spec.card_selector, *spec.card_fallbacks) if css)
+        plans = selector_stats.plans_for(spec.name, {
+            self.CARDS: card_selectors,
+            **{name: field.selectors for name, field in spec.fields.items()},
+        })
+        self.card_plan = plans[self.CARDS]
+        self.card_selectors = [CSSSelector(css) for css in card_selectors]
+        self.fields = [CompiledField(name, field, plans[name]) for name, field in spec.fields.items()]
+
+    def cards(self, root) -> List:
+        """카드 목록 (카드 선택자 중 처음으로 매치되는 것, 없으면 구조 탐지)"""
+        if self.card_selectors:
+            for index in self.card_plan.order():
+                cards = self.card_selectors[index](root)
+                self.card_plan.record(index, bool(cards), bool(cards))
+                if cards:
+                    return cards
+            self.card_plan.record_miss()
+        return self.detected_cards(root) if self.spec.detect_cards else []
+
+    def valid_postings(self, cards) -> int:
+        """텍스트가 충분하고 제목 선택자가 값을 내는 카드 수"""
+        title = next((field for field in self.fields if field.name == 'title' and field.selectors), None)
+        return sum(
+            1 for card in cards
+            if len(card_text(card)) >= self.spec.min_card_text and (title is None or title.first_value(card))
+        )
+
+    def detected_cards(self, root) -> List:
+        """사이트별로 캐시한 탐지 선택자로 카드 목록
+
+        카드 수가 급감하면 다시 탐지하되, 새 묶음이 더 낫지 않으면(검색 결과가 없는 페이지의
+        푸터 등) 캐시를 유지하고 캐시한 선택자의 결과를 씁니다.
+        """
+        site = self.spec.name
+        cached = card_detector.cached(site)
+        cards = _css(cached['selector'])(root) if cached else []
+        if card_detector.needs_redetect(site, len(cards)):
+            detected = card_detector.detect(site, root, lambda css: self.valid_postings(_css(css)(root)))
+            if detected is not None:
+                cards = _css(detected['selector'])(root)
+        return cards
+
+    def extract_card(self, card, base_url: str) -> Optional[Dict[str, Any]]:
+        """카드 하나 → 공고 dict (후처리기에서 버리면 None)"""
+        text = card_text(card)
+        if len(text) < self.spec.min_card_text:
+            return None
+        card_length = len(element_text(card))
+        job = {field.name: field.extract(card, base_url, card_length) for field in self.fields}
+        for processor in self.spec.post_processors:
+            job = processor(job, text)
+            if job is None:
+                return None
+        return job
+
+    def extract_page(self, html: str, base_url: str = '') -> Iterator[Dict[str, Any]]:
+        """페이지 HTML 을 한 번 파싱해 카드별 공고를 생성"""
+        if not html or not html.strip():
+            return
+        root = lxml.html.document_fromstring(html)
+        for card in self.cards(root):
+            job = self.extract_card(card, base_url)
+            if job is not None:
+                yield job
+
+
+_compiled: Dict[str, CompiledSpec] = {}
+
+
+def compile_spec(spec: SiteSpec) -> CompiledSpec:
+    """사이트별로 한 번만 컴파일 (같은 명세면 캐시 재사용)"""
+    compiled = _compiled.get(spec.name)
+    if compiled is None or compiled.spec is not spec:
+        compiled = _compiled[spec.name] = CompiledSpec(spec)
+    return compiled
@@ -0,0 +1,101 @@
+"""검색 폼을 브라우저 없이 HTTP POST 로 다시 제출
+
+새 워크넷(work24)처럼 결과 목록이 폼 POST 응답 HTML 로 오는 사이트는 폼 페이지를 열어
+입력하고 버튼을 누를 필요가 없습니다. 폼 페이지를 한 번 GET 해서 세션 쿠키와 숨은 필드,
+CSRF 토큰(Spring 의 <meta name="_csrf"> 관례)을 얻은 뒤 검색 조건과 페이지 번호만 바꿔
+search_path 로 POST 하면 페이지당 요청 하나로 끝납니다.
+
+HTTP 로 얻은 세션이 거부되면 browser_state 로 브라우저에서 폼 페이지를 한 번 열어 쿠키와
+토큰을 받아 같은 HTTP 세션에 넣습니다.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import lxml.html
+from yarl import URL
+
+CSRF_META = ('_csrf', 'csrf-token', 'csrf_token')
+CSRF_HEADER_META = '_csrf_header'
+DEFAULT_CSRF_HEADER = 'X-CSRF-TOKEN'
+
+
+def form_state(html: str, action: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """폼 페이지 HTML → (검색 폼의 숨은 필드, CSRF 헤더)
+
+    action 이 들어간 폼을 우선 쓰고, 없으면 숨은 필드가 가장 많은 폼을 씁니다.
+    """
+    if not html.strip():
+        return {}, {}
+    root = lxml.html.fromstring(html)
+    forms = root.xpath('//form')
+    target = next((form for form in forms if action and action in (form.get('action') or '')), None)
+    if target is None and forms:
+        target = max(forms, key=lambda form: len(form.xpath('.//input[@type="hidden"]')))
+
+    hidden = {}
+    if target is not None:
+        for element in target.xpath('.//input[@type="hidden"][@name]'):
+            hidden[element.get('name')] = element.get('value') or ''
+
+    headers = {}
+    for name in CSRF_META:
+        token = root.xpath(f'//meta[@name="{name}"]/@content')
+        if token:
+            header = root.xpath(f'//meta[@name="{CSRF_HEADER_META}"]/@content')
+            headers[header[0] if header else DEFAULT_CSRF_HEADER] = token[0]
+            break
+    return hidden, headers
+
+
+def browser_state(driver, form_url: str) -> Tuple[str, List[Dict[str, Any]], str]:
+    """브라우저로 폼 페이지를 열어 (HTML, 쿠키, User-Agent) 반환 (동기, 스레드에서 호출)"""
+    driver.get(form_url)
+    return driver.page_source, driver.get_cookies(), driver.execute_script('return navigator.userAgent;') or ''
+
+
+class FormReplay:
+    """세션 쿠키·숨은 필드·CSRF 헤더를 유지하며 검색 폼을 POST 로 제출
+
+    쿠키는 호출하는 쪽의 aiohttp 세션 쿠키 저장소에 쌓이므로, 같은 세션으로 bootstrap 과
+    submit 을 호출해야 합니다. source 는 마지막 세션을 얻은 방법 ('http' | 'browser').
+    """
+
+    def __init__(self, base_url: str, form_path: str, search_path: str, headers: Optional[Dict[str, str]] = None):
+        self.base_url = base_url
+        self.form_url = f'{base_url}{form_path}'
+        self.search_url = f'{base_url}{search_path}'
+        self.action = search_path.rsplit('/', 1)[-1]
+        self.headers = dict(headers or {})
+        self.hidden: Dict[str, str] = {}
+        self.source: Optional[str] = None
+
+    def _apply(self, html: str):
+        self.hidden, csrf_headers = form_state(html, self.action)
+        self.headers.update(csrf_headers)
+
+    async def bootstrap(self, session: aiohttp.ClientSession) -> int:
+        """폼 페이지를 GET 해 쿠키와 토큰을 받음 (응답 상태 반환)"""
+        async with session.get(self.form_url, headers=self.headers) as response:
+            html = await response.text() if response.status == 200 else ''
+        self._apply(html)
+        self.source = 'http'
+        return response.status
+
+    def apply_browser_state(self, session: aiohttp.ClientSession, html: str,
+                            cookies: List[Dict[str, Any]], user_agent: str = ''):
+        """browser_state 결과를 HTTP 세션에 적용"""
+        session.cookie_jar.update_cookies({cookie['name']: cookie['value'] for cookie in cookies}, URL(self.base_url))
+        if user_agent:
+            self.headers['User-Agent'] = user_agent
+        self._apply(html)
+        self.source = 'browser'
+
+    def form_data(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        """숨은 필드 위에 검색 조건을 덮어쓴 제출 데이터"""
+        return {**self.hidden, **{name: str(value) for name, value in fields.items()}}
+
+    async def submit(self, session: aiohttp.ClientSession, fields: Dict[str, Any]) -> Tuple[int, str]:
+        """검색 POST → (상태, HTML)"""
+        headers = {**self.headers, 'Referer': self.form_url}
+        async with session.post(self.search_url, data=self.form_data(fields), headers=headers) as response:
+            return response.status, await response.text() if response.status == 200 else ''
@@ -0,0 +1,102 @@
+"""대체 선택자 실행 계획과 사이트별 적중 통계
+
+명세의 대체 선택자 목록은 우선순위입니다. 두 선택자가 같은 카드에서 모두 매치되면
+앞의 것이 정답이므로, 적중 횟수로 순서를 바꾸면 추출되는 값이 달라집니다
+(예: ('.job_tit a', 'strong') 에서 'strong' 이 앞서면 .job_tit 카드의 제목이 바뀜).
+그래서 SelectorPlan 은 값이 채택된 적 있는 선택자의 명세 순서는 그대로 두고, 매치되지
+않았거나 매치돼도 필드 검증(min_length, 카드 텍스트 전체 등)을 한 번도 통과하지 못한
+포괄 선택자만 맨 뒤로 미룹니다 (앞쪽에서 값을 얻지 못한 카드에서만 시도). 가끔
+(EXPLORE_EVERY) 전체 목록을 원래 순서로 다시 시도해 사이트 구조 변경을 따라갑니다.
+
+이 모듈은 lxml 을 임포트하지 않으므로 API 서버가 통계만 읽을 때 가볍게 쓸 수 있습니다.
+"""
+import threading
+from typing import Any, Dict, List, Sequence
+
+WARMUP = 30          # 계획을 처음 세우기 전 전체 목록으로 시도할 횟수
+REPLAN_EVERY = 100   # 계획을 다시 세우는 주기 (시도 횟수)
+EXPLORE_EVERY = 500  # 전체 목록으로 다시 탐색하는 주기 (시도 횟수)
+
+
+class SelectorPlan:
+    """필드 하나의 대체 선택자 시도 순서"""
+
+    def __init__(self, selectors: Sequence[str]):
+        self.selectors = list(selectors)
+        self.matched = [0] * len(self.selectors)   # 요소가 하나 이상 매치된 횟수
+        self.hits = [0] * len(self.selectors)      # 최종 값으로 채택된 횟수
+        self.runs = 0
+        self.misses = 0                            # 어떤 선택자로도 값을 못 얻은 횟수
+        self._full = list(range(len(self.selectors)))
+        self._order = self._full
+        self._pruned = set()
+
+    def order(self) -> List[int]:
+        """이번 시도에 쓸 선택자 인덱스 순서 (항상 전체 선택자를 포함)"""
+        self.runs += 1
+        if self.runs <= WARMUP or self.runs % EXPLORE_EVERY == 0:
+            return self._full
+        if self.runs == WARMUP + 1 or self.runs % REPLAN_EVERY == 0:
+            self.replan()
+        return self._order
+
+    def replan(self):
+        # 값이 채택된 적 있는 선택자는 명세 순서 그대로, 검증을 통과한 값을 못 낸 선택자만 맨 뒤
+        active = [index for index in self._full if self.hits[index]]
+        self._pruned = {index for index in self._full if not self.hits[index]}
+        self._order = active + [index for index in self._full if index in self._pruned]
+
+    def record(self, index: int, matched: bool, hit: bool):
+        if matched:
+            self.matched[index] += 1
+        if hit:
+            self.hits[index] += 1
+
+    def record_miss(self):
+        self.misses += 1
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                'selector': selector,
+                'matched': self.matched[index],
+                'hits': self.hits[index],
+                'hit_rate': round(self.hits[index] / self.runs, 3) if self.runs else 0.0,
+                'pruned': index in self._pruned,
+            }
+            for index, selector in enumerate(self.selectors)
+        ]
+
+
+class SelectorStats:
+    """사이트 → 필드 → SelectorPlan 등록부 (메트릭 조회용)"""
+
+    def __init__(self):
+        self._plans: Dict[str, Dict[str, SelectorPlan]] = {}
+        self._lock = threading.Lock()
+
+    def plans_for(self, site: str, selectors_by_field: Dict[str, Sequence[str]]) -> Dict[str, SelectorPlan]:
+        """사이트의 필드별 계획 (명세가 바뀌지 않았으면 기존 통계를 이어 씀)"""
+        with self._lock:
+            plans = self._plans.get(site, {})
+            for field, selectors in selectors_by_field.items():
+                if field not in plans or plans[field].selectors != list(selectors):
+                    plans[field] = SelectorPlan(selectors)
+            self._plans[site] = plans
+            return plans
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            site: {
+                field: {'runs': plan.runs, 'misses': plan.misses, 'selectors': plan.stats()}
+                for field, plan in plans.items()
+            }
+            for site, plans in self._plans.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._plans.clear()
+
+
+selector_stats = SelectorStats()
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 후처리기: (공고, 카드 텍스트) → 공고 (None 이면 버림)
+PostProcessor = Callable[[Dict[str, Any], str], Optional[Dict[str, Any]]]
+
+# 제목 대체용 첫 줄에서 건너뛸 UI 문구
+UI_TEXT = ('로그인', '회원가입', '검색', '메뉴')
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """카드 안의 필드 하나
+
+    selectors 를 순서대로 시도해 min_length 이상인 첫 값을 씁니다 (실행 중에는
+    사이트별 적중 통계에 따라 순서가 바뀔 수 있음). 속성 필드(attr != 'text')는
+    선택자가 없거나 모두 빗나가면 카드 요소 자체의 attr 를 읽습니다. index 는 같은 선택자의 n번째 매치, many 는 리스트 필드.
+    """
+    selectors: Tuple[str, ...] = ()
+    attr: str = 'text'
+    index: int = 0
+    many: bool = False
+    min_length: int = 1
+    default: Any = ''
+
+
+@dataclass(frozen=True)
+class PaginationSpec:
+    """페이지 번호 쿼리 파라미터 (max_pages 는 SITES_CONFIG 의 max_pages 로 상한, None 이면 그 값)"""
+    param: str
+    start: int = 1
+    max_pages: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    """사이트 하나의 선언적 크롤링 명세
+
+    base_url / search_path 는 실행 시점에 SITES_CONFIG 에서 읽으므로 설정만 바꿔
+    다른 호스트(모의 서버 등)를 가리킬 수 있습니다. query 값의 {keyword} 는 검색어로 치환
+    (fetch='form' 이면 query 는 SITES_CONFIG search_params 위에 덮어쓰는 폼 필드).
+    """
+    name: str
+    card_selector: str                 # 비우면 구조 탐지(detect_cards)만 사용
+    fields: Dict[str, FieldSpec]
+    card_fallbacks: Tuple[str, ...] = ()   # card_selector 가 매치되지 않을 때 시도
+    detect_cards: bool = False         # 선택자가 모두 빗나가면 반복 구조로 카드 탐지
+    query: Dict[str, str] = field(default_factory=dict)
+    pagination: Optional[PaginationSpec] = None
+    fetch: str = 'selenium'            # 'selenium' | 'http' | 'form' (form_path 의 검색 폼을 POST)
+    api_capture: bool = False          # 목록 XHR/JSON API 를 찾아 직접 호출 (못 찾으면 fetch 방식)
+    ready_selector: Optional[str] = None   # 로딩 완료 판단 (없으면 card_selector)
+    scroll_count: int = 0
+    max_jobs: int = 50
+    min_card_text: int = 0             # 카드 텍스트가 이보다 짧으면 건너뜀
+    post_processors: Tuple[PostProcessor, ...] = ()
+    exclude_title_keywords: Tuple[str, ...] = ()
+
+
+def first_line_title(job: Dict[str, Any], card_text: str) -> Dict[str, Any]:
+    """제목을 못 찾았으면 카드 텍스트의 첫 의미 있는 줄로 대체"""
+    if not job.get('title'):
+        for line in card_text.split('\n'):
+            line = line.strip()
+            if len(line) > 3 and not any(skip in line for skip in UI_TEXT):
+                job['title'] = line
+                break
+    return job
+
+
+def require_title(job: Dict[str, Any], card_text: str) -> Optional[Dict[str, Any]]:
+    return job if job.get('title') else None
@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import urljoin
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    CSSSelector = None
+
+_BLOCK_SEPARATOR = '\n'
+
+# selenium.webdriver.common.by.By 의 값 (lxml 재생 경로에서 selenium 을 올리지 않도록 문자열로 둠)
+CSS_SELECTOR = 'css selector'
+TAG_NAME = 'tag name'
+ID = 'id'
+CLASS_NAME = 'class name'
+
+
+def _css(by: str, value: str) -> str:
+    if by == CSS_SELECTOR:
+        return value
+    if by == TAG_NAME:
+        return value
+    if by == ID:
+        return f'#{value}'
+    if by == CLASS_NAME:
+        return f'.{value}'
+    raise NotImplementedError(f"정적 DOM 에서 지원하지 않는 탐색 방식: {by}")
+
+
+class StaticElement:
+    """저장된 HTML 요소를 Selenium WebElement 처럼 다루는 어댑터
+
+    크롤러의 extract_job_data 가 쓰는 find_element(s) / text / get_attribute 만
+    구현하여, 브라우저 없이 같은 추출 코드를 재생할 수 있게 합니다.
+    """
+
+    def __init__(self, base_url: str = ''):
+        self.base_url = base_url
+
+    @property
+    def text(self) -> str:
+        raise NotImplementedError
+
+    def _select(self, css: str) -> List['StaticElement']:
+        raise NotImplementedError
+
+    def _attribute(self, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def find_elements(self, by: str = CSS_SELECTOR, value: str = '') -> List['StaticElement']:
+        return self._select(_css(by, value))
+
+    def find_element(self, by: str = CSS_SELECTOR, value: str = '') -> 'StaticElement':
+        found = self._select(_css(by, value))
+        if not found:
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(f"요소 없음: {value}")
+        return found[0]
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        value = self._attribute(name)
+        # Selenium 은 href/src 를 절대 URL 로 돌려줌
+        if value and name in ('href', 'src') and self.base_url:
+            return urljoin(self.base_url, value)
+        return value
+
+
+class SoupElement(StaticElement):
+    """BeautifulSoup(html.parser 또는 lxml 파서) 기반"""
+
+    def __init__(self, tag: 'Tag', base_url: str = ''):
+        super().__init__(base_url)
+        self.tag = tag
+
+    @classmethod
+    def parse(cls, html: str, base_url: str = '', parser: str = 'html.parser') -> 'SoupElement':
+        from bs4 import BeautifulSoup
+
+        return cls(BeautifulSoup(html, parser), base_url)
+
+    @property
+    def text(self) -> str:
+        return self.tag.get_text(_BLOCK_SEPARATOR, strip=True)
+
+    def _select(self, css: str) -> List['SoupElement']:
+        return [SoupElement(tag, self.base_url) for tag in self.tag.select(css)]
+
+    def _attribute(self, name: str) -> Optional[str]:
+        if name == 'outerHTML':
+            return str(self.tag)
+        value = self.tag.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+
+class LxmlElement(StaticElement):
+    """lxml.html + cssselect 기반 (cssselect 미설치 시 사용 불가)"""
+
+    _selectors = {}
+
+    def __init__(self, element, base_url: str = ''):
+        super().__init__(base_url)
+        self.element = element
+
+    @classmethod
+    def parse(cls, html: str, base_url: str = '') -> 'LxmlElement':
+        if CSSSelector is None:
+            raise ImportError("lxml 모드에는 cssselect 패키지가 필요합니다 (pip install cssselect)")
+        return cls(lxml.html.document_fromstring(html), base_url)
+
+    @property
+    def text(self) -> str:
+        return _BLOCK_SEPARATOR.join(part.strip() for part in self.element.itertext() if part.strip())
+
+    def _select(self, css: str) -> List['LxmlElement']:
+        selector = self._selectors.get(css)
+        if selector is None:
+            selector = self._selectors[css] = CSSSelector(css)
+        return [LxmlElement(element, self.base_url) for element in selector(self.element)]
+
+    def _attribute(self, name: str) -> Optional[str]:
+        if name == 'outerHTML':
+            return lxml.html.tostring(self.element, encoding='unicode')
+        return self.element.get(name)
@@ -0,0 +1,208 @@
+"""고정 sleep 대신 페이지 상태를 보고 기다리는 도구
+
+- wait_for_dom_quiet: MutationObserver 로 DOM 변경이 quiet_ms 동안 없을 때까지
+- NetworkMonitor.wait_idle: 성능 로그(CDP Network 이벤트)로 진행 중 요청이 없을 때까지
+- scroll_until_stable: 무한 스크롤에서 카드 수가 더 늘지 않을 때까지
+- AdaptiveTimeouts: 사이트/조건별로 실제 걸린 시간을 기억해 다음 타임아웃을 정함
+
+모든 대기는 조건이 만족되는 즉시 돌아오고, 타임아웃이면 False 를 돌려줍니다.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List
+
+from utils.serialization import loads
+
+# selenium 은 대기 함수 안에서 임포트 (HTTP·API 사이트와 AdaptiveTimeouts 만 쓰는 곳은 올리지 않음)
+
+POLL_INTERVAL = 0.1
+
+# 처음 호출 때 관찰자를 설치하고, 마지막 변경 후 경과 시간(ms)을 돌려줌
+_MUTATION_SCRIPT = """
+if (!window.__crawlerMutations) {
+    window.__crawlerMutations = {last: performance.now()};
+    new MutationObserver(function () { window.__crawlerMutations.last = performance.now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__crawlerMutations.last;
+"""
+
+_COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+_SCROLL_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+def _until(driver, condition: Callable[[Any], bool], timeout: float) -> bool:
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # 페이지 이동 중 스크립트 오류는 "아직 아님" 으로 보고 계속 폴링
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL,
+                      ignored_exceptions=(WebDriverException,)).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_selector(driver, selector: str, timeout: float = 10) -> bool:
+    """selector 요소가 나타나면 True"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+
+    return _until(driver, EC.presence_of_element_located((By.CSS_SELECTOR, selector)), timeout)
+
+
+def wait_for_dom_quiet(driver, quiet_ms: int = 500, timeout: float = 10) -> bool:
+    """DOM 변경이 quiet_ms 동안 없으면 True"""
+    return _until(driver, lambda d: d.execute_script(_MUTATION_SCRIPT) >= quiet_ms, timeout)
+
+
+def count_elements(driver, selector: str) -> int:
+    return int(driver.execute_script(_COUNT_SCRIPT, selector) or 0)
+
+
+def scroll_until_stable(
+    driver,
+    card_selector: str,
+    max_scrolls: int = 3,
+    settle_ms: int = 400,
+    timeout: float = 5,
+) -> int:
+    """아래로 스크롤하며 카드 수가 더 늘지 않으면 멈춤 (최종 카드 수 반환)
+
+    스크롤마다 카드 수가 늘거나 DOM 이 settle_ms 동안 조용해질 때까지만 기다립니다.
+    """
+    count = count_elements(driver, card_selector)
+    for _ in range(max_scrolls):
+        driver.execute_script(_SCROLL_SCRIPT)
+        previous = count
+        _until(
+            driver,
+            lambda d: count_elements(d, card_selector) > previous
+            or d.execute_script(_MUTATION_SCRIPT) >= settle_ms,
+            timeout,
+        )
+        # 카드가 추가되는 중이면 마무리될 때까지
+        wait_for_dom_quiet(driver, quiet_ms=settle_ms // 2, timeout=timeout)
+        count = count_elements(driver, card_selector)
+        if count <= previous:
+            break
+    return count
+
+
+class NetworkMonitor:
+    """성능 로그로 CDP Network 이벤트를 읽어 진행 중 요청을 추적
+
+    드라이버가 goog:loggingPrefs {'performance': 'ALL'} 로 시작되어야 합니다
+    (browser_profile.chrome_options(network_log=True)). 로그는 읽으면 비워지므로 한 드라이버에 하나만 씁니다.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.inflight: Dict[str, str] = {}
+        self.last_activity = time.monotonic()
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """새 Network 이벤트를 읽어 진행 중 요청 목록을 갱신"""
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException:
+            return []
+        events = []
+        for entry in entries:
+            message = loads(entry['message'])['message']
+            method = message.get('method', '')
+            if not method.startswith('Network.'):
+                continue
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                self.inflight[request_id] = params.get('request', {}).get('url', '')
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                self.inflight.pop(request_id, None)
+            events.append(message)
+            for listener in self.listeners:
+                listener(message)
+        if events:
+            self.last_activity = time.monotonic()
+        return events
+
+    def is_idle(self, idle_ms: int = 500, max_inflight: int = 0) -> bool:
+        self.poll()
+        quiet_for = (time.monotonic() - self.last_activity) * 1000
+        return len(self.inflight) <= max_inflight and quiet_for >= idle_ms
+
+    def wait_idle(self, idle_ms: int = 500, max_inflight: int = 0, timeout: float = 10) -> bool:
+        """진행 중 요청이 max_inflight 이하로 idle_ms 동안 유지되면 True"""
+        return _until(self.driver, lambda _: self.is_idle(idle_ms, max_inflight), timeout)
+
+
+class AdaptiveTimeouts:
+    """사이트/조건별 대기 시간을 기억해 타임아웃을 조정
+
+    최근 WINDOW 번의 대기 시간 중 최댓값 × MARGIN 을 쓰되 [floor, 기본값] 으로 제한합니다
+    (타임아웃이 나도 설정한 기본값보다 길어지지 않음). 관측이 MIN_SAMPLES 보다 적으면
+    기본값을 씁니다.
+    """
+
+    WINDOW = 20
+    MIN_SAMPLES = 3
+    MARGIN = 2.0
+
+    def __init__(self):
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.WINDOW))
+        self._timeouts: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def timeout(self, site: str, condition: str, default: float, floor: float = 1.0) -> float:
+        samples = self._samples.get(f'{site}:{condition}')
+        if not samples or len(samples) < self.MIN_SAMPLES:
+            return default
+        return min(max(max(samples) * self.MARGIN, floor), default)
+
+    def record(self, site: str, condition: str, elapsed: float, ok: bool = True, escalate: bool = True):
+        """대기 시간 기록 (escalate=False 면 타임아웃은 횟수만 세고 다음 타임아웃을 늘리지 않음)"""
+        key = f'{site}:{condition}'
+        with self._lock:
+            if ok:
+                self._samples[key].append(elapsed)
+                return
+            self._timeouts[key] += 1
+            if escalate:
+                # 타임아웃은 다음 번에 여유를 주도록 걸린 시간보다 길게 기록
+                self._samples[key].append(elapsed * self.MARGIN)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            key: {
+                'samples': len(samples),
+                'max_sec': round(max(samples), 3) if samples else None,
+                'timeouts': self._timeouts.get(key, 0),
+            }
+            for key, samples in self._samples.items()
+        }
+
+
+adaptive_timeouts = AdaptiveTimeouts()
+
+
+def timed_wait(
+    site: str,
+    condition: str,
+    default: float,
+    wait: Callable[[float], bool],
+    escalate: bool = True,
+) -> bool:
+    """적응형 타임아웃으로 wait(timeout) 을 실행하고 걸린 시간을 기록
+
+    실패해도 진행하는 대기(DOM 안정 등)는 escalate=False 로 불러 타임아웃을 늘리지 않습니다.
+    """
+    timeout = adaptive_timeouts.timeout(site, condition, default)
+    started = time.monotonic()
+    ok = wait(timeout)
+    adaptive_timeouts.record(site, condition, time.monotonic() - started, ok, escalate=escalate)
+    return ok
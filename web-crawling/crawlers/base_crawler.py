@@ -1,44 +1,42 @@
-from abc import ABC, abstractmethod
-from typing import List, Dict
+from abc import ABC
+from typing import TYPE_CHECKING, List, Dict, Optional, AsyncIterator
 from dataclasses import dataclass
 import asyncio
-import json
 import os
 import random
 from dotenv import load_dotenv
-import google.generativeai as genai
-import google.api_core.exceptions
-from httpx import options
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
-import requests
-import aiohttp
-import time
-import hashlib
 import re
 from config.settings import settings
 from config.categories import JOB_CATEGORIES, TECH_KEYWORDS
-from config.sites_config import SITES_CONFIG
+from config.sites_config import SITES_CONFIG, GLOBAL_CONFIG
 from config.categories import JOB_CATEGORIES  # Add this import
 from database.mongodb_connector import mongodb_connector
+from database.mongo_client import mongo_client
 from database.redis_connector import redis_connector
+from ai import gemini
+from crawlers.base import browser_profile, waits
+from crawlers.base.waits import timed_wait
+from ai.job_quality_scorer import JobQualityScorer, AI_SCORE_THRESHOLD
+from processors.local_quality_scorer import LocalQualityScorer
+from processors.job_record import posting_id
+from processors.trend_aggregator import TrendAggregator
 # 로거 설정
 from utils.logger import setup_logger
+from utils.serialization import dumps_str, loads, DecodeError
+from utils.http_cache import http_cache
 logger = setup_logger("base_crawler")
 
+# selenium/bs4/aiohttp 는 쓰는 메서드 안에서 임포트 (HTTP·폼·API 사이트는 Selenium 을 올리지 않음)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 # 환경변수 로드
 load_dotenv()
 
-# Gemini API 키 확인
+# Gemini API 키 확인 (없으면 로컬 품질 점수만 사용)
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 if not GEMINI_API_KEY:
-    raise ValueError("GEMINI_API_KEY environment variable is not set")
+    logger.warning("GEMINI_API_KEY가 설정되지 않았습니다. 로컬 품질 점수만 사용합니다.")
 
 class BaseCrawler(ABC):
     """기본 크롤러 클래스"""
@@ -47,7 +45,19 @@ class BaseCrawler(ABC):
         self.site_name = site_name
         self.site_config = site_config
         self.logger = setup_logger(f"crawler_{site_name}")
-        self.setup_driver()
+        self._driver = None
+        self._network_log = False
+
+    @property
+    def driver(self):
+        """웹드라이버 (크롤러 생성만으로는 Chrome 을 띄우지 않고 첫 사용 때 초기화)"""
+        if getattr(self, '_driver', None) is None:
+            self.setup_driver()
+        return self._driver
+
+    @driver.setter
+    def driver(self, value):
+        self._driver = value
 
     def validate_job_data(self, job_data: dict) -> bool:
         """채용공고 데이터 유효성 검증"""
@@ -88,37 +98,29 @@ class BaseCrawler(ABC):
 
         return True
         
-    def setup_driver(self):
-        """웹드라이버 초기화"""
-        options = Options()
-        options.add_argument(f'--user-agent={random.choice}')
-        
-        if settings.HEADLESS_BROWSER:
-            options.add_argument('--headless=new')
-            
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
+    def setup_driver(self, network_log: bool = False):
+        """웹드라이버 초기화 (이미지/폰트/광고 요청은 CDP 로 차단, network_log 면 성능 로그 켬)"""
+        from selenium import webdriver
+        from selenium.common.exceptions import WebDriverException
+
+        options = browser_profile.chrome_options(self.site_config, network_log=network_log)
         
         try:
             self.driver = webdriver.Chrome(options=options)
+            self._network_log = network_log
             self.driver.set_page_load_timeout(60)
-            logger.info(f"{self.site_name} 웹드라이버 초기화 완료")
+            blocked = browser_profile.apply_network_policy(self.driver, self.site_config)
+            logger.info(f"{self.site_name} 웹드라이버 초기화 완료 (차단 패턴 {len(blocked)}개)")
             
         except WebDriverException as e:
             logger.error(f"{self.site_name} 웹드라이버 초기화 실패: {e}")   
             raise
 
     def close_driver(self):
-        """웹드라이버 종료"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """웹드라이버 종료 (다음 사용 때 다시 초기화)"""
+        if getattr(self, '_driver', None) is not None:
+            self._driver.quit()
+            self._driver = None
 
     async def delay(self):
         """요청 간 지연"""
@@ -126,6 +128,10 @@ class BaseCrawler(ABC):
             
     async def wait_and_find_element(self, by, selector, timeout=10):
         """요소 대기"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             element = await asyncio.to_thread(
                 WebDriverWait(self.driver, timeout).until,
@@ -137,13 +143,17 @@ class BaseCrawler(ABC):
             return None
 
     async def wait_for_element(self, selector: str, timeout: int = 10, retries: int = 3) -> bool:
-        """요소 대기 (재시도 로직 포함)"""
+        """요소 대기 (재시도 로직 포함, 사이트별로 학습한 타임아웃 사용)"""
+        from selenium.common.exceptions import TimeoutException
+
         for attempt in range(retries):
             try:
-                await asyncio.sleep(2)  # 페이지 로딩 대기
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                found = await asyncio.to_thread(
+                    timed_wait, self.site_name, 'element', timeout,
+                    lambda wait: waits.wait_for_selector(self.driver, selector, wait)
                 )
+                if not found:
+                    raise TimeoutException(selector)
                 return True
             except TimeoutException:
                 if attempt < retries - 1:
@@ -155,10 +165,23 @@ class BaseCrawler(ABC):
                 self.logger.error(f"요소 대기 중 오류: {e}")
                 return False
 
-    @abstractmethod
+    def iter_jobs(self, keyword: str) -> AsyncIterator[Dict]:
+        """키워드 기반 크롤링 (공고를 추출되는 즉시 생성)
+
+        사이트 크롤러는 iter_jobs 또는 crawl_with_keyword 중 하나를 구현합니다.
+        """
+        if type(self).crawl_with_keyword is BaseCrawler.crawl_with_keyword:
+            raise NotImplementedError(f"{type(self).__name__}: iter_jobs 또는 crawl_with_keyword 구현 필요")
+        return self._iter_collected(keyword)
+
+    async def _iter_collected(self, keyword: str) -> AsyncIterator[Dict]:
+        for job in await self.crawl_with_keyword(keyword):
+            yield job
+
     async def crawl_with_keyword(self, keyword: str) -> List[Dict]:
-        """키워드 기반 크롤링 (추상 메서드)"""
-        pass
+        """키워드 기반 크롤링 (iter_jobs 결과를 리스트로 수집)"""
+        return [job async for job in self.iter_jobs(keyword)]
+
 @dataclass
 class CrawlJob:
     """크롤링 작업 정의"""
@@ -174,10 +197,18 @@ class GeminiAICrawler(BaseCrawler):
     def __init__(self, site_name, site_config):
         super().__init__(site_name, site_config)
         self.setup_gemini()
+        self.quality_scorer = JobQualityScorer(self.ai_model)
+        self.local_scorer = LocalQualityScorer()
+        self.trends = TrendAggregator()
         self.keyword_cache = {}
         
     def setup_gemini(self):
         """Gemini AI 설정"""
+        if settings.AI_OFFLINE:
+            self.logger.info("AI_OFFLINE 모드: Gemini 없이 로컬 품질 점수만 사용합니다.")
+            self.ai_model = None
+            return
+
         api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
             self.logger.warning("GEMINI_API_KEY가 없습니다. AI 기능이 비활성화됩니다.")  # Changed to self.logger
@@ -185,8 +216,7 @@ class GeminiAICrawler(BaseCrawler):
             return
             
         try:
-            genai.configure(api_key=api_key)
-            self.ai_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.ai_model = gemini.create_model(api_key)
             self.logger.info("Gemini AI 초기화 완료")  # Changed to self.logger
         except Exception as e:
             self.logger.error(f"Gemini AI 초기화 실패: {e}")  # Changed to self.logger
@@ -253,7 +283,7 @@ Example: ["Python", "백엔드 개발자", "Django"]
                 response = await asyncio.to_thread(
                     self.ai_model.generate_content,
                     prompt,
-                    generation_config=genai.types.GenerationConfig(
+                    generation_config=gemini.generation_config(
                         temperature=0.1,
                         max_output_tokens=50
                     )
@@ -264,18 +294,18 @@ Example: ["Python", "백엔드 개발자", "Django"]
                     keywords_text = keywords_text.split('\n')[1:-1]
                     keywords_text = '\n'.join(keywords_text)
             
-                keywords = json.loads(keywords_text)
+                keywords = loads(keywords_text)
                 all_keywords = list(set([base_keyword] + keywords))
             
                 logger.info(f"AI 키워드 생성: {all_keywords}")
                 self.keyword_cache[base_keyword] = all_keywords[:3]
                 return all_keywords[:3]  # Limit to 3 keywords to reduce API calls
 
-            except json.JSONDecodeError as e:
+            except DecodeError as e:
                 logger.warning(f"JSON 디코딩 실패: {e}, 응답: {keywords_text}")
                 return [base_keyword]
 
-            except google.api_core.exceptions.ResourceExhausted as e:
+            except gemini.rate_limit_error() as e:
                 if i == max_retries - 1:
                     logger.error(f"API call failed after {max_retries} retries: {e}")
                     return [base_keyword]
@@ -289,107 +319,54 @@ Example: ["Python", "백엔드 개발자", "Django"]
                 return [base_keyword]
     
     async def ai_filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Gemini로 채용공고 품질 필터링"""
-        if not self.ai_model or not jobs:
+        """로컬 점수로 사전 필터링 후 경계 구간만 Gemini로 품질 필터링"""
+        if not jobs:
             return jobs
             
         try:
-            # 배치 처리로 효율성 향상
-            batch_size = 5
+            # 1. 배치 전체 로컬 점수 (네트워크 없음)
+            local_scores = self.local_scorer.score_batch(jobs)
             filtered_jobs = []
+            borderline = []
             
-            for i in range(0, len(jobs), batch_size):
-                batch = jobs[i:i+batch_size]
-                batch_results = await self.evaluate_job_batch(batch)
-                
-                for job, score in zip(batch, batch_results):
-                    # 점수가 70점 이상인 것만 포함
-                    if score >= 70:
-                        job['ai_quality_score'] = score
+            for job, local_score in zip(jobs, local_scores):
+                local_score = float(local_score)
+                if local_score < settings.LOCAL_SCORE_REJECT:
+                    continue
+                if self.ai_model and local_score < settings.LOCAL_SCORE_ACCEPT:
+                    borderline.append(job)
+                    continue
+                # 확실한 공고이거나, 오프라인이면 경계 구간(REJECT~ACCEPT)까지 로컬 점수로 통과
+                job['ai_quality_score'] = local_score
+                job['ai_score_source'] = 'local'
+                filtered_jobs.append(job)
+            
+            # 2. 경계 구간만 토큰 한도에 맞춘 대형 배치로 Gemini 평가
+            unscored = 0
+            if borderline:
+                scores = await self.quality_scorer.score_jobs(borderline)
+                for job, score in zip(borderline, scores):
+                    if score is None:
+                        # 평가하지 못한 공고는 임의 점수 없이 그대로 통과
+                        unscored += 1
+                        filtered_jobs.append(job)
+                    elif score >= AI_SCORE_THRESHOLD:
+                        # 점수가 70점 이상인 것만 포함 (점수는 scorer가 공고에 기록)
                         filtered_jobs.append(job)
-                
-                # API 호출 제한 (배치당 3초 대기)
-                await asyncio.sleep(3)
             
-            logger.info(f"AI 품질 필터링: {len(jobs)} → {len(filtered_jobs)}개")
+            logger.info(
+                f"AI 품질 필터링: {len(jobs)} → {len(filtered_jobs)}개 "
+                f"(Gemini 평가 {len(borderline)}개, 미평가 {unscored}개)"
+            )
             return filtered_jobs
             
         except Exception as e:
             logger.warning(f"AI 필터링 실패, 원본 반환: {e}")
             return jobs
     
-    async def evaluate_job_batch(self, jobs: List[Dict]) -> List[float]:
-        """채용공고 배치 품질 평가"""
-        max_retries = 5
-        base_delay = 5  # seconds
-        for i in range(max_retries):
-            try:
-                job_summaries = []
-                for i, job in enumerate(jobs):
-                    summary = f"""
-{i+1}. 회사: {job.get('company_name', 'Unknown')}
-   직무: {job.get('job_title', '미명시')}
-   위치: {job.get('work_location', '미명시')}
-   급여: {job.get('salary_range', '미명시')}
-   키워드: {job.get('keywords', [])}
-"""
-                    job_summaries.append(summary)
-                
-                prompt = f"""
-다음 채용공고들의 품질을 각각 0-100점으로 평가해주세요.
-
-{chr(10).join(job_summaries)}
-
-평가 기준:
-- 정보의 구체성 (30점): 직무, 요구사항이 명확한가?
-- 회사 신뢰성 (25점): 회사명이 명확하고 신뢰할 만한가?
-- 급여 정보 (25점): 급여 정보가 투명한가?
-- 기술스택 적합성 (20점): 관련 기술스택이 명시되어 있는가?
-
-응답 형식: JSON 배열로 숫자만
-예시: [85, 72, 90, 65, 78]
-"""
-                
-                response = await asyncio.to_thread(
-                    self.ai_model.generate_content, 
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.1,
-                        max_output_tokens=100
-                    )
-                )
-                
-                scores_text = response.text.strip()
-                if scores_text.startswith('```'):
-                    scores_text = scores_text.split('\n')[1:-1]
-                    scores_text = '\n'.join(scores_text)
-                
-                scores = json.loads(scores_text)
-                
-                # 점수 검증 및 정규화
-                validated_scores = []
-                for score in scores:
-                    validated_score = min(max(float(score), 0), 100)
-                    validated_scores.append(validated_score)
-                
-                return validated_scores
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON 디코딩 실패: {e}, 원시 응답: {response.text}")
-                return [75.0] * len(jobs)
-
-            except google.api_core.exceptions.ResourceExhausted as e:
-                if i == max_retries - 1:
-                    logger.error(f"API call failed after {max_retries} retries: {e}")
-                    return [75.0] * len(jobs)
-                
-                delay = base_delay * (2 ** i) + random.uniform(0, 1)
-                logger.warning(f"Rate limit exceeded. Retrying in {delay:.2f} seconds...")
-                await asyncio.sleep(delay)
-                
-            except Exception as e:
-                logger.warning(f"배치 평가 실패: {e}")
-                return [75.0] * len(jobs)
+    async def evaluate_job_batch(self, jobs: List[Dict]) -> List[Optional[float]]:
+        """채용공고 배치 품질 평가 (평가 실패한 공고는 None)"""
+        return await self.quality_scorer.score_jobs(jobs)
     
 
     
@@ -400,7 +377,7 @@ Example: ["Python", "백엔드 개발자", "Django"]
         
         for job in jobs:
             # Redis 큐에 작업 추가
-            redis_connector.add_to_queue("crawl_jobs", json.dumps(job.__dict__))
+            redis_connector.add_to_queue("crawl_jobs", dumps_str(job.__dict__))
         
         # 워커 실행 (동시성 제한)
         workers = [
@@ -422,7 +399,7 @@ Example: ["Python", "백엔드 개발자", "Django"]
                     await asyncio.sleep(1) # 큐가 비어있으면 잠시 대기
                     continue
                 
-                job = CrawlJob(**json.loads(job_str))
+                job = CrawlJob(**loads(job_str))
                 
                 logger.info(f"🚀 크롤링 시작: {job.site_name} - {job.keywords}")
                 
@@ -437,11 +414,24 @@ Example: ["Python", "백엔드 개발자", "Django"]
                 # Save results to database
                 if all_job_results:
                     logger.info(f"데이터베이스에 {len(all_job_results)}개의 채용공고를 저장합니다.")
+                    collection = mongo_client.get_collection('job_postings')
+                    new_jobs = []
                     for job_posting in all_job_results:
-                        await mongodb_connector.insert_job_posting(job_posting)
+                        # AI 점수(ai_quality_score, ai_score_hash)도 공고와 함께 저장
+                        if 'id' not in job_posting:
+                            job_posting['id'] = posting_id(job_posting)
+                        result = await collection.update_one(
+                            {'id': job_posting['id']},
+                            {'$set': job_posting},
+                            upsert=True
+                        )
+                        if result.upserted_id:
+                            new_jobs.append(job_posting)
+
+                    # 트렌드 롤업은 processors.trend_aggregator 에서 증분 관리
+                    await self.trends.update_from_jobs(new_jobs)
 
                 logger.info(f"✅ 크롤링 완료: {len(all_job_results)}개 수집")
-                # 트렌드 분석 기능은 별도 모듈로 분리됨
                 
                 # Redis 큐는 task_done()이 필요 없음
 
@@ -457,6 +447,7 @@ Example: ["Python", "백엔드 개발자", "Django"]
         """키워드 기반 크롤링 구현"""
         max_retries = 3
         retry_count = 0
+        selenium_available = True
         
         while retry_count < max_retries:
             try:
@@ -469,8 +460,14 @@ Example: ["Python", "백엔드 개발자", "Django"]
                 if results:
                     return results
                     
-                # selenium 모드로 재시도
-                if self.driver:
+                # selenium 모드로 재시도 (드라이버는 여기서 처음 띄우고, 못 띄우면 requests 로만 재시도)
+                if selenium_available and self._driver is None:
+                    try:
+                        self.setup_driver()
+                    except Exception as e:
+                        self.logger.warning(f"Selenium 을 사용할 수 없어 requests 로만 재시도: {e}")
+                        selenium_available = False
+                if selenium_available:
                     results = await self._crawl_with_selenium(url)
                     if results:
                         return results
@@ -489,9 +486,12 @@ Example: ["Python", "백엔드 개발자", "Django"]
         return []
 
     def selenium_operations(self, url):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         self.logger.info(f"Selenium으로 URL에 접근 중: {url}")
         self.driver.get(url)
-        time.sleep(2)
         self.logger.info(f"페이지 타이틀: {self.driver.title}")
         job_list_selector = self.site_config['selectors']['job_list']
         self.logger.info(f"'{job_list_selector}' 선택자를 기다리는 중...")
@@ -510,6 +510,8 @@ Example: ["Python", "백엔드 개발자", "Django"]
             return []
             
         try:
+            from bs4 import BeautifulSoup
+
             page_source = await asyncio.to_thread(self.selenium_operations, url)
             soup = BeautifulSoup(page_source, 'html.parser')
             redis_connector.add_visited_url("visited_urls", url) # Add to visited URLs
@@ -530,31 +532,36 @@ Example: ["Python", "백엔드 개발자", "Django"]
             return []
 
         try:
+            import aiohttp
+            from bs4 import BeautifulSoup
+
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/119.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache',
                 'DNT': '1'
             }
-            
+            # 사이트별 freshness TTL 안이면 디스크 캐시, 지나면 ETag/Last-Modified 로 재검증
+            ttl = self.site_config.get('cache_ttl', GLOBAL_CONFIG['cache_ttl']['job_posts'])
+
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        redis_connector.add_visited_url("visited_urls", url) # Add to visited URLs
-                        return self._parse_job_items(soup)
-                    else:
-                        self.logger.warning(f"HTTP 요청 실패: {response.status}")
-                        return []
+                response = await http_cache.fetch(session, url, headers=headers, ttl=ttl, timeout=30)
+
+            if response.status == 200:
+                if response.from_cache:
+                    self.logger.info(f"HTTP 캐시 사용 ({response.source}): {url}")
+                soup = BeautifulSoup(response.text(), 'html.parser')
+                redis_connector.add_visited_url("visited_urls", url) # Add to visited URLs
+                return self._parse_job_items(soup)
+            else:
+                self.logger.warning(f"HTTP 요청 실패: {response.status}")
+                return []
                         
         except Exception as e:
             self.logger.error(f"Requests 크롤링 실패: {e}")
             return []
         
-    def _parse_job_items(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_job_items(self, soup: 'BeautifulSoup') -> List[Dict]:
         """HTML에서 채용공고 파싱"""
         results = []
         job_items = soup.select(self.site_config['selectors']['job_list'])
@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+from contextlib import aclosing
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+from processors.data_normalizer import DataNormalizer
+from processors.job_record import JobRecord
+from utils.logger import setup_logger
+
+logger = setup_logger("crawl_pipeline")
+
+_DONE = object()
+
+# 배치를 기록하고 기록된 개수를 반환 (None 이면 배치 전체)
+JobBatchSink = Callable[[List[Dict[str, Any]]], Awaitable[Optional[int]]]
+
+# 사이트/키워드 하나의 추출이 끝날 때 (site, keyword, 추출 공고 수, 오류 메시지 또는 None)
+TaskDoneHook = Callable[[str, str, int, Optional[str]], Awaitable[None]]
+
+
+def dedup_key(record: JobRecord) -> bytes:
+    """중복 판별 키 (URL 이 있으면 URL, 없으면 제목+회사) 의 8바이트 해시"""
+    identity = record.url or f"{record.job_title}|{record.company_name}"
+    return hashlib.blake2b(f"{record.source_site}|{identity}".encode('utf-8'), digest_size=8).digest()
+
+
+class CrawlPipeline:
+    """extract → validate → normalize → dedup → sink 단계형 크롤링 파이프라인
+
+    검증을 통과한 공고는 JobRecord 로 바뀌어 정규화/중복 제거 단계를 거치고,
+    sink 에는 배치 단위 dict 로 전달됩니다.
+
+    단계 사이는 queue_size 로 제한된 asyncio.Queue 로 연결되어, 뒤 단계가 느리면
+    앞 단계가 기다립니다 (backpressure). 메모리에 머무는 공고는 큐 용량과 sink 배치
+    크기로 제한되며, 중복 판별은 공고당 8바이트 해시만 유지합니다.
+    """
+
+    def __init__(
+        self,
+        crawlers: Dict[str, Any],
+        sink: JobBatchSink,
+        normalizer: Optional[DataNormalizer] = None,
+        queue_size: int = 100,
+        normalize_workers: int = 4,
+        batch_size: int = 200,
+        progress: Optional[Dict[str, Any]] = None,
+        on_task_done: Optional[TaskDoneHook] = None,
+        max_jobs: Optional[int] = None,
+    ):
+        self.crawlers = crawlers
+        self.sink = sink
+        self.normalizer = normalizer or DataNormalizer()
+        self.queue_size = queue_size
+        self.normalize_workers = max(1, normalize_workers)
+        self.batch_size = max(1, batch_size)
+        self.progress = progress if progress is not None else {}
+        self.on_task_done = on_task_done
+        self.max_jobs = max_jobs
+        self._seen = set()
+
+    def _count(self, key: str, amount: int = 1):
+        self.progress[key] = self.progress.get(key, 0) + amount
+
+    async def _finish(self, outbox: asyncio.Queue, consumers: int):
+        for _ in range(consumers):
+            await outbox.put(_DONE)
+
+    async def _extract(self, keywords: List[str], outbox: asyncio.Queue):
+        """사이트별로 키워드를 순서대로 크롤링 (사이트당 드라이버 하나, max_jobs 는 사이트당 추출 상한)"""
+        self.progress['tasks_total'] = len(keywords) * len(self.crawlers)
+
+        async def extract_site(site: str, crawler):
+            site_total = 0
+            for keyword in keywords:
+                crawled = 0
+                error = None
+                try:
+                    if self.max_jobs is not None and site_total >= self.max_jobs:
+                        continue
+                    # 상한에 닿으면 남은 페이지를 요청하지 않도록 생성기를 바로 닫음
+                    async with aclosing(crawler.iter_jobs(keyword)) as jobs:
+                        async for job in jobs:
+                            crawled += 1
+                            site_total += 1
+                            self._count('crawled')
+                            await outbox.put((site, job))
+                            if self.max_jobs is not None and site_total >= self.max_jobs:
+                                break
+                except Exception as e:
+                    logger.error(f"{site} '{keyword}' 추출 실패: {e}")
+                    self._count('errors')
+                    error = str(e)
+                finally:
+                    self._count('tasks_done')
+                if self.on_task_done:
+                    await self.on_task_done(site, keyword, crawled, error)
+
+        try:
+            await asyncio.gather(*[extract_site(site, crawler) for site, crawler in self.crawlers.items()])
+        finally:
+            for crawler in self.crawlers.values():
+                crawler.close_driver()
+            await self._finish(outbox, 1)
+
+    async def _validate(self, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        while (item := await inbox.get()) is not _DONE:
+            site, job = item
+            if self.crawlers[site].validate_job_data(job):
+                await outbox.put(JobRecord.from_raw(job, site=site))
+            else:
+                self._count('invalid')
+        await self._finish(outbox, self.normalize_workers)
+
+    async def _normalize(self, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        async def worker():
+            while (record := await inbox.get()) is not _DONE:
+                try:
+                    await outbox.put(await self.normalizer.normalize_record(record))
+                    self._count('normalized')
+                except Exception as e:
+                    logger.warning(f"데이터 정규화 실패: {e}")
+                    self._count('errors')
+
+        await asyncio.gather(*[worker() for _ in range(self.normalize_workers)])
+        await self._finish(outbox, 1)
+
+    async def _dedup(self, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        while (record := await inbox.get()) is not _DONE:
+            key = dedup_key(record)
+            if key in self._seen:
+                self._count('duplicates')
+                continue
+            self._seen.add(key)
+            await outbox.put(record)
+        await self._finish(outbox, 1)
+
+    async def _sink(self, inbox: asyncio.Queue):
+        batch = []
+        while (record := await inbox.get()) is not _DONE:
+            batch.append(record.to_dict())
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        if not batch:
+            return
+        try:
+            written = await self.sink(batch)
+            self._count('sent', len(batch) if written is None else written)
+        except Exception as e:
+            logger.error(f"sink 기록 실패 ({len(batch)}개): {e}")
+            self._count('errors')
+
+    async def run(self, keywords: List[str]) -> Dict[str, Any]:
+        """파이프라인 실행 후 단계별 집계 반환"""
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(4)]
+        stages = [
+            self._extract(keywords, queues[0]),
+            self._validate(queues[0], queues[1]),
+            self._normalize(queues[1], queues[2]),
+            self._dedup(queues[2], queues[3]),
+            self._sink(queues[3]),
+        ]
+        async with asyncio.TaskGroup() as group:
+            for stage in stages:
+                group.create_task(stage)
+
+        logger.info(f"크롤링 파이프라인 완료: {self.progress}")
+        return self.progress
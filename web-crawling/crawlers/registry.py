@@ -0,0 +1,61 @@
+import importlib
+from typing import Dict, List, Type
+
+from config.settings import settings
+
+# 사이트 이름 → 명세 모듈 또는 "모듈:클래스" (요청된 사이트의 모듈만 임포트)
+# 명세 모듈은 SPEC(SiteSpec) 을 정의하며 공용 SpecCrawler 로 실행됩니다.
+# 명세로 표현할 수 없는 사이트만 전용 크롤러 클래스를 둡니다.
+CRAWLER_REGISTRY: Dict[str, str] = {
+    'saramin': 'crawlers.sites.saramin',
+    'worknet': 'crawlers.sites.worknet',
+    'worknet_new': 'crawlers.sites.worknet_new',
+    'comento': 'crawlers.sites.comento',
+    'securityfarm': 'crawlers.sites.securityfarm',
+}
+
+_loaded: Dict[str, object] = {}
+
+
+def available_sites() -> List[str]:
+    return list(CRAWLER_REGISTRY)
+
+
+def enabled_sites() -> List[str]:
+    """기본 크롤링 대상 (worknet_new 는 settings.ENABLE_WORKNET_NEW 일 때만)"""
+    return [site for site in CRAWLER_REGISTRY if site != 'worknet_new' or settings.ENABLE_WORKNET_NEW]
+
+
+def _load(site: str):
+    if site not in CRAWLER_REGISTRY:
+        raise ValueError(f"알 수 없는 사이트: {site}")
+    if site not in _loaded:
+        module_name, _, class_name = CRAWLER_REGISTRY[site].partition(':')
+        module = importlib.import_module(module_name)
+        _loaded[site] = getattr(module, class_name) if class_name else module.SPEC
+    return _loaded[site]
+
+
+def is_spec_site(site: str) -> bool:
+    return ':' not in CRAWLER_REGISTRY.get(site, ':')
+
+
+def get_spec(site: str):
+    """사이트 명세 (SiteSpec, 전용 크롤러 사이트는 ValueError)"""
+    if not is_spec_site(site):
+        raise ValueError(f"명세로 정의되지 않은 사이트: {site}")
+    return _load(site)
+
+
+def get_crawler_class(site: str) -> Type:
+    """사이트 크롤러 클래스 (처음 요청될 때 모듈 임포트)"""
+    if is_spec_site(site):
+        from crawlers.spec_crawler import SpecCrawler
+        return SpecCrawler
+    return _load(site)
+
+
+def create_crawler(site: str):
+    if is_spec_site(site):
+        return get_crawler_class(site)(get_spec(site))
+    return get_crawler_class(site)()
@@ -0,0 +1,40 @@
+from crawlers.base.spec import FieldSpec, PaginationSpec, SiteSpec, first_line_title
+
+SPEC = SiteSpec(
+    name='comento',
+    query={
+        'query': '{keyword} 코멘토',
+        'job_sort': 'job.latest_order',
+    },
+    pagination=PaginationSpec(param='page'),
+    # 목록은 XHR 로 받아 그리므로 그 JSON API 를 직접 호출 (못 찾으면 브라우저 DOM)
+    api_capture=True,
+    # 공고 카드 링크가 없으면(구조 변경) 반복 구조로 카드를 찾고 필드는 대체 선택자로 찾음
+    card_selector='a[href^="/career/recruit/"]',
+    detect_cards=True,
+    min_card_text=10,
+    scroll_count=3,
+    fields={
+        'title': FieldSpec(selectors=(
+            '.recruit-card-title',
+            'h1', 'h2', 'h3', 'h4', 'h5',
+            '.job-title', '.position-title', '.title',
+            '[class*="title"]', '[class*="position"]',
+            'strong', 'b', '.font-bold', '.font-medium',
+        ), min_length=4),
+        # 카드 자체가 공고 링크면 카드의 href 를 씀
+        'url': FieldSpec(selectors=('a',), attr='href'),
+        # 카드에는 회사·제목·마감만 있음: 지역/경력은 구조가 바뀌었을 때의 클래스 대체 선택자만 둠
+        'company': FieldSpec(selectors=('.c-headline7', '.company', '.company-name', '.corp-name', '.employer')),
+        'location': FieldSpec(selectors=('.location', '.area', '.region', '.address')),
+        'experience': FieldSpec(selectors=('.experience', '.career', '.exp', '.level')),
+        'salary': FieldSpec(selectors=('.salary', '.pay', '.wage', '.reward')),
+        'deadline': FieldSpec(selectors=(
+            '.recruit-card-container .c-body2:not(.recruit-card-title)',
+            '.deadline', '.date', '.due-date', '.expires',
+        )),
+        'tags': FieldSpec(selectors=('.skill', '.tag', '.keyword', '.tech', '.badge'), many=True, default=()),
+    },
+    post_processors=(first_line_title,),
+    exclude_title_keywords=('로그인', '회원가입', 'login', 'signup', '직무별 공고', '커뮤니티', '광고문의', '무제한 휴가'),
+)
@@ -0,0 +1,31 @@
+from crawlers.base.spec import FieldSpec, PaginationSpec, SiteSpec, first_line_title
+
+SPEC = SiteSpec(
+    name='saramin',
+    query={
+        'recruitFilterType': 'domestic',
+        'searchType': 'search',
+        'searchword': '{keyword}',
+    },
+    pagination=PaginationSpec(param='recruitPage', max_pages=1),
+    card_selector='.item_recruit',
+    min_card_text=10,
+    scroll_count=3,
+    fields={
+        'title': FieldSpec(selectors=(
+            '.job_tit a', '.job_title a', '.item_title a',
+            'h1', 'h2', 'h3', 'h4', 'h5',
+            '.title', '.position-title',
+            '[class*="title"]', '[class*="position"]',
+            'strong', 'b', '.font-bold', '.font-medium',
+        ), min_length=4),
+        'url': FieldSpec(selectors=('.job_tit a', 'a'), attr='href'),
+        'company': FieldSpec(selectors=('.corp_name a', '.company_name', '.company', '.corp', '.employer')),
+        'location': FieldSpec(selectors=('.job_condition span',), index=0),
+        'experience': FieldSpec(selectors=('.job_condition span',), index=1),
+        'salary': FieldSpec(selectors=('.job_condition span',), index=2),
+        'deadline': FieldSpec(selectors=('.job_date .date',)),
+        'tags': FieldSpec(selectors=('.tag',), many=True, default=()),
+    },
+    post_processors=(first_line_title,),
+)
@@ -0,0 +1,25 @@
+from crawlers.base.spec import FieldSpec, PaginationSpec, SiteSpec
+
+SPEC = SiteSpec(
+    name='securityfarm',
+    query={
+        'search': '{keyword}',
+        'category': 'all',
+    },
+    pagination=PaginationSpec(param='page'),
+    # 카드 목록이 클라이언트 렌더링이라 데이터 API 가 있으면 그쪽을 씀
+    api_capture=True,
+    card_selector='div.shadow-card-sm',
+    detect_cards=True,
+    scroll_count=3,
+    fields={
+        # 카드에 직접 href 가 없어 URL 은 비워 둠
+        'url': FieldSpec(),
+        'title': FieldSpec(selectors=(r'span.text-base.sm\:text-lg',)),
+        'company': FieldSpec(selectors=(r'span.text-sm.sm\:text-base.text-neutral-700',)),
+        'location': FieldSpec(selectors=('div.flex.flex-row.items-center.gap-1.text-gray-600',), index=0),
+        'experience': FieldSpec(selectors=('div.flex.flex-row.items-center.gap-1.text-gray-600',), index=1),
+        'deadline': FieldSpec(selectors=('span.text-red-500, span.text-emerald-700',)),
+        'tags': FieldSpec(many=True, default=()),
+    },
+)
@@ -0,0 +1,31 @@
+from config.sites_config import SITES_CONFIG
+from crawlers.base.spec import FieldSpec, PaginationSpec, SiteSpec
+
+# 제목/URL 은 같은 링크에서 (구/신 화면 모두 대응)
+TITLE_LINKS = (
+    'td.al_left.pd24 div div:nth-child(2) a',
+    'a[href*="/empDetailAuthView.do"]',
+    'a[href*="/empInfo/"]',
+    'td a',
+)
+
+SPEC = SiteSpec(
+    name='worknet',
+    query={
+        'searchCondition': '1',
+        'searchKeyword': '{keyword}',
+        'orderType': '1',
+    },
+    pagination=PaginationSpec(param='pageIndex', max_pages=1),
+    card_selector=SITES_CONFIG['worknet']['selectors']['job_list'],
+    fields={
+        'title': FieldSpec(selectors=TITLE_LINKS),
+        'company': FieldSpec(selectors=('.cp-company-name a', '.cp-company-name')),
+        'location': FieldSpec(selectors=('.cp-company-info .cp-area',)),
+        'experience': FieldSpec(selectors=('.cp-company-info .cp-career',)),
+        'salary': FieldSpec(selectors=('.cp-company-info .cp-salary',)),
+        'deadline': FieldSpec(selectors=('.cp-date',)),
+        'url': FieldSpec(selectors=TITLE_LINKS, attr='href'),
+        'tags': FieldSpec(selectors=('.cp-keyword span',), many=True, default=()),
+    },
+)
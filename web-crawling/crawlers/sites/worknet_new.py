@@ -0,0 +1,23 @@
+from config.sites_config import SITES_CONFIG
+from crawlers.base.spec import FieldSpec, PaginationSpec, SiteSpec
+
+SELECTORS = SITES_CONFIG['worknet_new']['selectors']
+
+SPEC = SiteSpec(
+    name='worknet_new',
+    # 검색 폼을 search_path 로 직접 POST (나머지 필드는 SITES_CONFIG search_params 기본값)
+    fetch='form',
+    query={'srcKeyword': '{keyword}'},
+    pagination=PaginationSpec(param='pageIndex'),
+    card_selector=SELECTORS['job_list'],
+    fields={
+        'title': FieldSpec(selectors=(SELECTORS['title'],)),
+        'url': FieldSpec(selectors=(SELECTORS['url'],), attr='href'),
+        'company': FieldSpec(selectors=(SELECTORS['company'], '.cp-company-name')),
+        'location': FieldSpec(selectors=(SELECTORS['location'],)),
+        'experience': FieldSpec(selectors=(SELECTORS['experience'],)),
+        'salary': FieldSpec(selectors=(SELECTORS['salary'],)),
+        'deadline': FieldSpec(selectors=(SELECTORS['deadline'],)),
+        'tags': FieldSpec(many=True, default=()),
+    },
+)
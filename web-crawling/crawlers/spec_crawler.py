@@ -0,0 +1,301 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+import asyncio
+
+import aiohttp
+import lxml.html
+
+from config.settings import settings
+from config.sites_config import SITES_CONFIG, GLOBAL_CONFIG
+from crawlers.base import api_capture, form_replay, waits
+from crawlers.base.api_capture import ApiEndpoint, api_endpoints
+from crawlers.base.engine import compile_spec
+from crawlers.base.form_replay import FormReplay
+from crawlers.base.spec import SiteSpec
+from crawlers.base.static_element import LxmlElement
+from crawlers.base.waits import timed_wait
+from crawlers.base_crawler import BaseCrawler
+from utils.http_cache import http_cache
+from utils.rate_limiter import site_rate_limiter
+from utils.serialization import DecodeError, loads
+from utils.snapshot_store import snapshot_store
+
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/119.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+HTTP_CONNECTIONS_PER_HOST = 4
+AUTH_FAILURES = (401, 403)
+
+
+class SpecCrawler(BaseCrawler):
+    """SiteSpec 하나로 동작하는 공용 크롤러
+
+    사이트마다 Selenium 클래스를 두지 않고, 페이지를 가져오는 방식(fetch)만 다르게
+    한 뒤 추출은 모두 컴파일된 정적 엔진(crawlers.base.engine)이 담당합니다.
+    브라우저는 페이지당 page_source 를 한 번 읽는 데만 씁니다.
+
+    fetch='form' 사이트는 검색 폼을 HTTP POST 로 직접 제출하고(crawlers.base.form_replay),
+    api_capture 사이트는 목록 JSON API 템플릿(crawlers.base.api_capture)이 있으면 HTML
+    대신 그 API 를 페이지당 한 번씩 호출하고, 브라우저는 템플릿을 찾거나 갱신할 때만 씁니다.
+    """
+
+    def __init__(self, spec: SiteSpec):
+        super().__init__(spec.name, SITES_CONFIG[spec.name])
+        self.spec = spec
+        self.extractor = compile_spec(spec)
+
+    @property
+    def base_url(self) -> str:
+        # 실행 중 설정 변경(모의 서버 등)을 반영하도록 매번 읽음
+        return self.site_config['base_url']
+
+    def build_url(self, keyword: str, page: Optional[int] = None) -> str:
+        url = f"{self.base_url}{self.site_config['search_path']}"
+        if not keyword:
+            return url
+        params = {name: value.format(keyword=keyword) for name, value in self.spec.query.items()}
+        if page is not None and self.spec.pagination and page != self.spec.pagination.start:
+            params[self.spec.pagination.param] = page
+        return f"{url}?{urlencode(params)}"
+
+    def form_fields(self, keyword: str, page: int) -> Dict[str, Any]:
+        """검색 폼 제출 필드 (search_params 기본값 + 명세 query + 페이지)"""
+        fields = dict(self.site_config.get('search_params', {}))
+        fields.update({name: value.format(keyword=keyword) for name, value in self.spec.query.items()})
+        if self.spec.pagination:
+            fields[self.spec.pagination.param] = page
+        return fields
+
+    def page_numbers(self, max_pages: Optional[int] = None) -> range:
+        """요청할 페이지 번호 (지정이 없으면 SITES_CONFIG max_pages 까지, 그 값을 넘지 않음)"""
+        pagination = self.spec.pagination
+        if pagination is None:
+            return range(1)
+        site_limit = self.site_config.get('max_pages', 1)
+        limit = min(max_pages or pagination.max_pages or site_limit, site_limit)
+        return range(pagination.start, pagination.start + max(1, limit))
+
+    def _load_with_driver(self, url: str) -> str:
+        driver = self.driver
+        driver.get(url)
+        ready = self.spec.ready_selector or self.spec.card_selector
+        wait_time = self.site_config.get('wait_time', 10)
+        # 고정 sleep 없이: 목록 요소 → DOM 안정 → (무한 스크롤) 카드 수 안정
+        if not timed_wait(self.site_name, 'ready', wait_time,
+                          lambda timeout: waits.wait_for_selector(driver, ready, timeout)):
+            self.logger.warning(f"요소를 찾을 수 없음: {ready}")
+            snapshot_store.capture(self.site_name, driver, reason='timeout')
+            return ''
+        # DOM 이 계속 바뀌는 페이지(배너 등)도 그대로 진행하므로 타임아웃을 늘리지 않음
+        timed_wait(self.site_name, 'dom_quiet', wait_time,
+                   lambda timeout: waits.wait_for_dom_quiet(driver, timeout=timeout), escalate=False)
+        if self.spec.scroll_count and self.site_config.get('scroll_enabled', True):
+            waits.scroll_until_stable(driver, self.spec.card_selector or ready, max_scrolls=self.spec.scroll_count)
+        html = driver.page_source
+        # 디버깅/벤치마크용 페이지 스냅샷 (샘플링, 백그라운드 저장)
+        if snapshot_store.should_capture():
+            snapshot_store.save(self.site_name, html, url=url)
+        return html
+
+    async def _load_with_http(self, url: str) -> str:
+        ttl = self.site_config.get('cache_ttl', GLOBAL_CONFIG['cache_ttl']['job_posts'])
+        async with aiohttp.ClientSession() as session:
+            response = await http_cache.fetch(session, url, headers=HTTP_HEADERS, ttl=ttl, timeout=30)
+        if response.status != 200:
+            self.logger.warning(f"HTTP 요청 실패: {response.status} {url}")
+            return ''
+        if response.from_cache:
+            self.logger.info(f"HTTP 캐시 사용 ({response.source}): {url}")
+        return response.text()
+
+    async def fetch_page(self, url: str) -> str:
+        if self.spec.fetch == 'http':
+            return await self._load_with_http(url)
+        return await asyncio.to_thread(self._load_with_driver, url)
+
+    def extract_page(self, html: str) -> List[Dict[str, Any]]:
+        return list(self.extractor.extract_page(html, self.base_url))
+
+    def is_valid_job_posting(self, job: Dict[str, Any]) -> bool:
+        title = job.get('title', '').strip().lower()
+        return not any(keyword.lower() in title for keyword in self.spec.exclude_title_keywords)
+
+    async def _iter_dom_pages(self, keyword: str, max_pages: Optional[int]) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """(페이지 번호, 카드 추출 결과) — 브라우저/HTTP 로 받은 HTML 에서"""
+        for index, page in enumerate(self.page_numbers(max_pages)):
+            if index:
+                await self.delay()
+            url = self.build_url(keyword, page)
+            self.logger.info(f"{self.site_name} 크롤링: {url}")
+
+            html = await self.fetch_page(url)
+            jobs = self.extract_page(html)
+            self.logger.info(f"{self.site_name}: {page}페이지 {len(jobs)}개 카드 추출")
+            yield page, jobs
+            if not jobs:
+                break
+
+    async def _submit_form(self, form: FormReplay, session: aiohttp.ClientSession,
+                           keyword: str, page: int) -> Tuple[int, str]:
+        await site_rate_limiter(self.site_name, self.site_config).wait()
+        return await form.submit(session, self.form_fields(keyword, page))
+
+    async def _iter_form_pages(self, keyword: str, max_pages: Optional[int]) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """(페이지 번호, 카드 추출 결과) — 검색 폼을 풀링된 세션으로 직접 POST
+
+        세션 쿠키/CSRF 토큰은 폼 페이지를 HTTP 로 한 번 받아 얻고, 검색이 거부되면
+        브라우저로 폼 페이지를 한 번 열어 받은 쿠키/토큰으로 다시 제출합니다.
+        """
+        form = FormReplay(self.base_url, self.site_config['form_path'], self.site_config['search_path'], HTTP_HEADERS)
+        connector = aiohttp.TCPConnector(limit_per_host=HTTP_CONNECTIONS_PER_HOST)
+        timeout = aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT)
+        # 모의 서버(IP 호스트)에서도 세션 쿠키를 유지하도록 unsafe 쿠키 저장소
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         cookie_jar=aiohttp.CookieJar(unsafe=True)) as session:
+            await site_rate_limiter(self.site_name, self.site_config).wait()
+            await form.bootstrap(session)
+            for page in self.page_numbers(max_pages):
+                status, html = await self._submit_form(form, session, keyword, page)
+                if status != 200 and form.source == 'http':
+                    self.logger.info(f"{self.site_name} 검색 거부({status}): 브라우저로 폼 세션 갱신")
+                    try:
+                        state = await asyncio.to_thread(form_replay.browser_state, self.driver, form.form_url)
+                    except Exception as e:
+                        self.logger.warning(f"{self.site_name} 브라우저 폼 세션 실패: {e}")
+                    else:
+                        form.apply_browser_state(session, *state)
+                        status, html = await self._submit_form(form, session, keyword, page)
+                if status != 200:
+                    self.logger.warning(f"{self.site_name} 검색 POST 실패: {status}")
+                    break
+
+                jobs = self.extract_page(html)
+                self.logger.info(f"{self.site_name}: {page}페이지 {len(jobs)}개 카드 추출 (폼 POST)")
+                yield page, jobs
+                if not jobs:
+                    break
+
+    def _discovery_driver(self):
+        """성능 로그를 켠 드라이버 (일반 목록 세션은 로그 없이 띄우므로 필요하면 다시 띄움)"""
+        if self._driver is None or not self._network_log:
+            self.close_driver()
+            self.setup_driver(network_log=True)
+        return self._driver
+
+    async def _api_endpoint(self, keyword: str, refresh: bool = False) -> Optional[ApiEndpoint]:
+        """저장된 API 템플릿 (없거나 refresh 면 브라우저로 한 번 탐색)"""
+        if not refresh:
+            endpoint = api_endpoints.get(self.site_name, self.base_url)
+            if endpoint is not None or api_endpoints.known_missing(self.site_name, self.base_url):
+                return endpoint
+        pagination = self.spec.pagination
+        try:
+            endpoint = await asyncio.to_thread(
+                api_capture.discover, self._discovery_driver(), self.build_url(keyword), keyword,
+                pagination.param if pagination else None,
+            )
+        except Exception as e:
+            # 브라우저를 못 띄운 경우 등은 '없음' 으로 기록하지 않고 다음 크롤링에서 다시 시도
+            self.logger.warning(f"{self.site_name} API 탐색 실패: {e}")
+            return None
+        api_endpoints.put(self.site_name, self.base_url, endpoint)
+        return endpoint
+
+    async def _fetch_api_page(self, session: aiohttp.ClientSession, endpoint: ApiEndpoint,
+                              keyword: str, index: int) -> Tuple[int, Any]:
+        await site_rate_limiter(self.site_name, self.site_config).wait()
+        async with session.request(**endpoint.request(keyword, index), headers=endpoint.headers) as response:
+            if response.status != 200:
+                return response.status, None
+            try:
+                return response.status, loads(await response.read())
+            except DecodeError:
+                return response.status, None
+
+    def _api_job(self, endpoint: ApiEndpoint, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        job = endpoint.to_job(item, self.base_url)
+        for processor in self.spec.post_processors:
+            job = processor(job, '')
+            if job is None:
+                return None
+        return job
+
+    async def _iter_api_pages(self, endpoint: ApiEndpoint, keyword: str,
+                              max_pages: Optional[int]) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """(페이지 번호, 공고) — 목록 JSON API 를 풀링된 세션으로 직접 호출
+
+        인증 거부(401/403)면 브라우저로 템플릿을 한 번 갱신하고, 첫 페이지부터 실패하면 HTML 경로로 대체.
+        """
+        refreshed = fallback = False
+        connector = aiohttp.TCPConnector(limit_per_host=HTTP_CONNECTIONS_PER_HOST)
+        timeout = aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            for index, page in enumerate(self.page_numbers(max_pages)):
+                status, data = await self._fetch_api_page(session, endpoint, keyword, index)
+                if status in AUTH_FAILURES and not refreshed:
+                    refreshed = True
+                    self.logger.info(f"{self.site_name} API 인증 거부({status}): 브라우저로 템플릿 갱신")
+                    endpoint = await self._api_endpoint(keyword, refresh=True)
+                    if endpoint is not None:
+                        status, data = await self._fetch_api_page(session, endpoint, keyword, index)
+                if data is None:
+                    self.logger.warning(f"{self.site_name} API 응답 실패: {status}")
+                    fallback = index == 0
+                    break
+
+                items = endpoint.items(data)
+                jobs = [job for job in (self._api_job(endpoint, item) for item in items) if job]
+                self.logger.info(f"{self.site_name}: API {page}페이지 {len(items)}개 항목")
+                yield page, jobs
+                if not items or not endpoint.page_param:
+                    break
+
+        if fallback:
+            async for page, jobs in self._iter_dom_pages(keyword, max_pages):
+                yield page, jobs
+
+    async def iter_jobs(self, keyword: str, max_pages: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """키워드 검색 결과를 페이지 순서대로 추출되는 즉시 하나씩 생성"""
+        count = 0
+        endpoint = await self._api_endpoint(keyword) if self.spec.api_capture and keyword else None
+        if endpoint is not None:
+            pages = self._iter_api_pages(endpoint, keyword, max_pages)
+        elif self.spec.fetch == 'form':
+            pages = self._iter_form_pages(keyword, max_pages)
+        else:
+            pages = self._iter_dom_pages(keyword, max_pages)
+
+        async for _, jobs in pages:
+            for job in jobs:
+                if not (self.validate_job_data(job) and self.is_valid_job_posting(job)):
+                    continue
+                yield job
+                count += 1
+                if count >= self.spec.max_jobs:
+                    break
+            if count >= self.spec.max_jobs:
+                break
+
+        self.logger.info(f"{self.site_name}: 총 {count}개 채용공고 수집 완료")
+
+    async def crawl(self, options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """main.py에서 호출되는 메인 크롤링 메서드"""
+        options = options or {}
+        keyword = options.get('keyword', 'React')
+        try:
+            jobs = [job async for job in self.iter_jobs(keyword, options.get('max_pages'))]
+            self.logger.info(f"{self.site_name} 크롤링 완료: {len(jobs)}개")
+            return jobs
+        finally:
+            self.close_driver()
+
+    def extract_job_data(self, element) -> Optional[Dict[str, Any]]:
+        """카드 요소 하나 추출 (lxml 요소 또는 StaticElement/WebElement 의 outerHTML)"""
+        if isinstance(element, LxmlElement):
+            element = element.element
+        elif not isinstance(element, lxml.html.HtmlElement):
+            element = lxml.html.fragment_fromstring(element.get_attribute('outerHTML'))
+        return self.extractor.extract_card(element, self.base_url)
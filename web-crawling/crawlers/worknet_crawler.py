@@ -1,185 +0,0 @@
-from crawlers.base_crawler import BaseCrawler
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from config.sites_config import SITES_CONFIG
-from utils.logger import setup_logger
-import time
-
-logger = setup_logger()
-
-class WorknetCrawler(BaseCrawler):
-    def __init__(self):
-        super().__init__('worknet', SITES_CONFIG['worknet'])
-        self.base_url = SITES_CONFIG['worknet']['base_url']
-        self.selectors = SITES_CONFIG['worknet']['selectors']
-    
-    async def crawl(self, options=None):
-        """main.py에서 호출되는 메인 크롤링 메서드"""
-        if options is None:
-            options = {}
-
-        try:
-            # 기존 crawl_with_keyword 메서드 활용
-            keyword = options.get('keyword', 'React')
-            jobs = await self.crawl_with_keyword(keyword)
-
-            logger.info(f"워크넷 크롤링 완료: {len(jobs)}개")
-            return jobs
-
-        except Exception as e:
-            logger.error(f"워크넷 크롤링 실패: {e}")
-            raise
-
-    async def crawl_with_keyword(self, keyword: str) -> list:
-        max_jobs = 50
-        
-        jobs = []
-        
-        try:
-            
-            # 워크넷 검색 URL 구성
-            if keyword:
-                search_params = {
-                    'searchCondition': '1',
-                    'searchKeyword': keyword,
-                    'orderType': '1'
-                }
-                params_str = '&'.join([f"{k}={v}" for k, v in search_params.items() if v])
-                url = f"{self.base_url}{self.site_config['search_path']}?{params_str}"
-            else:
-                url = f"{self.base_url}{self.site_config['search_path']}"
-            
-            logger.info(f"워크넷 크롤링 시작: {url}")
-            
-            self.driver.get(url)
-            time.sleep(4)  # 워크넷은 로딩이 좀 더 걸림
-            
-            # 채용공고 리스트 대기
-            job_list_element = await self.wait_and_find_element(By.CSS_SELECTOR, self.selectors['job_list'])
-            if not job_list_element:
-                logger.warning("워크넷: 채용공고 목록을 찾을 수 없습니다.")
-                return jobs
-            
-            # 모든 채용공고 요소 찾기
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, self.selectors['job_list'])
-            logger.info(f"워크넷: {len(job_elements)}개 채용공고 발견")
-            
-            for i, element in enumerate(job_elements[:max_jobs]):
-                try:
-                    raw_data = self.extract_job_data(element)
-                    if raw_data and raw_data.get('title') and raw_data.get('company'):
-                        normalized_data = self.normalize_data(raw_data)
-                        jobs.append(normalized_data)
-                        logger.debug(f"워크넷: {i+1}번째 공고 추출 완료 - {raw_data.get('title')}")
-                    
-                except Exception as e:
-                    logger.warning(f"워크넷: {i+1}번째 공고 추출 실패 - {e}")
-                    continue
-            
-            logger.info(f"워크넷: 총 {len(jobs)}개 채용공고 수집 완료")
-            
-        except Exception as e:
-            logger.error(f"워크넷 크롤링 실패: {e}")
-            raise
-        
-        finally:
-            self.close_driver()
-            await self.delay()
-        
-        return jobs
-    
-    def extract_job_data(self, element):
-        """개별 채용공고 데이터 추출"""
-        try:
-            # HTML 구조 디버깅
-            logger.info(f"워크넷 요소 HTML: {element.get_attribute('outerHTML')[:500]}...")
-
-            # 가능한 모든 a 태그 찾기
-            all_links = element.find_elements(By.TAG_NAME, 'a')
-            logger.info(f"워크넷 요소 내 a 태그 개수: {len(all_links)}")
-            for i, link in enumerate(all_links):
-                logger.info(f"워크넷 a태그 {i}: {link.get_attribute('href')} - {link.text[:50]}")
-
-            # 제목과 URL - 여러 셀렉터 시도
-            title_elem = None
-            selectors_to_try = [
-                'td.al_left.pd24 div div:nth-child(2) a',
-                'a[href*="/empDetailAuthView.do"]',
-                'a[href*="/empInfo/"]',
-                'a',
-                'td a'
-            ]
-
-            for selector in selectors_to_try:
-                try:
-                    title_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    logger.info(f"워크넷 성공한 셀렉터: {selector}")
-                    break
-                except:
-                    logger.info(f"워크넷 실패한 셀렉터: {selector}")
-                    continue
-
-            title = title_elem.text.strip() if title_elem else ''
-            url = title_elem.get_attribute('href') if title_elem else ''
-            
-            # 회사명
-            try:
-                company_elem = element.find_element(By.CSS_SELECTOR, '.cp-company-name a')
-                company = company_elem.text.strip() if company_elem else ''
-            except NoSuchElementException:
-                # 대체 선택자 시도
-                try:
-                    company_elem = element.find_element(By.CSS_SELECTOR, '.cp-company-name')
-                    company = company_elem.text.strip() if company_elem else ''
-                except NoSuchElementException:
-                    company = ''
-            
-            # 위치 정보
-            try:
-                location_elem = element.find_element(By.CSS_SELECTOR, '.cp-company-info .cp-area')
-                location = location_elem.text.strip() if location_elem else ''
-            except NoSuchElementException:
-                location = ''
-            
-            # 경력 정보
-            try:
-                experience_elem = element.find_element(By.CSS_SELECTOR, '.cp-company-info .cp-career')
-                experience = experience_elem.text.strip() if experience_elem else ''
-            except NoSuchElementException:
-                experience = ''
-            
-            # 급여 정보
-            try:
-                salary_elem = element.find_element(By.CSS_SELECTOR, '.cp-company-info .cp-salary')
-                salary = salary_elem.text.strip() if salary_elem else ''
-            except NoSuchElementException:
-                salary = ''
-            
-            # 마감일
-            try:
-                deadline_elem = element.find_element(By.CSS_SELECTOR, '.cp-date')
-                deadline = deadline_elem.text.strip() if deadline_elem else ''
-            except NoSuchElementException:
-                deadline = ''
-            
-            # 키워드 태그
-            try:
-                tag_elements = element.find_elements(By.CSS_SELECTOR, '.cp-keyword span')
-                tags = [tag.text.strip() for tag in tag_elements if tag.text.strip()]
-            except NoSuchElementException:
-                tags = []
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'experience': experience,
-                'salary': salary,
-                'deadline': deadline,
-                'url': url,
-                'tags': tags
-            }
-            
-        except Exception as e:
-            logger.warning(f"워크넷: 데이터 추출 실패 - {e}")
-            return None
\ No newline at end of file
@@ -1,19 +1,26 @@
 import os
+import asyncio
+import gzip
+import hashlib
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
 from dotenv import load_dotenv
 from utils.logger import setup_logger
-from motor.motor_asyncio import AsyncIOMotorClient
+from utils.serialization import dumps, loads
 
 logger = setup_logger("mongodb")
 
 class MongoDBClient:
+    """connect() 를 호출할 때 Motor 클라이언트 생성 (임포트 시점에는 연결하지 않음)"""
+
     def __init__(self):
         self.client = None
         self.db = None
-        self.connect()
 
     def connect(self):
         try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+
             # 환경 변수에서 MONGO_URI를 읽어옵니다.
             # 환경 변수가 없으면 기본값으로 'mongodb://mongo:27017'를 사용합니다.
             mongo_uri = os.getenv("MONGO_URI", "mongodb://mongo:27017")
@@ -28,36 +35,147 @@ mongo_client = MongoDBClient()
 
 load_dotenv()
 
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 200))
+BULK_MAX_CONCURRENCY = int(os.getenv("BULK_MAX_CONCURRENCY", 4))
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
 class MongoDBConnector:
-    def __init__(self):
+    """서버 /jobs/bulk 전송기
+
+    공고를 chunk_size 단위로 나눠 gzip 압축 후 하나의 커넥션 풀에서 동시에 보내고,
+    청크별로 재시도합니다. 청크 본문 해시를 Idempotency-Key 로 보내므로 재시도된
+    청크를 서버가 식별할 수 있습니다 (서버 측 upsert 라 중복 반영되지도 않음).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+        max_retries: int = 5,
+        base_delay: float = 2,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.server_api_url = os.getenv("SERVER_API_URL", "http://localhost:3000/api")
         self.internal_api_token = os.getenv("INTERNAL_API_TOKEN")
+        self.chunk_size = max(1, chunk_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.timeout = timeout
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.server_api_url,
+            headers={
+                "Content-Type": "application/json",
+                "x-internal-token": self.internal_api_token or "",
+            },
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            transport=self.transport,
+        )
+
+    async def connect(self):
+        """현재 이벤트 루프에서 재사용할 커넥션 풀 생성"""
+        if self._client is None:
+            self._client = self._new_client()
+            self._client_loop = asyncio.get_running_loop()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    @staticmethod
+    def encode_chunk(chunk: List[Dict[str, Any]]) -> Tuple[bytes, str]:
+        """청크 → (gzip 본문, 멱등 키)"""
+        raw = dumps({"jobs": chunk})
+        return gzip.compress(raw, compresslevel=6), hashlib.sha256(raw).hexdigest()
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.base_delay * (2 ** attempt)
+
+    async def _send_chunk(
+        self,
+        client: httpx.AsyncClient,
+        index: int,
+        chunk: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, int]:
+        body, idempotency_key = self.encode_chunk(chunk)
+        headers = {"Content-Encoding": "gzip", "Idempotency-Key": idempotency_key}
+
+        async with semaphore:
+            for attempt in range(self.max_retries):
+                response = None
+                try:
+                    response = await client.post("/jobs/bulk", content=body, headers=headers)
+                    response.raise_for_status()
+                    data = loads(response.content).get("data", {})
+                    logger.info(f"청크 {index} 전송 완료: {len(chunk)}개 ({len(body)} bytes)")
+                    return {
+                        "created": int(data.get("created", 0)),
+                        "updated": int(data.get("updated", 0)),
+                        "failed": int(data.get("failed", 0)),
+                    }
+                except httpx.HTTPStatusError as e:
+                    logger.error(f"청크 {index} HTTP 오류: {e.response.status_code} - {e.response.text[:200]}")
+                    if e.response.status_code not in RETRYABLE_STATUS:
+                        break
+                except (httpx.RequestError, ValueError) as e:
+                    logger.error(f"청크 {index} 요청 오류: {e}")
+
+                if attempt < self.max_retries - 1:
+                    delay = self._retry_delay(attempt, response)
+                    logger.warning(f"청크 {index} 재시도 대기 {delay}초 ({attempt + 1}/{self.max_retries})")
+                    await asyncio.sleep(delay)
+
+        logger.error(f"청크 {index} 전송 최종 실패: {len(chunk)}개")
+        return {"created": 0, "updated": 0, "failed": len(chunk)}
 
     async def send_jobs_to_server(self, jobs_data: list):
+        """공고 전송 후 서버 응답 형식으로 집계 반환 (전부 실패하면 None)"""
         if not self.internal_api_token:
             logger.error("INTERNAL_API_TOKEN is not set. Cannot send data to server.")
             return
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-internal-token": self.internal_api_token,
-        }
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.server_api_url}/jobs/bulk",
-                    json={"jobs": jobs_data},
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                logger.info(f"Successfully sent {len(jobs_data)} jobs to the server.")
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
-            except httpx.RequestError as e:
-                logger.error(f"An error occurred while requesting {e.request.url!r}: {e}")
+        if not jobs_data:
+            return {"success": True, "data": {"created": 0, "updated": 0, "failed": 0, "total": 0}}
+
+        chunks = [jobs_data[i:i + self.chunk_size] for i in range(0, len(jobs_data), self.chunk_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # connect() 로 만든 풀은 같은 이벤트 루프에서만 재사용
+        shared = self._client is not None and self._client_loop is asyncio.get_running_loop()
+        client = self._client if shared else self._new_client()
+        try:
+            results = await asyncio.gather(*[
+                self._send_chunk(client, index, chunk, semaphore)
+                for index, chunk in enumerate(chunks)
+            ])
+        finally:
+            if not shared:
+                await client.aclose()
+
+        totals = {key: sum(result[key] for result in results) for key in ("created", "updated", "failed")}
+        totals["total"] = len(jobs_data)
+        logger.info(f"Sent {len(jobs_data)} jobs to the server in {len(chunks)} chunks: {totals}")
+
+        if totals["failed"] >= len(jobs_data):
+            return None
+        return {"success": totals["failed"] == 0, "data": totals}
 
 # Create a single instance to be used throughout the application
-mongodb_connector = MongoDBConnector()
\ No newline at end of file
+mongodb_connector = MongoDBConnector()
@@ -11,5 +11,6 @@ db.job_postings.createIndex({ "category": 1 });
 db.job_postings.createIndex({ "experience_level": 1 });
 db.job_postings.createIndex({ "scraped_at": 1 });
 db.job_postings.createIndex({ "quality_score": 1 });
+db.job_postings.createIndex({ "ai_score_hash": 1 });
 
 print('MongoDB 초기화 완료 - 컬렉션 및 인덱스 생성됨');
\ No newline at end of file
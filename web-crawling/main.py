@@ -1,35 +1,40 @@
 import asyncio
 import argparse
 # from curses import raw
-import json
 import time
-from typing import Dict, List, Any
-from crawlers.saramin_crawler import SaraminCrawler
-from crawlers.worknet_crawler import WorknetCrawler
-from crawlers.worknet_new_crawler import WorknetNewCrawler
-from crawlers.comento_crawler import ComentoCrawler
-from crawlers.securityfarm_crawler import SecurityfarmCrawler
+from typing import Dict, List, Any, Optional
+from crawlers.registry import create_crawler, enabled_sites
+from crawlers.manager.pipeline import CrawlPipeline
 from processors.data_normalizer import DataNormalizer
+from processors.trend_aggregator import TrendAggregator
+from processors.job_record import posting_id
 from database.mongo_client import mongo_client
 from utils.logger import setup_logger
+from utils.output_sinks import JobSink, open_sink
+from utils.serialization import dump_file
 
 logger = setup_logger()
 
+# 'worknet_new' 는 ENABLE_WORKNET_NEW=true 일 때만 포함
+MANAGED_SITES = enabled_sites()
+
 class CrawlingManager:
-    def __init__(self):
+    def __init__(self, sites: Optional[List[str]] = None):
         try:
-            self.crawlers = {
-                'saramin': SaraminCrawler(),
-                'worknet': WorknetCrawler(),
-                # 'worknet_new': WorknetNewCrawler(),  # 임시 비활성화
-                'comento': ComentoCrawler(),
-                'securityfarm': SecurityfarmCrawler(),
-            }
+            self.sites = sites or MANAGED_SITES
+            # 크롤러(와 Selenium/AI 모듈)는 해당 사이트를 처음 크롤링할 때 생성
+            self.crawlers = {}
             self.normalizer = DataNormalizer()
+            self.trends = TrendAggregator()
             logger.info("CrawlingManager 초기화 완료")
         except Exception as e:
             logger.error(f"CrawlingManager 초기화 실패: {e}")
             raise
+
+    def get_crawler(self, site_name: str):
+        if site_name not in self.crawlers:
+            self.crawlers[site_name] = create_crawler(site_name)
+        return self.crawlers[site_name]
         
     def _init_results(self) -> Dict[str, Any]:
         return {
@@ -49,41 +54,48 @@ class CrawlingManager:
         results['total']['processed'] += site_result.get('processed', 0)
         results['total']['saved'] += site_result.get('saved', 0)
     
-    async def crawl_all(self, options: Dict[str, Any]) -> Dict[str, Any]:
-        """모든 사이트 크롤링"""
+    async def crawl_all(self, options: Dict[str, Any], sink: Optional[JobSink] = None) -> Dict[str, Any]:
+        """모든 사이트 크롤링 (sink 가 있으면 정규화된 공고를 즉시 기록)
+
+        사이트마다 CrawlPipeline 을 돌려 공고를 배치 단위로 흘려보내므로, 사이트 전체의
+        원본/정규화 공고 리스트를 메모리에 쌓지 않습니다. 마지막 단계에서 품질 점수를
+        거른 배치를 sink 에 기록하고 save_jobs 로 저장합니다.
+        """
         logger.info("통합 크롤링 시작...")
         results = self._init_results()
         
-        sites = options.get('sites', ['saramin', 'worknet_new', 'comento', 'securityfarm'])
+        sites = options.get('sites', self.sites)
+        keyword = options.get('keyword', 'React')
+        max_jobs = options.get('max_jobs')
             
         for site_name in sites:
-            if site_name not in self.crawlers:
+            if site_name not in self.sites:
                 logger.warning(f"지원하지 않는 사이트: {site_name}")
                 continue
                 
             try:
                 logger.info(f"{site_name} 크롤링 시작...")
-                crawler = self.crawlers[site_name]
-                raw_jobs = await crawler.crawl(options)
-                
-                processed_jobs = []
-                for raw_job in raw_jobs:
-                    try:
-                        normalized_job = await self.normalizer.normalize(raw_job)
-                        if normalized_job.get('quality_score', 0) >= 0.01:
-                            processed_jobs.append(normalized_job)
-                    except Exception as e:
-                        logger.warning(f"데이터 처리 실패: {e}")
-                        results['total']['errors'] += 1
-                saved_count = await self.save_jobs(processed_jobs)
-            
-                site_result = {
-                    'crawled': len(raw_jobs),
-                    'processed': len(processed_jobs),
-                    'saved': saved_count
-                }
+                site_result = {'crawled': 0, 'processed': 0, 'saved': 0}
+
+                async def save_batch(batch: List[Dict[str, Any]]) -> int:
+                    processed_jobs = [job for job in batch if (job.get('quality_score') or 0) >= 0.01]
+                    if sink is not None:
+                        for job in processed_jobs:
+                            sink.write(job)
+                    site_result['processed'] += len(processed_jobs)
+                    site_result['saved'] += await self.save_jobs(processed_jobs)
+                    return len(processed_jobs)
+
+                pipeline = CrawlPipeline(
+                    {site_name: self.get_crawler(site_name)}, save_batch, normalizer=self.normalizer,
+                    max_jobs=max_jobs,
+                )
+                progress = await pipeline.run([keyword])
+                site_result['crawled'] = progress.get('crawled', 0)
+                results['total']['errors'] += progress.get('errors', 0)
+
                 self._update_results(results, site_name, site_result)
-                logger.info(f"{site_name}: {saved_count}개 저장 완료")
+                logger.info(f"{site_name}: {site_result['saved']}개 저장 완료")
             
             except Exception as e:
                 logger.error(f"통합 크롤링 실패: {e}")
@@ -130,15 +142,14 @@ class CrawlingManager:
         try:
             collection = mongo_client.get_collection('job_postings')
             saved_count = 0
+            new_jobs = []
             
             # 각 작업을 순차적으로 처리
             for job in jobs:
                 try:
                     # id가 없으면 임시로 생성
                     if 'id' not in job:
-                        import hashlib
-                        job_id = f"{job.get('title', '')}-{job.get('company', '')}"
-                        job['id'] = hashlib.md5(job_id.encode()).hexdigest()
+                        job['id'] = posting_id(job)
                     # Upsert (있으면 업데이트, 없으면 삽입)
                     result = await collection.update_one(
                         {'id': job['id']},  # 중복 확인 키
@@ -149,12 +160,16 @@ class CrawlingManager:
                     # 실제로 저장/업데이트되었는지 확인
                     if result.upserted_id or result.modified_count > 0:
                         saved_count += 1
+                    # 새로 삽입된 공고만 트렌드 롤업에 반영 (재수집 중복 집계 방지)
+                    if result.upserted_id:
+                        new_jobs.append(job)
                         
                 except Exception as e:
                     logger.warning(f"개별 채용공고 저장 실패: {e}")
                     continue  # 개별 실패시 다음 작업 계속
             
             logger.info(f"MongoDB 저장 완료: {saved_count}/{len(jobs)}")
+            await self.trends.update_from_jobs(new_jobs)
             return saved_count
             
         except Exception as e:
@@ -221,27 +236,25 @@ class CrawlingManager:
 async def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='SkillMap 크롤링 시스템')
-    parser.add_argument('--sites', default='saramin,worknet_new,comento,securityfarm', help='크롤링할 사이트')
+    parser.add_argument('--sites', default=','.join(MANAGED_SITES), help='크롤링할 사이트')
     parser.add_argument('--keyword', default='React', help='검색 키워드')
-    parser.add_argument('--category', default='IT/개발', help='직군 카테고리')
-    parser.add_argument('--experience', default='신입', help='경험 수준')
-    parser.add_argument('--max-jobs', type=int, default=50, help='최대 채용공고 수')
-    parser.add_argument('--output', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--max-jobs', type=int, default=50, help='사이트당 최대 채용공고 수')
+    parser.add_argument('--output', help='결과 저장 경로 (.json: 요약, .ndjson/.jsonl[.gz|.zst] 또는 .parquet: 정규화된 공고 스트리밍)')
+    parser.add_argument('--row-group-size', type=int, default=1000, help='Parquet row group 크기')
     
     args = parser.parse_args()
     
+    sink = open_sink(args.output, row_group_size=args.row_group_size) if args.output else None
     manager = CrawlingManager()
     
     options = {
         'sites': args.sites.split(','),
         'keyword': args.keyword,
-        'category': args.category,
-        'experience_level': args.experience,
         'max_jobs': args.max_jobs
     }
     
     try:
-        results = await manager.crawl_all(options)
+        results = await manager.crawl_all(options, sink=sink)
         
         print(f"\n크롤링 결과:")
         print(f"  총 크롤링: {results['total']['crawled']}개")
@@ -249,9 +262,10 @@ async def main():
         print(f"  저장완료: {results['total']['saved']}개")
         print(f"  오류발생: {results['total']['errors']}개")
         
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+        if sink is not None:
+            print(f"\n정규화된 공고 {sink.count}개가 {args.output}에 저장되었습니다.")
+        elif args.output:
+            dump_file(results, args.output, indent=True)
             print(f"\n결과가 {args.output}에 저장되었습니다.")
         
     except KeyboardInterrupt:
@@ -259,6 +273,8 @@ async def main():
     except Exception as e:
         logger.error(f"크롤링 실행 실패: {e}")
     finally:
+        if sink is not None:
+            sink.close()
         mongo_client.close()
 
 if __name__ == '__main__':
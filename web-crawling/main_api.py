@@ -1,14 +1,110 @@
-from fastapi import FastAPI
-from api_models import CrawlRequest
-from crawler_runner import run_crawler_sync
+from dataclasses import asdict
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from api_models import CrawlRequest, CrawlJobStatus
+from crawl_job_manager import CrawlJobManager, CrawlQueueFullError
+from crawlers.base.api_capture import api_endpoints
+from crawlers.base.card_detector import card_detector
+from crawlers.base.selector_plan import selector_stats
+from processors.trend_aggregator import TrendAggregator
+from utils.serialization import dumps, dumps_str
 
-app = FastAPI()
+
+class FastJSONResponse(JSONResponse):
+    """utils.serialization (orjson/msgspec) 으로 인코딩하는 JSON 응답"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+app = FastAPI(default_response_class=FastJSONResponse)
+crawl_jobs = CrawlJobManager()
+trend_aggregator = TrendAggregator()
+
+@app.on_event("shutdown")
+def shutdown_crawl_jobs():
+    crawl_jobs.shutdown(wait=False)
 
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
 
-@app.post("/crawl")
+@app.post("/crawl", response_model=CrawlJobStatus, status_code=202)
 def crawl_sites(request: CrawlRequest):
-    results = run_crawler_sync(request.sites, request.keywords)
-    return results
\ No newline at end of file
+    try:
+        state = crawl_jobs.submit(request.sites, request.keywords)
+    except CrawlQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return asdict(state)
+
+def _format_event(event: dict, sse: bool) -> str:
+    data = dumps_str(event)
+    if sse:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+@app.post("/crawl/stream")
+async def stream_crawl(request: CrawlRequest, http_request: Request):
+    """크롤링 진행 상황과 정규화된 공고를 NDJSON (또는 Accept: text/event-stream 이면 SSE) 로 스트리밍"""
+    try:
+        state = crawl_jobs.register_stream(request.sites, request.keywords)
+    except CrawlQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+    async def body():
+        async for event in crawl_jobs.stream(state):
+            yield _format_event(event, sse)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/crawl/{job_id}", response_model=CrawlJobStatus)
+def get_crawl_status(job_id: str):
+    state = crawl_jobs.get(job_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+    return asdict(state)
+
+@app.get("/metrics/selectors")
+def get_selector_metrics(site: Optional[str] = None):
+    """사이트/필드별 대체 선택자 적중 통계 (순서 조정·후순위 여부 포함)"""
+    snapshot = selector_stats.snapshot()
+    if site is None:
+        return snapshot
+    if site not in snapshot:
+        raise HTTPException(status_code=404, detail="No selector stats for site")
+    return {site: snapshot[site]}
+
+@app.get("/metrics/cards")
+def get_card_metrics():
+    """사이트별 구조 탐지로 찾은 카드 선택자와 탐지 당시 카드 수"""
+    return card_detector.snapshot()
+
+@app.get("/metrics/api-endpoints")
+def get_api_endpoint_metrics():
+    """SPA 사이트별로 찾은 목록 JSON API 템플릿 (없음 기록 포함)"""
+    return api_endpoints.snapshot()
+
+@app.get("/trends")
+async def get_trends(
+    group_by: str = "skill",
+    days: int = 30,
+    category: Optional[str] = None,
+    location: Optional[str] = None,
+    skill: Optional[str] = None,
+    limit: int = 50,
+):
+    return await trend_aggregator.get_trends(
+        group_by=tuple(group_by.split(",")),
+        days=days,
+        category=category,
+        location=location,
+        skill=skill,
+        limit=limit,
+    )
@@ -1,81 +1,83 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import re
+from processors.job_record import JobRecord
 from utils.logger import setup_logger
 from database.mongo_client import mongo_client
 
 logger = setup_logger()
 
 class DataNormalizer:
+    # 품질 점수 산정 필드 (필수 20점, 선택 10점, 키워드 풍부도 30점)
+    REQUIRED_FIELDS = ['job_title', 'company_name', 'job_category']
+    OPTIONAL_FIELDS = ['work_location', 'keywords', 'salary_range']
+
     def __init__(self):
         self.company_mapper = CompanyNameMapper()
         self.location_normalizer = LocationNormalizer()
         self.skills_normalizer = SkillsNormalizer()
         self.salary_normalizer = SalaryNormalizer()
     
-    async def normalize(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
-        """데이터 정규화 메인 메서드"""
-        normalized = raw_job.copy()
-        
+    async def normalize(self, raw_job: Union[Dict[str, Any], JobRecord]) -> Union[Dict[str, Any], JobRecord]:
+        """데이터 정규화 메인 메서드 (dict 를 넘기면 정규화 키 dict, JobRecord 면 같은 레코드 반환)"""
+        if isinstance(raw_job, JobRecord):
+            return await self.normalize_record(raw_job)
+        record = await self.normalize_record(JobRecord.from_raw(raw_job))
+        return record.to_dict()
+
+    async def normalize_record(self, record: JobRecord) -> JobRecord:
+        """JobRecord 를 복사 없이 제자리에서 정규화"""
         try:
             # 1. 회사명 정규화
-            if 'company_name' in normalized:
-                normalized['company_name'] = await self.company_mapper.normalize(
-                    normalized['company_name']
-                )
+            record.company_name = await self.company_mapper.normalize(record.company_name)
             
             # 2. 위치 정규화
-            if 'work_location' in normalized:
-                normalized['work_location'] = self.location_normalizer.normalize(
-                    normalized['work_location']
-                )
+            record.work_location = self.location_normalizer.normalize(record.work_location)
             
             # 3. 스킬/키워드 정규화
-            if 'keywords' in normalized:
-                normalized['keywords'] = self.skills_normalizer.normalize(
-                    normalized['keywords']
-                )
+            record.keywords = self.skills_normalizer.normalize(record.keywords)
             
             # 4. 급여 정규화
-            if 'salary_range' in normalized:
-                normalized['salary_range'] = self.salary_normalizer.normalize(
-                    normalized['salary_range']
-                )
+            if record.salary_range is not None:
+                record.salary_range = self.salary_normalizer.normalize(record.salary_range)
             
             # 5. 직군 분류 개선
-            normalized['job_category'] = await self.improve_job_categorization(normalized)
+            record.job_category = await self.improve_job_categorization(record)
             
             # 6. 품질 점수 계산
-            normalized['quality_score'] = self.calculate_quality_score(normalized)
-            
-            return normalized
+            record.quality_score = self.calculate_quality_score(record)
             
         except Exception as e:
             logger.error(f"데이터 정규화 실패: {e}")
-            return {**raw_job, 'quality_score': 0.3, 'normalization_error': str(e)}
+            record.quality_score = 0.3
+            record.extra['normalization_error'] = str(e)
+
+        return record
     
-    def calculate_quality_score(self, job: Dict[str, Any]) -> float:
+    def calculate_quality_score(self, job: Union[Dict[str, Any], JobRecord]) -> float:
         """데이터 품질 점수 계산"""
+        get = job.get if isinstance(job, dict) else lambda field, default=None: getattr(job, field, default)
         score = 0
         max_score = 0
         
         # 필수 필드 검사
-        required_fields = ['job_title', 'company_name', 'job_category']
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             max_score += 20
-            if job.get(field) and str(job[field]).strip():
+            if get(field) and str(get(field)).strip():
                 score += 20
         
         # 선택 필드 검사
-        optional_fields = ['work_location', 'keywords', 'salary_range']
-        for field in optional_fields:
+        for field in self.OPTIONAL_FIELDS:
             max_score += 10
-            value = job.get(field)
-            if value and (isinstance(value, list) and len(value) > 0 or value):
+            value = get(field)
+            if field == 'salary_range':
+                if has_salary_amount(value):
+                    score += 10
+            elif value and (isinstance(value, list) and len(value) > 0 or value):
                 score += 10
         
         # 키워드 풍부도
         max_score += 30
-        keywords = job.get('keywords', [])
+        keywords = get('keywords', [])
         if isinstance(keywords, list) and len(keywords) >= 3:
             score += 30
         elif isinstance(keywords, list) and len(keywords) >= 1:
@@ -83,8 +85,10 @@ class DataNormalizer:
         
         return min(score / max_score, 1.0) if max_score > 0 else 0.0
     
-    async def improve_job_categorization(self, job: Dict[str, Any]) -> str:
+    async def improve_job_categorization(self, job: Union[Dict[str, Any], JobRecord]) -> str:
         """AI를 사용한 더 정확한 직군 분류"""
+        if isinstance(job, JobRecord):
+            job = {'job_title': job.job_title, 'keywords': job.keywords, 'job_category': job.job_category or '기타'}
         context = ' '.join([
             job.get('job_title', ''),
             ' '.join(job.get('keywords', [])),
@@ -233,9 +237,28 @@ class SkillsNormalizer:
         
         return normalized
 
+def has_salary_amount(salary_range: Any) -> bool:
+    """급여에 금액 정보가 있는지 (정규화된 dict 는 min/max, 문자열은 숫자 포함 여부)
+
+    SalaryNormalizer 는 값이 없어도 {'min': 0, 'max': 0, ...} 를 돌려주므로 dict 자체의
+    유무로는 판단하지 않습니다.
+    """
+    if isinstance(salary_range, dict):
+        parse = SalaryNormalizer._parse_salary
+        return parse(salary_range.get('min')) > 0 or parse(salary_range.get('max')) > 0
+    return any(ch.isdigit() for ch in str(salary_range or ''))
+
+
 class SalaryNormalizer:
-    def normalize(self, salary_range: Dict[str, Any]) -> Dict[str, Any]:
-        """급여 정규화"""
+    def normalize(self, salary_range: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+        """급여 정규화 (크롤러가 주는 '3000~4000만원' 같은 문자열도 허용)"""
+        if isinstance(salary_range, str):
+            numbers = [number.replace(',', '') for number in re.findall(r'\d[\d,]*', salary_range)]
+            salary_range = {
+                'min': numbers[0] if numbers else 0,
+                'max': numbers[1] if len(numbers) > 1 else (numbers[0] if numbers else 0),
+                'negotiable': not numbers or '협의' in salary_range,
+            }
         if not isinstance(salary_range, dict):
             return {'min': 0, 'max': 0, 'negotiable': True}
         
@@ -259,7 +282,8 @@ class SalaryNormalizer:
             'negotiable': bool(negotiable)
         }
     
-    def _parse_salary(self, value) -> int:
+    @staticmethod
+    def _parse_salary(value) -> int:
         """급여 값 파싱"""
         if isinstance(value, (int, float)):
             return int(value)
@@ -0,0 +1,130 @@
+import re
+from typing import List, Dict, Any
+import numpy as np
+import pandas as pd
+from config.categories import JOB_CATEGORIES, TECH_KEYWORDS
+from processors.job_record import FIELD_ALIASES
+
+TEXT_FIELDS = ['job_title', 'keywords', 'description', 'requirements', 'preferences']
+
+EXPERIENCE_BUCKETS = [
+    ('신입', r'신입|인턴|entry|junior'),
+    ('경력무관', r'무관|any'),
+    ('1-3년', r'1\s*[~-]\s*3|(?<!\d)[12]\s*년'),
+    ('3-5년', r'3\s*[~-]\s*5|(?<!\d)[34]\s*년'),
+    ('5년이상', r'(?<!\d)(?:[5-9]|\d{2})\s*년|senior|시니어'),
+    ('경력', r'경력'),
+]
+
+
+def _keyword_pattern(keyword: str) -> str:
+    """영숫자 경계를 지키는 대소문자 무시 패턴 (Go ≠ Google, SQL ≠ MySQL)"""
+    return r'(?<![a-z0-9])' + re.escape(keyword.lower()) + r'(?![a-z0-9])'
+
+
+class JobAnalytics:
+    """채용공고 집합의 키워드/기술스택/지역/경력 분포 계산기
+
+    LLM에 빈도 계산을 맡기지 않도록 pandas 벡터 연산으로 표를 미리 만들고,
+    프롬프트에 넣을 수 있는 짧은 텍스트로 변환합니다.
+    """
+
+    def __init__(self, top_n: int = 20):
+        self.top_n = top_n
+
+    def build_frame(self, jobs: List[Dict[str, Any]]) -> pd.DataFrame:
+        """공고 리스트 → 분석용 DataFrame (크롤러 원본 키도 허용)"""
+        frame = pd.DataFrame(jobs)
+        for field in ['job_title', 'company_name', 'work_location', 'keywords', 'experience',
+                      'description', 'requirements', 'preferences']:
+            if field not in frame:
+                frame[field] = None
+            alias = FIELD_ALIASES.get(field)
+            if alias and alias in frame:
+                frame[field] = frame[field].where(frame[field].notna() & (frame[field] != ''), frame[alias])
+
+        frame['keywords'] = frame['keywords'].apply(
+            lambda value: value if isinstance(value, list) else ([value] if value else [])
+        )
+        text_parts = [
+            frame[field].apply(lambda value: ' '.join(map(str, value)) if isinstance(value, list) else str(value or ''))
+            for field in TEXT_FIELDS
+        ]
+        frame['text'] = pd.concat(text_parts, axis=1).agg(' '.join, axis=1).str.lower()
+        return frame
+
+    def _table(self, counts: pd.Series, total: int) -> List[Dict[str, Any]]:
+        counts = counts[counts > 0].sort_values(ascending=False).head(self.top_n)
+        shares = np.round(counts.to_numpy() / max(total, 1) * 100, 1)
+        return [
+            {'name': str(name), 'count': int(count), 'share': float(share)}
+            for name, count, share in zip(counts.index, counts.to_numpy(), shares)
+        ]
+
+    def tech_stack_distribution(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """TECH_KEYWORDS 별 등장 공고 수"""
+        counts = pd.Series({
+            keyword: int(frame['text'].str.contains(_keyword_pattern(keyword), regex=True).sum())
+            for keyword in TECH_KEYWORDS
+        }, dtype=int)
+        return self._table(counts, len(frame))
+
+    def posting_counts(self, frame: pd.DataFrame, keywords: List[str]) -> Dict[str, int]:
+        """임의 키워드별 등장 공고 수 (LLM 이 추출한 키워드의 빈도를 로컬에서 셈)"""
+        return {
+            keyword: int(frame['text'].str.contains(_keyword_pattern(keyword), regex=True).sum())
+            for keyword in dict.fromkeys(keyword.strip() for keyword in keywords if keyword and keyword.strip())
+        }
+
+    def keyword_distribution(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """공고에 태깅된 키워드 빈도"""
+        keywords = frame['keywords'].explode().dropna().astype(str).str.strip()
+        keywords = keywords[keywords != '']
+        return self._table(keywords.value_counts(), len(frame))
+
+    def category_distribution(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """JOB_CATEGORIES 키워드가 하나라도 등장하는 공고 수"""
+        counts = pd.Series({
+            category: int(frame['text'].str.contains(
+                '|'.join(_keyword_pattern(keyword) for keyword in keywords), regex=True
+            ).sum())
+            for category, keywords in JOB_CATEGORIES.items()
+        }, dtype=int)
+        return self._table(counts, len(frame))
+
+    def location_distribution(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """광역 단위(첫 단어) 근무지역 분포"""
+        regions = frame['work_location'].fillna('').astype(str).str.strip().str.split().str[0]
+        return self._table(regions.dropna().value_counts(), len(frame))
+
+    def experience_distribution(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """경력 요건 구간 분포 (먼저 일치한 구간으로 분류)"""
+        experience = frame['experience'].fillna('').astype(str).str.lower()
+        conditions = [experience.str.contains(pattern, regex=True) for _, pattern in EXPERIENCE_BUCKETS]
+        labels = [label for label, _ in EXPERIENCE_BUCKETS]
+        buckets = pd.Series(np.select(conditions, labels, default='미기재'), index=frame.index)
+        return self._table(buckets.value_counts(), len(frame))
+
+    def summary_tables(self, jobs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """전체 분포 표 계산"""
+        if not jobs:
+            return {}
+        frame = self.build_frame(jobs)
+        return {
+            '기술스택': self.tech_stack_distribution(frame),
+            '태깅 키워드': self.keyword_distribution(frame),
+            '직군': self.category_distribution(frame),
+            '근무지역': self.location_distribution(frame),
+            '경력 요건': self.experience_distribution(frame),
+        }
+
+    @staticmethod
+    def format_for_prompt(tables: Dict[str, List[Dict[str, Any]]], total: int) -> str:
+        """프롬프트용 표 텍스트"""
+        lines = [f"(전체 공고 {total}개 기준, 등장 공고 수와 비율)"]
+        for name, rows in tables.items():
+            if not rows:
+                continue
+            lines.append(f"\n### {name}")
+            lines.extend(f"- {row['name']}: {row['count']}건 ({row['share']}%)" for row in rows)
+        return '\n'.join(lines)
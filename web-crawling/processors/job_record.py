@@ -0,0 +1,102 @@
+import hashlib
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Optional, Union
+
+# 크롤러 원본 키 → 정규화 키 대체 매핑
+FIELD_ALIASES = {
+    'job_title': 'title',
+    'company_name': 'company',
+    'job_category': 'category',
+    'work_location': 'location',
+    'keywords': 'tags',
+    'salary_range': 'salary',
+}
+
+_RAW_TO_FIELD = {raw: name for name, raw in FIELD_ALIASES.items()}
+
+
+def _as_list(value) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(',') if part.strip()]
+    if isinstance(value, (list, tuple, set)):
+        return [str(item).strip() for item in value if item and str(item).strip()]
+    return [str(value)]
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """크롤러 → 정규화 → 저장/출력 구간에서 공유하는 채용공고 레코드
+
+    필드 이름은 정규화 키(job_title, company_name, …) 로 고정하고, 크롤러가 쓰는
+    원본 키(title, company, …)는 from_raw 에서 한 번만 변환합니다. 알려지지 않은
+    키는 extra 에 그대로 보관했다가 to_dict 에서 최상위로 되돌립니다. 서버의 목록
+    API 가 원본 키(title, company, location, …)를 읽으므로 원본 키 값도 extra 에 남깁니다.
+    """
+    job_title: str = ''
+    company_name: str = ''
+    work_location: str = ''
+    job_category: str = ''
+    keywords: List[str] = field(default_factory=list)
+    salary_range: Any = None
+    experience: str = ''
+    deadline: str = ''
+    url: str = ''
+    description: str = ''
+    requirements: str = ''
+    preferences: str = ''
+    source_site: str = ''
+    scraped_at: Any = None
+    quality_score: Optional[float] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_raw(cls, raw: Union[Dict[str, Any], 'JobRecord'], site: str = '') -> 'JobRecord':
+        """크롤러 원본 dict → JobRecord (정규화 키가 있으면 원본 키보다 우선)"""
+        if isinstance(raw, cls):
+            return raw
+
+        values: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        for key, value in raw.items():
+            name = _RAW_TO_FIELD.get(key, key)
+            if name in _FIELD_NAMES:
+                if key == name or not values.get(name):
+                    values[name] = value
+                if key != name:
+                    extra[key] = value
+            else:
+                extra[key] = value
+
+        values['keywords'] = _as_list(values.get('keywords'))
+        for name in _TEXT_FIELDS:
+            if name in values:
+                values[name] = str(values[name] or '').strip()
+        if site and not values.get('source_site'):
+            values['source_site'] = site
+        return cls(**values, extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """BSON/JSON 으로 바로 보낼 수 있는 평평한 dict (얕은 복사)"""
+        data = dict(self.extra)
+        for name in _FIELD_NAMES:
+            data[name] = getattr(self, name)
+        return data
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(JobRecord) if f.name != 'extra')
+_TEXT_FIELDS = tuple(
+    name for name in _FIELD_NAMES
+    if name not in ('keywords', 'salary_range', 'scraped_at', 'quality_score')
+)
+
+
+def posting_id(job: Union[Dict[str, Any], JobRecord]) -> str:
+    """제목-회사 md5 (원본 키와 정규화 키 모두 같은 값을 줌)"""
+    if isinstance(job, JobRecord):
+        title, company = job.job_title, job.company_name
+    else:
+        title = job.get('job_title') or job.get('title', '')
+        company = job.get('company_name') or job.get('company', '')
+    return hashlib.md5(f"{title}-{company}".encode()).hexdigest()
@@ -0,0 +1,160 @@
+from typing import List, Dict, Any
+import numpy as np
+from config.categories import JOB_CATEGORIES, TECH_KEYWORDS
+from processors.data_normalizer import DataNormalizer, has_salary_amount
+from processors.job_record import FIELD_ALIASES
+
+# 최종 점수 가중치 (합계 1.0)
+# 저장된 comento/securityfarm 페이지 소스에서 뽑은 실제 공고(제목·회사·지역/마감 정도만 있음)가
+# LOCAL_SCORE_REJECT(40) 이상, 제목·회사가 빈 메뉴/배너성 항목은 그 미만이 되도록 맞춘 값
+FEATURE_WEIGHTS = np.array([
+    0.35,  # 정규화 후 기준 필드 완성도 (calculate_quality_score 배점, 직군은 정규화가 항상 채움)
+    0.20,  # 공고 부가 필드(지역·경력·마감·URL) 중 2개 이상 여부
+    0.15,  # 직군 키워드 또는 채용/직무 표현 포함 여부
+    0.10,  # 기술 키워드 매칭 수
+    0.05,  # 고정 IDF 특이도 (배치 구성과 무관)
+    0.10,  # 제목 길이 적정성
+    0.05,  # 급여에 숫자 정보 포함 여부
+])
+
+# 카드에 제목·회사 말고 보통 함께 있는 부가 필드
+POSTING_FIELDS = ('work_location', 'experience', 'deadline', 'url')
+
+# 직군 키워드가 없어도 공고 제목임을 드러내는 채용/직무 표현
+POSTING_TERMS = (
+    '채용', '모집', '신입', '경력', '인턴', '담당', '개발', '연구', '분석', '운영', '관리',
+    '엔지니어', '매니저', '전문가', '컨설턴트', '아키텍트', '리더', '사원', '직원',
+    'engineer', 'developer', 'manager', 'analyst', 'specialist', 'consultant', 'architect',
+    'researcher', 'lead', 'intern',
+)
+
+
+def _field(job: Dict[str, Any], name: str):
+    value = job.get(name)
+    if not value and name in FIELD_ALIASES:
+        value = job.get(FIELD_ALIASES[name])
+    return value
+
+
+def _has_value(value) -> bool:
+    if isinstance(value, (list, dict)):
+        return len(value) > 0
+    return bool(value) and bool(str(value).strip())
+
+
+class LocalQualityScorer:
+    """AI 없이 동작하는 결정적 품질 점수 모델
+
+    DataNormalizer.calculate_quality_score 의 필드 완성도 신호에 공고 부가 필드, 채용/직군 표현,
+    기술 키워드 매칭과 고정 IDF 특이도를 더해 0-100점으로 환산합니다. 각 공고의 점수는 같은
+    배치에 어떤 공고가 있는지와 무관하며, 특징은 배치 전체에 대해 NumPy 배열 연산으로 계산됩니다.
+    """
+
+    def __init__(self):
+        tech_terms = [keyword.lower() for keyword in TECH_KEYWORDS]
+        category_terms = []
+        self.category_columns = []
+        for keywords in JOB_CATEGORIES.values():
+            self.category_columns.append([])
+            for keyword in keywords:
+                term = keyword.lower()
+                if term not in category_terms:
+                    category_terms.append(term)
+                self.category_columns[-1].append(term)
+
+        self.vocabulary = list(dict.fromkeys(tech_terms + category_terms))
+        self.term_index = {term: i for i, term in enumerate(self.vocabulary)}
+        self.tech_mask = np.zeros(len(self.vocabulary), dtype=bool)
+        self.tech_mask[[self.term_index[term] for term in tech_terms]] = True
+
+        # 여러 직군·기술 목록에 걸친 흔한 키워드일수록 낮은 고정 IDF
+        groups = [set(tech_terms)] + [set(terms) for terms in self.category_columns]
+        group_frequency = np.array([sum(term in group for group in groups) for term in self.vocabulary])
+        self.idf = np.log((1 + len(groups)) / (1 + group_frequency)) + 1
+
+    def _texts(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        texts = []
+        for job in jobs:
+            keywords = _field(job, 'keywords') or []
+            if not isinstance(keywords, list):
+                keywords = [keywords]
+            texts.append(' '.join([
+                str(_field(job, 'job_title') or ''),
+                ' '.join(str(keyword) for keyword in keywords),
+                str(job.get('description') or ''),
+            ]).lower())
+        return np.array(texts, dtype=str)
+
+    def term_matrix(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """공고 × 어휘 이진 매칭 행렬"""
+        texts = self._texts(jobs)
+        matrix = np.zeros((len(jobs), len(self.vocabulary)), dtype=bool)
+        for i, term in enumerate(self.vocabulary):
+            matrix[:, i] = np.char.find(texts, term) >= 0
+        return matrix
+
+    def completeness(self, jobs: List[Dict[str, Any]], category_filled: bool = False) -> np.ndarray:
+        """calculate_quality_score 와 같은 배점의 필드 완성도 (0-1)
+
+        category_filled 이면 정규화 단계가 항상 채우는 job_category 를 채워진 것으로 봅니다.
+        """
+        required = np.array([
+            [
+                category_filled if field == 'job_category' and category_filled else _has_value(_field(job, field))
+                for field in DataNormalizer.REQUIRED_FIELDS
+            ]
+            for job in jobs
+        ], dtype=float).reshape(len(jobs), -1)
+        optional = np.array([
+            [
+                has_salary_amount(_field(job, field)) if field == 'salary_range' else _has_value(_field(job, field))
+                for field in DataNormalizer.OPTIONAL_FIELDS
+            ]
+            for job in jobs
+        ], dtype=float).reshape(len(jobs), -1)
+        keyword_counts = np.array([
+            len(_field(job, 'keywords')) if isinstance(_field(job, 'keywords'), list) else 0
+            for job in jobs
+        ])
+        richness = np.where(keyword_counts >= 3, 30, np.where(keyword_counts >= 1, 15, 0))
+
+        score = required.sum(axis=1) * 20 + optional.sum(axis=1) * 10 + richness
+        max_score = 20 * required.shape[1] + 10 * optional.shape[1] + 30
+        return np.minimum(score / max_score, 1.0)
+
+    def features(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """공고별 특징 행렬 (N × len(FEATURE_WEIGHTS))"""
+        matrix = self.term_matrix(jobs)
+
+        tech_hits = np.minimum(matrix[:, self.tech_mask].sum(axis=1) / 3, 1.0)
+
+        specificity = np.minimum((matrix * self.idf).sum(axis=1) / (3 * self.idf.max()), 1.0)
+
+        posting_fields = np.array([
+            [_has_value(_field(job, field)) for field in POSTING_FIELDS] for job in jobs
+        ], dtype=float).reshape(len(jobs), -1)
+        posting_fields = np.minimum(posting_fields.sum(axis=1) / 2, 1.0)
+
+        titles = np.array([str(_field(job, 'job_title') or '').lower() for job in jobs], dtype=str)
+        role_hits = np.zeros(len(jobs), dtype=bool)
+        for term in POSTING_TERMS:
+            role_hits |= np.char.find(titles, term) >= 0
+        for terms in self.category_columns:
+            columns = [self.term_index[term] for term in terms]
+            role_hits |= matrix[:, columns].any(axis=1)
+
+        title_lengths = np.char.str_len(np.char.strip(titles))
+        title_ok = ((title_lengths >= 4) & (title_lengths <= 80)).astype(float)
+
+        salary_info = np.array([has_salary_amount(_field(job, 'salary_range')) for job in jobs], dtype=float)
+
+        return np.column_stack([
+            self.completeness(jobs, category_filled=True), posting_fields, role_hits.astype(float),
+            tech_hits, specificity, title_ok, salary_info
+        ])
+
+    def score_batch(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """공고별 품질 점수 (0-100)"""
+        if not jobs:
+            return np.zeros(0)
+        return np.round(self.features(jobs) @ FEATURE_WEIGHTS * 100, 1)
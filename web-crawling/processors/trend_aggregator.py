@@ -0,0 +1,173 @@
+import time
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from config.sites_config import GLOBAL_CONFIG
+from database.mongo_client import mongo_client
+from utils.logger import setup_logger
+
+logger = setup_logger("trend_aggregator")
+
+TRENDS_COLLECTION = 'job_trends'
+TREND_DIMENSIONS = ('day', 'category', 'skill', 'location')
+UNKNOWN = '미분류'
+
+
+def _day_of(job: Dict[str, Any]) -> str:
+    """공고 수집일 (UTC, YYYY-MM-DD)"""
+    scraped_at = job.get('scraped_at')
+    if isinstance(scraped_at, str):
+        # JSON 으로 오간 공고는 ISO 문자열 ('Z' 접미사 포함)
+        try:
+            scraped_at = datetime.fromisoformat(scraped_at.strip().replace('Z', '+00:00'))
+        except ValueError:
+            scraped_at = None
+    if isinstance(scraped_at, (int, float)):
+        return datetime.fromtimestamp(scraped_at, tz=timezone.utc).date().isoformat()
+    if isinstance(scraped_at, datetime):
+        if scraped_at.tzinfo is not None:
+            scraped_at = scraped_at.astimezone(timezone.utc)
+        return scraped_at.date().isoformat()
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _region_of(job: Dict[str, Any]) -> str:
+    location = str(job.get('work_location') or job.get('location') or '').strip()
+    return location.split()[0] if location else UNKNOWN
+
+
+def _skills_of(job: Dict[str, Any]) -> List[str]:
+    skills = []
+    for field in ('keywords', 'tags'):
+        values = job.get(field) or []
+        if not isinstance(values, list):
+            values = [values]
+        for value in values:
+            skill = str(value).strip()
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills or [UNKNOWN]
+
+
+class TrendAggregator:
+    """일자 × 직군 × 스킬 × 지역 공고 수 롤업
+
+    save_jobs 가 새로 저장한 공고 배치마다 job_trends 컬렉션에 $inc 로 증분 반영하고,
+    조회는 job_trends 만 집계하며 결과는 cache_ttl['trends'] 동안 메모리에 캐시합니다.
+    행은 스킬마다 하나라 count 는 스킬 기준 공고 수이고, 공고당 첫 스킬 행에만 더하는
+    postings 로 직군·지역·일자 기준 공고 수를 셉니다 (스킬이 여러 개인 공고도 한 번).
+    """
+
+    def __init__(self, collection=None, ttl: Optional[int] = None):
+        self._collection = collection
+        self.ttl = ttl if ttl is not None else GLOBAL_CONFIG['cache_ttl']['trends']
+        self._cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._indexes_ready = False
+
+    @property
+    def collection(self):
+        """job_trends 컬렉션 (지정하지 않았으면 처음 쓸 때 Mongo 연결)"""
+        if self._collection is None:
+            self._collection = mongo_client.get_collection(TRENDS_COLLECTION)
+        return self._collection
+
+    @staticmethod
+    def _keys(job: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+        day = _day_of(job)
+        category = job.get('job_category') or job.get('category') or UNKNOWN
+        location = _region_of(job)
+        return [(day, category, skill, location) for skill in _skills_of(job)]
+
+    def rollup_counts(self, jobs: List[Dict[str, Any]]) -> Counter:
+        """공고 배치 → (day, category, skill, location) 별 증분"""
+        counts = Counter()
+        for job in jobs:
+            for key in self._keys(job):
+                counts[key] += 1
+        return counts
+
+    def rollup_postings(self, jobs: List[Dict[str, Any]]) -> Counter:
+        """공고 배치 → 공고당 한 번(첫 스킬 행)만 센 증분 (스킬 외 차원 집계용)"""
+        counts = Counter()
+        for job in jobs:
+            counts[self._keys(job)[0]] += 1
+        return counts
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        await self.collection.create_index([('day', 1), ('category', 1)])
+        await self.collection.create_index([('skill', 1), ('day', 1)])
+        self._indexes_ready = True
+
+    async def update_from_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """새로 저장된 공고 배치를 롤업에 반영 (반영한 롤업 행 수 반환)"""
+        counts = self.rollup_counts(jobs)
+        if not counts:
+            return 0
+        postings = self.rollup_postings(jobs)
+
+        from pymongo import UpdateOne  # 임포트 비용이 커서 실제 쓰기 때만 로드
+
+        operations = [
+            UpdateOne(
+                {'_id': dict(zip(TREND_DIMENSIONS, key))},
+                {
+                    '$inc': {'count': count, 'postings': postings[key]},
+                    '$setOnInsert': dict(zip(TREND_DIMENSIONS, key)),
+                },
+                upsert=True
+            )
+            for key, count in counts.items()
+        ]
+        try:
+            await self._ensure_indexes()
+            await self.collection.bulk_write(operations, ordered=False)
+            self._cache.clear()
+            logger.info(f"트렌드 롤업 갱신: 공고 {len(jobs)}개 → {len(operations)}개 행")
+            return len(operations)
+        except Exception as e:
+            logger.error(f"트렌드 롤업 갱신 실패: {e}")
+            return 0
+
+    async def get_trends(
+        self,
+        group_by: Tuple[str, ...] = ('skill',),
+        days: int = 30,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        skill: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """롤업 집계 조회 (job_postings 는 읽지 않음)
+
+        스킬로 묶거나 거르면 스킬 기준 공고 수(count), 아니면 공고당 한 번 센 공고 수(postings)를 합산합니다.
+        """
+        group_by = tuple(dimension for dimension in group_by if dimension in TREND_DIMENSIONS)
+        cache_key = (group_by, days, category, location, skill, limit)
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        since = (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).isoformat()
+        match: Dict[str, Any] = {'day': {'$gte': since}}
+        for field, value in (('category', category), ('location', location), ('skill', skill)):
+            if value:
+                match[field] = value
+
+        total = '$count' if 'skill' in group_by or skill else '$postings'
+        pipeline = [
+            {'$match': match},
+            {'$group': {
+                '_id': {dimension: f'${dimension}' for dimension in group_by},
+                'count': {'$sum': total},
+            }},
+            {'$sort': {'count': -1}},
+            {'$limit': limit},
+        ]
+        results = []
+        async for doc in self.collection.aggregate(pipeline):
+            results.append({**(doc['_id'] or {}), 'count': doc['count']})
+
+        self._cache[cache_key] = (time.monotonic() + self.ttl, results)
+        return results
@@ -0,0 +1,83 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가하여 다른 폴더의 모듈을 임포트할 수 있도록 함
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from utils import serialization
+
+# 이름 → 실행할 파이썬 인자, 허용 시간(초)
+CASES = {
+    'main --help': (['main.py', '--help'], 1.0),
+    'import main_api': (['-c', 'import main_api'], 1.0),
+    'import crawler_runner': (['-c', 'import crawler_runner'], 0.5),
+    'import crawlers.registry': (['-c', 'import crawlers.registry'], 0.2),
+}
+
+# 진입점 임포트만으로 올라오면 안 되는 무거운 모듈
+HEAVY_MODULES = ('google.generativeai', 'selenium', 'motor', 'pymongo', 'pyarrow', 'aiohttp', 'bs4')
+
+
+def run_once(args) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def loaded_heavy_modules(module: str):
+    """module 을 임포트했을 때 함께 로드된 무거운 모듈 목록"""
+    code = (f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.strip().splitlines()
+    return [name for name in (output[-1].split(',') if output else []) if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI/API 진입점 기동 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='케이스별 반복 횟수 (중앙값)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON (회귀 시 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 증가율')
+    args = parser.parse_args()
+
+    results = []
+    failures = 0
+    for name, (command, budget) in CASES.items():
+        run_once(command)  # .pyc 생성 등 첫 실행 비용 제외
+        samples = [run_once(command) for _ in range(args.repeat)]
+        median = statistics.median(samples)
+        over = median > budget
+        failures += over
+        results.append({'case': name, 'median_sec': round(median, 3), 'budget_sec': budget})
+        print(f"{name:<28}{median * 1000:>8.0f}ms  (허용 {budget * 1000:.0f}ms){'  초과' if over else ''}")
+
+    for module in ('main', 'main_api', 'crawler_runner'):
+        heavy = loaded_heavy_modules(module)
+        if heavy:
+            failures += 1
+            print(f"  {module} 임포트 시 로드됨: {', '.join(heavy)}")
+
+    if args.baseline:
+        baseline = {row['case']: row for row in serialization.loads(open(args.baseline, 'rb').read())}
+        for row in results:
+            before = baseline.get(row['case'])
+            if before and row['median_sec'] > before['median_sec'] * (1 + args.tolerance):
+                failures += 1
+                print(f"  회귀: {row['case']} {before['median_sec']}초 → {row['median_sec']}초")
+
+    if args.output:
+        serialization.dump_file(results, args.output, indent=True)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+import argparse
+import asyncio
+import glob
+import inspect
+import resource
+import sys
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from urllib.parse import quote
+
+# 프로젝트 루트를 경로에 추가하여 다른 폴더의 모듈을 임포트할 수 있도록 함
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+import lxml.html
+from loguru import logger
+from selenium.webdriver.common.by import By
+
+from config.sites_config import SITES_CONFIG
+from crawlers.base.static_element import SoupElement, LxmlElement
+from crawlers.registry import create_crawler, get_crawler_class, is_spec_site
+from processors.data_normalizer import DataNormalizer
+from processors.job_record import JobRecord
+from utils import serialization
+from utils.snapshot_store import SNAPSHOT_SUFFIXES, SnapshotStore, read_snapshot
+
+MODES = ('bs4', 'bs4-lxml', 'lxml', 'engine', 'browser')
+STAGES = ('parse', 'select', 'extract', 'validate', 'normalize')
+SNAPSHOT_SUFFIX = '_page_source.html'
+
+
+def offline_crawler(site: str):
+    """드라이버 없이 추출/검증 메서드만 쓰는 크롤러 인스턴스"""
+    if is_spec_site(site):
+        # SpecCrawler 는 드라이버를 첫 사용 때 띄우므로 그대로 생성
+        return create_crawler(site)
+    cls = get_crawler_class(site)
+    crawler = cls.__new__(cls)
+    crawler.site_name = site
+    crawler.site_config = SITES_CONFIG[site]
+    crawler.selectors = SITES_CONFIG[site]['selectors']
+    crawler.base_url = SITES_CONFIG[site]['base_url']
+    crawler.logger = logger.bind(name=f"crawler_{site}")
+    return crawler
+
+
+def card_selector(crawler) -> str:
+    spec = getattr(crawler, 'spec', None)
+    return spec.card_selector if spec else crawler.selectors['job_list']
+
+
+def load_html(path: str) -> str:
+    """평문 HTML 또는 스냅샷 저장소의 압축 스냅샷"""
+    if path.endswith(SNAPSHOT_SUFFIXES):
+        return read_snapshot(path)[1]
+    return open(path, encoding='utf-8').read()
+
+
+def is_valid(crawler, job) -> bool:
+    if not job or not crawler.validate_job_data(job):
+        return False
+    extra_check = getattr(crawler, 'is_valid_job_posting', None)
+    return extra_check(job) if extra_check else True
+
+
+async def replay(site: str, path: str, mode: str, repeat: int, max_cards: int):
+    crawler = offline_crawler(site)
+    normalizer = DataNormalizer()
+    html = load_html(path)
+    timings = defaultdict(float)
+    cards = records = 0
+    driver = None
+
+    if mode == 'browser':
+        crawler.setup_driver()
+        driver = crawler.driver
+
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            if mode == 'bs4':
+                root = SoupElement.parse(html, crawler.base_url)
+            elif mode == 'bs4-lxml':
+                root = SoupElement.parse(html, crawler.base_url, parser='lxml')
+            elif mode == 'lxml':
+                root = LxmlElement.parse(html, crawler.base_url)
+            elif mode == 'engine':
+                root = lxml.html.document_fromstring(html)
+            else:
+                driver.get(f"file://{os.path.abspath(path)}" if path.endswith('.html')
+                           else "data:text/html;charset=utf-8," + quote(html))
+                root = driver
+            timings['parse'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            if mode == 'engine':
+                # 명세 엔진: 어댑터 없이 컴파일된 선택자로 lxml 요소를 직접 추출
+                elements = crawler.extractor.cards(root)
+            else:
+                elements = root.find_elements(By.CSS_SELECTOR, card_selector(crawler))
+            if max_cards:
+                elements = elements[:max_cards]
+            timings['select'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            extract = crawler.extract_job_data
+            raw_jobs = []
+            for element in elements:
+                job = extract(element)
+                raw_jobs.append(await job if inspect.isawaitable(job) else job)
+            timings['extract'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            valid_jobs = [job for job in raw_jobs if is_valid(crawler, job)]
+            timings['validate'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            for job in valid_jobs:
+                await normalizer.normalize_record(JobRecord.from_raw(job, site=site))
+            timings['normalize'] += time.perf_counter() - started
+
+            cards, records = len(elements), len(valid_jobs)
+    finally:
+        if driver is not None:
+            driver.quit()
+
+    total = sum(timings.values()) / repeat
+    return {
+        'site': site,
+        'mode': mode,
+        'cards': cards,
+        'records': records,
+        'stage_ms': {stage: round(timings[stage] / repeat * 1000, 2) for stage in STAGES},
+        'total_ms': round(total * 1000, 2),
+        'records_per_sec': round(records / total, 1) if total else 0.0,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_case(site: str, path: str, mode: str, repeat: int, max_cards: int, verbose: bool):
+    """별도 프로세스에서 한 케이스 실행 (peak RSS 를 케이스별로 분리)"""
+    if not verbose:
+        logger.remove()
+        logger.add(sys.stderr, level='WARNING')
+    try:
+        return asyncio.run(replay(site, path, mode, repeat, max_cards))
+    except Exception as e:
+        return {'site': site, 'mode': mode, 'error': f"{type(e).__name__}: {e}"}
+
+
+def find_snapshots(pattern: str):
+    snapshots = {}
+    for path in sorted(glob.glob(pattern)):
+        site = os.path.basename(path)[:-len(SNAPSHOT_SUFFIX)]
+        if site in SITES_CONFIG:
+            snapshots[site] = path
+    return snapshots
+
+
+def find_store_snapshots(directory: str):
+    """스냅샷 저장소에서 사이트별 최신 스냅샷"""
+    store = SnapshotStore(directory=directory)
+    snapshots = {}
+    for site in SITES_CONFIG:
+        path = store.latest(site)
+        if path:
+            snapshots[site] = path
+    return snapshots
+
+
+def compare(results, baseline_path: str, tolerance: float) -> int:
+    """기준 결과 대비 records/sec 가 tolerance 이상 떨어진 케이스 수"""
+    baseline = {
+        (row['site'], row['mode']): row
+        for row in serialization.loads(open(baseline_path, 'rb').read())
+        if 'error' not in row
+    }
+    regressions = 0
+    for row in results:
+        before = baseline.get((row['site'], row['mode']))
+        if not before or 'error' in row or not before['records_per_sec']:
+            continue
+        ratio = row['records_per_sec'] / before['records_per_sec']
+        if ratio < 1 - tolerance:
+            regressions += 1
+            print(f"  회귀: {row['site']}/{row['mode']} {before['records_per_sec']} → {row['records_per_sec']} 건/초 ({ratio:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장된 HTML 스냅샷 재생 벤치마크 (네트워크 없음)')
+    parser.add_argument('--snapshots', default=os.path.join(ROOT, f'*{SNAPSHOT_SUFFIX}'), help='스냅샷 경로 glob (<site>_page_source.html)')
+    parser.add_argument('--store', help='스냅샷 저장소 디렉터리 (지정 시 사이트별 최신 스냅샷 사용)')
+    parser.add_argument('--modes', default='bs4,bs4-lxml,lxml,engine', help=f'추출 모드 ({",".join(MODES)})')
+    parser.add_argument('--repeat', type=int, default=3, help='케이스별 반복 횟수 (평균)')
+    parser.add_argument('--max-cards', type=int, default=50, help='사이트당 추출 카드 수 (크롤러와 동일, 0 은 전체)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON (회귀 시 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 처리량 감소율')
+    parser.add_argument('--verbose', action='store_true', help='크롤러 INFO 로그 출력')
+    args = parser.parse_args()
+
+    snapshots = find_store_snapshots(args.store) if args.store else find_snapshots(args.snapshots)
+    if not snapshots:
+        print(f"스냅샷이 없습니다: {args.store or args.snapshots}")
+        return 1
+
+    modes = [mode for mode in args.modes.split(',') if mode in MODES]
+    results = []
+    for site, path in snapshots.items():
+        for mode in modes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+                results.append(executor.submit(
+                    run_case, site, path, mode, args.repeat, args.max_cards, args.verbose
+                ).result())
+
+    print(f"{'site':<14}{'mode':<10}{'cards':>6}{'recs':>6}" + ''.join(f"{stage:>11}" for stage in STAGES)
+          + f"{'rec/s':>10}{'RSS MB':>9}")
+    for row in results:
+        if 'error' in row:
+            print(f"{row['site']:<14}{row['mode']:<10} 실패: {row['error']}")
+            continue
+        print(f"{row['site']:<14}{row['mode']:<10}{row['cards']:>6}{row['records']:>6}"
+              + ''.join(f"{row['stage_ms'][stage]:>9.1f}ms" for stage in STAGES)
+              + f"{row['records_per_sec']:>10.1f}{row['peak_rss_mb']:>9.1f}")
+
+    if args.output:
+        serialization.dump_file(results, args.output, indent=True)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
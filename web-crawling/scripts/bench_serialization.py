@@ -0,0 +1,70 @@
+import argparse
+import json
+import sys
+import os
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 경로에 추가하여 다른 폴더의 모듈을 임포트할 수 있도록 함
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from processors.job_record import JobRecord
+from utils import serialization
+
+
+def sample_jobs(count: int):
+    """정규화된 공고와 비슷한 모양의 샘플"""
+    return [
+        JobRecord(
+            job_title=f'백엔드 개발자 {i}',
+            company_name=f'스킬맵 {i % 300}',
+            work_location='서울 강남구',
+            job_category='IT/개발',
+            keywords=['Python', 'AWS', 'MongoDB', 'Docker', 'Kubernetes'],
+            salary_range={'min': 3000, 'max': 4500, 'negotiable': False},
+            experience='경력 3년 이상',
+            url=f'https://example.com/jobs/{i}',
+            description='대용량 트래픽 처리 경험 우대 ' * 10,
+            source_site='saramin',
+            scraped_at=datetime(2024, 1, 1, 9, 0, 0),
+            quality_score=0.9,
+            extra={'ai_quality_score': 82, 'ai_score_source': 'gemini'},
+        ).to_dict()
+        for i in range(count)
+    ]
+
+
+def bench(label: str, func, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return label, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 직렬화 마이크로 벤치마크')
+    parser.add_argument('--jobs', type=int, default=20000, help='샘플 공고 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    jobs = sample_jobs(args.jobs)
+    stdlib_encoded = json.dumps(jobs, ensure_ascii=False, default=str).encode('utf-8')
+    encoded = serialization.dumps(jobs)
+
+    results = [
+        bench('json.dumps (기존)', lambda: json.dumps(jobs, ensure_ascii=False, default=str).encode('utf-8'), args.repeat),
+        bench(f'serialization.dumps ({serialization.BACKEND})', lambda: serialization.dumps(jobs), args.repeat),
+        bench('json.loads (기존)', lambda: json.loads(stdlib_encoded), args.repeat),
+        bench(f'serialization.loads ({serialization.BACKEND})', lambda: serialization.loads(encoded), args.repeat),
+    ]
+
+    print(f"공고 {args.jobs}개, {len(encoded) / 1024 / 1024:.1f} MiB")
+    for label, seconds in results:
+        print(f"  {label:<32} {seconds * 1000:8.1f} ms  {args.jobs / seconds:12,.0f} 건/초")
+    print(f"  인코딩 {results[0][1] / results[1][1]:.1f}배, 디코딩 {results[2][1] / results[3][1]:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import sys
+import os
+import time
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 경로에 추가하여 다른 폴더의 모듈을 임포트할 수 있도록 함
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from aiohttp import ClientSession
+
+from config.sites_config import SITES_CONFIG
+from mock_site_server import MOCK_SITES, MockSiteOptions, MockSiteServer
+from utils import serialization
+
+
+def point_sites_to(base_urls: Dict[str, str], wait_time: float):
+    """크롤러가 생성되기 전에 SITES_CONFIG 를 모의 서버로 돌려놓음"""
+    for site, url in base_urls.items():
+        SITES_CONFIG[site]['base_url'] = url
+        SITES_CONFIG[site]['wait_time'] = wait_time
+
+
+def run_worker(options: Dict[str, Any], iterations: int, save: bool) -> List[Dict[str, Any]]:
+    """워커 스레드 하나 = CrawlingManager 하나 (드라이버를 공유하지 않도록)
+
+    Selenium 호출이 이벤트 루프를 막으므로 워커마다 스레드와 루프를 따로 둡니다.
+    """
+    from main import CrawlingManager
+
+    # 모의 서버는 모든 사이트를 흉내내므로 ENABLE_WORKNET_NEW 와 무관하게 요청한 사이트를 돌림
+    manager = CrawlingManager(sites=options['sites'])
+    if not save:
+        async def count_only(jobs):
+            return len(jobs)
+        manager.save_jobs = count_only
+
+    runs = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        results = asyncio.run(manager.crawl_all(options))
+        runs.append({'elapsed': time.perf_counter() - started, **results['total']})
+    return runs
+
+
+async def load_test(args) -> Dict[str, Any]:
+    server = MockSiteServer(MockSiteOptions(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, pages=args.pages, jobs_per_page=args.jobs_per_page,
+    ))
+    runner = await server.start(args.host, args.port)
+    point_sites_to(server.base_urls(args.host, args.port), args.wait_time)
+
+    options = {
+        'sites': args.sites.split(','),
+        'keyword': args.keyword,
+        'max_jobs': args.max_jobs,
+    }
+    try:
+        started = time.perf_counter()
+        worker_runs = await asyncio.gather(*[
+            asyncio.to_thread(run_worker, options, args.iterations, args.save)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+        async with ClientSession() as session:
+            async with session.get(f"http://{args.host}:{args.port}/_stats") as response:
+                server_stats = await response.json()
+    finally:
+        await runner.cleanup()
+
+    runs = [run for worker in worker_runs for run in worker]
+    crawled = sum(run['crawled'] for run in runs)
+    return {
+        'concurrency': args.concurrency,
+        'iterations': args.iterations,
+        'elapsed_sec': round(elapsed, 2),
+        'crawled': crawled,
+        'processed': sum(run['processed'] for run in runs),
+        'errors': sum(run['errors'] for run in runs),
+        'jobs_per_sec': round(crawled / elapsed, 1) if elapsed else 0.0,
+        'run_sec': sorted(round(run['elapsed'], 2) for run in runs),
+        'server': server_stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모의 채용 사이트 대상 CrawlingManager.crawl_all 부하 테스트')
+    parser.add_argument('--sites', default=','.join(MOCK_SITES), help='크롤링할 사이트')
+    parser.add_argument('--keyword', default='React', help='검색 키워드')
+    parser.add_argument('--max-jobs', type=int, default=50, help='최대 채용공고 수')
+    parser.add_argument('--concurrency', type=int, default=2, help='동시에 도는 CrawlingManager 수')
+    parser.add_argument('--iterations', type=int, default=1, help='워커별 crawl_all 반복 횟수')
+    parser.add_argument('--wait-time', type=float, default=1, help='사이트 wait_time 덮어쓰기 (초)')
+    parser.add_argument('--save', action='store_true', help='MongoDB 에 실제로 저장 (기본은 개수만 셈)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='평균 응답 지연')
+    parser.add_argument('--jitter-ms', type=float, default=100.0, help='지연 표준편차')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율 (0~1)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='429 응답 비율 (0~1)')
+    parser.add_argument('--pages', type=int, default=20, help='사이트별 페이지 수')
+    parser.add_argument('--jobs-per-page', type=int, default=20, help='페이지당 공고 수')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    report = asyncio.run(load_test(args))
+
+    print(f"\n부하 테스트 결과 (동시 {report['concurrency']} × 반복 {report['iterations']}):")
+    print(f"  소요 시간: {report['elapsed_sec']}초")
+    print(f"  크롤링: {report['crawled']}개 ({report['jobs_per_sec']}건/초)")
+    print(f"  처리완료: {report['processed']}개, 오류: {report['errors']}개")
+    for site, stats in report['server'].items():
+        print(f"  {site:<14}요청 {stats.get('requests', 0)}  200 {stats.get('200', 0)}  "
+              f"429 {stats.get('429', 0)}  500 {stats.get('500', 0)}  p50 {stats['p50_ms']}ms  p95 {stats['p95_ms']}ms")
+
+    if args.output:
+        serialization.dump_file(report, args.output, indent=True)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == '__main__':
+    main()
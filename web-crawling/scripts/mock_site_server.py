@@ -0,0 +1,372 @@
+import argparse
+import asyncio
+import html
+import os
+import random
+import secrets
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 경로에 추가하여 다른 폴더의 모듈을 임포트할 수 있도록 함
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from aiohttp import web
+from bs4 import BeautifulSoup
+
+from config.categories import TECH_KEYWORDS
+from config.sites_config import SITES_CONFIG
+
+MOCK_SITES = ('saramin', 'worknet', 'worknet_new', 'comento', 'securityfarm')
+# 목록을 XHR 로 받아 그리는 SPA 사이트는 /<site>/api/jobs?keyword=&page= 로 JSON 목록도 제공
+API_SITES = ('comento', 'securityfarm')
+API_PATH = '/api/jobs'
+
+ROLES = ['백엔드 개발자', '프론트엔드 개발자', '풀스택 개발자', '데이터 엔지니어', 'DevOps 엔지니어',
+         '보안관제 요원', '정보보안 엔지니어', '서비스기획자', 'UI/UX 디자이너', '퍼포먼스 마케터']
+COMPANY_PREFIXES = ['스킬', '코드', '데이터', '클라우드', '시큐어', '넥스트', '블루', '그린', '하이', '오픈']
+COMPANY_SUFFIXES = ['랩', '웍스', '소프트', '테크', '시스템즈', '네트웍스', '솔루션', '플랫폼']
+LOCATIONS = ['서울 강남구', '서울 마포구', '경기 성남시 분당구', '부산 해운대구', '대전 유성구', '재택근무']
+EXPERIENCES = ['신입', '경력 1~3년', '경력 3년 이상', '경력무관', '신입·경력']
+SALARIES = ['3,000~4,000만원', '4,000~5,500만원', '회사내규에 따름', '면접 후 결정']
+
+
+@dataclass
+class MockSiteOptions:
+    """응답 지연/오류 설정"""
+    latency_ms: float = 150.0
+    jitter_ms: float = 100.0
+    error_rate: float = 0.0       # 500 응답 비율
+    throttle_rate: float = 0.0    # 429 응답 비율
+    retry_after: int = 2
+    pages: int = 20
+    jobs_per_page: int = 20
+    seed: int = 42
+
+
+def fake_job(site: str, keyword: str, page: int, index: int) -> Dict[str, str]:
+    """사이트/페이지/순번으로 결정되는 가짜 공고 (같은 요청엔 같은 응답)"""
+    rng = random.Random(f"{site}|{keyword}|{page}|{index}")
+    role = rng.choice(ROLES)
+    skills = rng.sample(TECH_KEYWORDS, 3)
+    title = f"[{keyword}] {role} ({skills[0]})" if keyword else f"{role} ({skills[0]})"
+    return {
+        'id': f"{page:03d}{index:03d}",
+        'title': title,
+        'company': rng.choice(COMPANY_PREFIXES) + rng.choice(COMPANY_SUFFIXES),
+        'location': rng.choice(LOCATIONS),
+        'experience': rng.choice(EXPERIENCES),
+        'salary': rng.choice(SALARIES),
+        'deadline': f"~{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}",
+        'skills': skills,
+    }
+
+
+def _escape(job: Dict) -> Dict:
+    return {key: html.escape(value) if isinstance(value, str) else [html.escape(v) for v in value]
+            for key, value in job.items()}
+
+
+def render_saramin(job: Dict) -> str:
+    job = _escape(job)
+    return f"""
+<div class="item_recruit">
+  <div class="area_job">
+    <h2 class="job_tit"><a href="/zf_user/jobs/relay/view?rec_idx={job['id']}">{job['title']}</a></h2>
+    <div class="job_date"><span class="date">{job['deadline']}</span></div>
+    <div class="job_condition"><span>{job['location']}</span><span>{job['experience']}</span><span>{job['salary']}</span></div>
+    <div class="job_sector">{''.join(f'<a href="#">{skill}</a>' for skill in job['skills'])}</div>
+  </div>
+  <div class="area_corp"><strong class="corp_name"><a href="/zf_user/company-info?csn={job['id']}">{job['company']}</a></strong></div>
+</div>"""
+
+
+def render_worknet(job: Dict) -> str:
+    job = _escape(job)
+    return f"""
+<tr id="listRow{job['id']}">
+  <td><input type="checkbox"></td>
+  <td class="al_left pd24">
+    <div><div class="cp-company-name"><a class="cp_name underline_hover" href="#">{job['company']}</a></div>
+    <div><a class="t3_sb underline_hover" href="/empDetailAuthView.do?wantedAuthNo=K{job['id']}">{job['title']}</a></div></div>
+  </td>
+  <td>{job['location']}</td><td>{job['experience']}</td><td>{job['salary']}</td><td>{job['deadline']}</td>
+  <td>{', '.join(job['skills'])}</td>
+</tr>"""
+
+
+class SnapshotTemplate:
+    """저장된 페이지 소스의 첫 공고 카드를 템플릿으로 사용 (스냅샷이 없으면 기본 카드)
+
+    fields 는 (CSS 선택자, 순번, 토큰) 목록으로, 카드 안에서 해당 요소의 텍스트를
+    토큰으로 바꿔 두었다가 렌더링할 때 공고 값으로 채웁니다.
+    """
+
+    def __init__(self, snapshot: str, card_selector: str, fields, fallback: str, href_selector: Optional[str] = None):
+        self.card = fallback
+        path = os.path.join(ROOT, snapshot)
+        if os.path.exists(path):
+            card = self._card_from_snapshot(path, card_selector, fields, href_selector)
+            if card:
+                self.card = card
+
+    @staticmethod
+    def _card_from_snapshot(path: str, card_selector: str, fields, href_selector: Optional[str]) -> Optional[str]:
+        soup = BeautifulSoup(open(path, encoding='utf-8').read(), 'html.parser')
+        for card in soup.select(card_selector):
+            targets = []
+            for css, index, token in fields:
+                found = card.select(css)
+                if len(found) <= index:
+                    break
+                targets.append((found[index], token))
+            else:
+                for element, token in targets:
+                    # 아이콘(svg) 등은 남기고 텍스트 자리만 토큰으로 교체
+                    text_holder = element.find('span') if element.find('svg') and element.find('span') else element
+                    text_holder.string = token
+                for image in card.select('img'):
+                    image['src'] = ''
+                if href_selector:
+                    link = card if card.name == 'a' else card.select_one(href_selector)
+                    if link is not None:
+                        link['href'] = '__HREF__'
+                return str(card)
+        return None
+
+    def render(self, job: Dict, href: str = '') -> str:
+        job = _escape(job)
+        return (self.card
+                .replace('__HREF__', href)
+                .replace('__TITLE__', job['title'])
+                .replace('__COMPANY__', job['company'])
+                .replace('__LOCATION__', job['location'])
+                .replace('__EXPERIENCE__', job['experience'])
+                .replace('__DEADLINE__', job['deadline']))
+
+
+COMENTO_TEMPLATE = SnapshotTemplate(
+    'comento_page_source.html',
+    card_selector='a[href^="/career/recruit/"]',
+    fields=[('.c-typography', 0, '__COMPANY__'), ('.c-typography', 1, '__TITLE__'), ('.c-typography', 2, '__DEADLINE__')],
+    href_selector='a',
+    fallback="""
+<a href="__HREF__"><div class="c-application c-box recruit-card"><div class="recruit-card-container"><div>
+<div class="c-typography c-headline7">__COMPANY__</div>
+<div class="c-typography recruit-card-title c-body2">__TITLE__</div>
+<div class="c-typography c-body2">__DEADLINE__</div>
+</div></div></div></a>""",
+)
+
+SECURITYFARM_TEMPLATE = SnapshotTemplate(
+    'securityfarm_page_source.html',
+    card_selector='div.shadow-card-sm',
+    fields=[
+        (r'span.text-base.sm\:text-lg', 0, '__TITLE__'),
+        (r'span.text-sm.sm\:text-base.text-neutral-700', 0, '__COMPANY__'),
+        ('span.text-red-500, span.text-emerald-700', 0, '__DEADLINE__'),
+        ('div.flex.flex-row.items-center.gap-1.text-gray-600', 0, '__LOCATION__'),
+        ('div.flex.flex-row.items-center.gap-1.text-gray-600', 1, '__EXPERIENCE__'),
+    ],
+    fallback="""
+<div class="flex flex-col rounded-xl bg-white shadow-card-sm"><div class="flex flex-col p-4">
+<span class="text-sm sm:text-base text-neutral-700 font-medium">__COMPANY__</span>
+<span class="text-sm sm:text-base text-red-500 font-semibold">__DEADLINE__</span>
+<span class="text-base sm:text-lg text-gray-950 font-semibold">__TITLE__</span>
+<div class="flex flex-row items-center gap-1 text-gray-600"><span class="text-xs">__LOCATION__</span></div>
+<div class="flex flex-row items-center gap-1 text-gray-600"><span class="text-xs">__EXPERIENCE__</span></div>
+</div></div>""",
+)
+
+
+class MockSiteServer:
+    """saramin / worknet / worknet_new / comento / securityfarm 목록 페이지를 흉내내는 aiohttp 서버
+
+    각 사이트는 /<site> 아래에 실제 search_path 그대로 마운트되므로, 크롤러의
+    base_url 만 http://host:port/<site> 로 바꾸면 그대로 동작합니다. form_path 가 있는
+    사이트(worknet_new)는 폼 페이지가 세션 쿠키와 CSRF 토큰을 발급하고, 검색 POST 는
+    둘이 맞지 않으면 403 을 돌려줍니다.
+    """
+
+    PAGE_PARAMS = {'saramin': 'recruitPage', 'worknet': 'pageIndex', 'worknet_new': 'pageIndex',
+                   'comento': 'page', 'securityfarm': 'page'}
+    KEYWORD_PARAMS = {'saramin': 'searchword', 'worknet': 'searchKeyword', 'worknet_new': 'srcKeyword',
+                      'comento': 'query', 'securityfarm': 'search'}
+
+    def __init__(self, options: Optional[MockSiteOptions] = None):
+        self.options = options or MockSiteOptions()
+        self.rng = random.Random(self.options.seed)
+        self.renderers = {
+            'saramin': render_saramin,
+            'worknet': render_worknet,
+            'worknet_new': render_worknet,
+            'comento': lambda job: COMENTO_TEMPLATE.render(job, f"/career/recruit/{job['company']}-{job['id']}"),
+            'securityfarm': SECURITYFARM_TEMPLATE.render,
+        }
+        self.stats: Dict[str, Counter] = defaultdict(Counter)
+        self.sessions: Dict[str, str] = {}   # 세션 쿠키 → CSRF 토큰
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+
+    def base_urls(self, host: str, port: int) -> Dict[str, str]:
+        return {site: f"http://{host}:{port}/{site}" for site in MOCK_SITES}
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        for site in MOCK_SITES:
+            config = SITES_CONFIG[site]
+            app.router.add_route(config.get('method', 'GET'), f"/{site}{config['search_path']}", self._handler(site))
+            if 'form_path' in config:
+                app.router.add_get(f"/{site}{config['form_path']}", self._form_page(site))
+        for site in API_SITES:
+            app.router.add_get(f"/{site}{API_PATH}", self._handler(site, api=True))
+        app.router.add_get('/_stats', self.handle_stats)
+        return app
+
+    def _form_page(self, site: str):
+        async def handle(request: web.Request) -> web.Response:
+            self.stats[site]['form'] += 1
+            session, token = secrets.token_hex(8), secrets.token_hex(8)
+            self.sessions[session] = token
+            action = SITES_CONFIG[site]['search_path']
+            body = (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+                    f'<meta name="_csrf" content="{token}"><meta name="_csrf_header" content="X-CSRF-TOKEN"></head>'
+                    f'<body><form id="searchForm" method="post" action="/{site}{action}">'
+                    f'<input type="hidden" name="sortField" value="DATE">'
+                    f'<input type="text" id="jobSearchKeyword" name="srcKeyword" value="">'
+                    f'<button type="submit" class="btn_search">검색</button></form></body></html>')
+            response = web.Response(text=body, content_type='text/html', charset='utf-8')
+            response.set_cookie('JSESSIONID', session)
+            return response
+        return handle
+
+    def _session_valid(self, request: web.Request, data) -> bool:
+        token = self.sessions.get(request.cookies.get('JSESSIONID', ''))
+        return token is not None and token in (request.headers.get('X-CSRF-TOKEN'), data.get('_csrf'))
+
+    def _handler(self, site: str, api: bool = False):
+        async def handle(request: web.Request) -> web.Response:
+            started = time.perf_counter()
+            options = self.options
+            self.stats[site]['requests'] += 1
+
+            delay = max(0.0, self.rng.gauss(options.latency_ms, options.jitter_ms)) / 1000
+            await asyncio.sleep(delay)
+
+            roll = self.rng.random()
+            if roll < options.throttle_rate:
+                self.stats[site]['429'] += 1
+                return web.Response(status=429, text='Too Many Requests',
+                                    headers={'Retry-After': str(options.retry_after)})
+            if roll < options.throttle_rate + options.error_rate:
+                self.stats[site]['500'] += 1
+                return web.Response(status=500, text='Internal Server Error')
+
+            data = await request.post() if request.method == 'POST' else request.query
+            if 'form_path' in SITES_CONFIG[site] and not self._session_valid(request, data):
+                self.stats[site]['403'] += 1
+                return web.Response(status=403, text='Invalid CSRF Token')
+
+            keyword = data.get('keyword' if api else self.KEYWORD_PARAMS[site], '')
+            try:
+                page = max(1, int(data.get('page' if api else self.PAGE_PARAMS[site], '1')))
+            except ValueError:
+                page = 1
+
+            self.stats[site]['200'] += 1
+            if api:
+                self.stats[site]['api'] += 1
+                body = self.render_api(site, keyword, page)
+                self.latencies[site].append(time.perf_counter() - started)
+                return web.json_response(body)
+            body = self.render_page(site, keyword, page)
+            self.latencies[site].append(time.perf_counter() - started)
+            return web.Response(text=body, content_type='text/html', charset='utf-8')
+        return handle
+
+    def render_page(self, site: str, keyword: str, page: int) -> str:
+        options = self.options
+        jobs = [] if page > options.pages else [
+            fake_job(site, keyword, page, index) for index in range(options.jobs_per_page)
+        ]
+        self.stats[site]['jobs'] += len(jobs)
+        cards = ''.join(self.renderers[site](job) for job in jobs)
+        if site in ('worknet', 'worknet_new'):
+            cards = f'<table class="board-list"><tbody>{cards}</tbody></table>'
+        else:
+            cards = f'<div class="list_body">{cards}</div>'
+
+        param = self.PAGE_PARAMS[site]
+        pagination = ''.join(
+            f'<a class="page" href="?{param}={number}">{number}</a>'
+            for number in range(max(1, page - 4), min(options.pages, page + 5) + 1)
+        )
+        return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{site} mock</title></head>'
+                f'<body><main>{cards}</main><nav class="pagination">{pagination}</nav></body></html>')
+
+    def render_api(self, site: str, keyword: str, page: int) -> Dict:
+        """SPA 목록 API 응답 (회사는 중첩 객체, 마감일은 endDate 처럼 실제 API 에 가까운 키)"""
+        jobs = [] if page > self.options.pages else [
+            fake_job(site, keyword, page, index) for index in range(self.options.jobs_per_page)
+        ]
+        self.stats[site]['jobs'] += len(jobs)
+        items = [{
+            'id': job['id'],
+            'title': job['title'],
+            'company': {'id': index, 'name': job['company']},
+            'location': job['location'],
+            'career': job['experience'],
+            'salary': job['salary'],
+            'endDate': job['deadline'],
+            'skills': job['skills'],
+            'url': f"/career/recruit/{job['id']}",
+        } for index, job in enumerate(jobs)]
+        return {'success': True, 'data': {'page': page, 'total': self.options.pages * self.options.jobs_per_page,
+                                          'list': items}}
+
+    def summary(self) -> Dict[str, Dict]:
+        result = {}
+        for site, counter in self.stats.items():
+            latencies = sorted(self.latencies[site])
+            result[site] = {
+                **counter,
+                'p50_ms': round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+                'p95_ms': round(latencies[int(len(latencies) * 0.95)] * 1000, 1) if latencies else None,
+            }
+        return result
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.summary())
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8800) -> web.AppRunner:
+        runner = web.AppRunner(self.make_app())
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채용 사이트 목록 페이지 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='평균 응답 지연')
+    parser.add_argument('--jitter-ms', type=float, default=100.0, help='지연 표준편차')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율 (0~1)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='429 응답 비율 (0~1)')
+    parser.add_argument('--pages', type=int, default=20, help='사이트별 페이지 수')
+    parser.add_argument('--jobs-per-page', type=int, default=20, help='페이지당 공고 수')
+    args = parser.parse_args()
+
+    server = MockSiteServer(MockSiteOptions(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, pages=args.pages, jobs_per_page=args.jobs_per_page,
+    ))
+    for site, url in server.base_urls(args.host, args.port).items():
+        print(f"{site:<14}{url}")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
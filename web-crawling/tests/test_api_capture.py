@@ -0,0 +1,145 @@
+import asyncio
+import json
+import sys
+import os
+
+from aiohttp.test_utils import TestServer
+
+# Add project root and scripts/ to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from config.sites_config import SITES_CONFIG
+from crawlers.base import api_capture
+from crawlers.base.api_capture import ApiEndpointStore, build_endpoint, find_listing
+from crawlers.registry import create_crawler
+from mock_site_server import MockSiteOptions, MockSiteServer, fake_job
+
+API_URL = 'https://comento.kr/api/jobs?keyword=React&page=1'
+
+
+def cdp_request(url=API_URL):
+    return {'url': url, 'method': 'GET',
+            'headers': {'Authorization': 'Bearer token', 'X-CSRF-Token': 'csrf', 'sec-ch-ua': '"Chrome"'}}
+
+
+def test_find_listing_maps_nested_json_fields():
+    data = MockSiteServer(MockSiteOptions(jobs_per_page=3)).render_api('comento', 'React', 1)
+
+    listing = find_listing(data)
+
+    assert listing['path'] == ('data', 'list')
+    assert listing['count'] == 3
+    assert listing['field_map']['company'] == 'company.name'
+    assert listing['field_map']['deadline'] == 'endDate'
+    assert listing['field_map']['experience'] == 'career'
+
+
+def test_endpoint_template_swaps_keyword_and_page():
+    data = MockSiteServer(MockSiteOptions(jobs_per_page=3)).render_api('comento', 'React', 1)
+    endpoint = build_endpoint(cdp_request(), find_listing(data), 'React', cookies='sid=1')
+
+    request = endpoint.request('Vue', 2)
+    job = endpoint.to_job(endpoint.items(data)[0], 'https://comento.kr')
+    expected = fake_job('comento', 'React', 1, 0)
+
+    assert request['url'] == 'https://comento.kr/api/jobs'
+    assert request['params'] == {'keyword': 'Vue', 'page': 3}
+    assert endpoint.headers == {'Authorization': 'Bearer token', 'X-CSRF-Token': 'csrf', 'Cookie': 'sid=1'}
+    assert job['company'] == expected['company']
+    assert job['tags'] == expected['skills']
+    assert job['url'] == 'https://comento.kr/career/recruit/001000'
+
+
+def test_endpoint_template_only_swaps_whole_keyword_tokens():
+    url = 'https://comento.kr/api/jobs?keyword=C&sort=CREATED&q=C+개발&page=1'
+    endpoint = build_endpoint(cdp_request(url), {'path': ('data', 'list'), 'field_map': {'title': 'title'}}, 'C')
+
+    params = endpoint.request('Go')['params']
+
+    assert params['keyword'] == 'Go'
+    assert params['sort'] == 'CREATED'
+    assert params['q'] == 'Go 개발'
+
+
+class FakeDriver:
+    """페이지를 열면 목록 XHR 하나와 설정 JSON 하나를 성능 로그에 남기는 가짜 드라이버"""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.logs = []
+
+    def get(self, url):
+        for request_id, url in (('1', 'https://comento.kr/api/config'), ('2', API_URL)):
+            request = cdp_request(url)
+            self.logs += [
+                self._event('Network.requestWillBeSent', {'requestId': request_id, 'request': request}),
+                self._event('Network.responseReceived', {'requestId': request_id, 'type': 'XHR',
+                                                         'response': {'mimeType': 'application/json'}}),
+                self._event('Network.loadingFinished', {'requestId': request_id}),
+            ]
+
+    @staticmethod
+    def _event(method, params):
+        return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+    def get_log(self, name):
+        logs, self.logs = self.logs, []
+        return logs
+
+    def execute_cdp_cmd(self, command, params):
+        if command == 'Network.getResponseBody':
+            return {'body': json.dumps(self.bodies[params['requestId']]), 'base64Encoded': False}
+        return {}
+
+    def get_cookies(self):
+        return [{'name': 'sid', 'value': 'abc'}]
+
+    def execute_script(self, script, *args):
+        return 'Mozilla/5.0 Test'
+
+
+def test_discover_picks_listing_response():
+    listing = MockSiteServer(MockSiteOptions(jobs_per_page=3)).render_api('comento', 'React', 1)
+    driver = FakeDriver({'1': {'features': [{'flag': 'a'}, {'flag': 'b'}]}, '2': listing})
+
+    endpoint = api_capture.discover(driver, 'https://comento.kr/career/recruit?query=React', 'React', timeout=3)
+
+    assert endpoint.url == 'https://comento.kr/api/jobs'
+    assert endpoint.page_param == 'page'
+    assert endpoint.headers['Cookie'] == 'sid=abc'
+    assert endpoint.headers['User-Agent'] == 'Mozilla/5.0 Test'
+
+
+def test_spec_crawler_pages_through_api_without_browser(monkeypatch, tmp_path):
+    server = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, pages=2, jobs_per_page=3))
+    store = ApiEndpointStore(path=str(tmp_path / 'endpoints.json'))
+    monkeypatch.setattr('crawlers.spec_crawler.api_endpoints', store)
+
+    async def crawl():
+        async with TestServer(server.make_app()) as mock:
+            base_url = str(mock.make_url('/comento'))
+            monkeypatch.setitem(SITES_CONFIG['comento'], 'base_url', base_url)
+            listing = find_listing(server.render_api('comento', 'React', 1))
+            store.put('comento', base_url, build_endpoint(
+                cdp_request(f'{base_url}/api/jobs?keyword=React&page=1'), listing, 'React'))
+
+            crawler = create_crawler('comento')
+            # 파이프라인처럼 max_pages 없이 호출해도 SITES_CONFIG max_pages 까지 페이지를 넘김
+            jobs = [job async for job in crawler.iter_jobs('React')]
+            return crawler, jobs
+
+    crawler, jobs = asyncio.run(crawl())
+
+    # 2페이지 이후 빈 페이지에서 멈추고, HTML 페이지나 브라우저는 쓰지 않음
+    assert len(jobs) == 6
+    assert jobs[3]['title'] == fake_job('comento', 'React', 2, 0)['title']
+    assert server.stats['comento']['api'] == 3
+    assert server.stats['comento']['200'] == 3
+    assert crawler._driver is None
+
+
+def test_api_sites_default_to_site_config_page_limit():
+    for site in ('comento', 'securityfarm'):
+        assert create_crawler(site).page_numbers() == range(1, SITES_CONFIG[site]['max_pages'] + 1)
@@ -0,0 +1,37 @@
+import asyncio
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawlers.base_crawler import GeminiAICrawler
+
+
+def test_selenium_fallback_launches_browser_once_and_survives_failure(monkeypatch):
+    crawler = GeminiAICrawler('example', {'base_url': 'https://example.com', 'search_path': '/jobs'})
+    launches = []
+    selenium_calls = []
+
+    async def no_results(url):
+        return []
+
+    async def crawl_with_selenium(url):
+        selenium_calls.append(url)
+        return []
+
+    def setup_driver(network_log=False):
+        launches.append(network_log)
+        raise RuntimeError('chrome not found')
+
+    monkeypatch.setattr(crawler, '_crawl_with_requests', no_results)
+    monkeypatch.setattr(crawler, '_crawl_with_selenium', crawl_with_selenium)
+    monkeypatch.setattr(crawler, 'setup_driver', setup_driver)
+    monkeypatch.setattr('crawlers.base_crawler.random.uniform', lambda low, high: 0)
+
+    results = asyncio.run(crawler.crawl_with_keyword('React'))
+
+    # 드라이버를 못 띄우면 한 번만 시도하고 나머지 재시도는 requests 로만
+    assert results == []
+    assert launches == [False]
+    assert selenium_calls == []
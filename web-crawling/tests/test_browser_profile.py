@@ -0,0 +1,74 @@
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from crawlers.base import browser_profile
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+
+def test_options_use_real_user_agent_and_block_images():
+    options = browser_profile.chrome_options({})
+    user_agents = [arg.split('=', 1)[1] for arg in options.arguments if arg.startswith('--user-agent=')]
+
+    assert user_agents and user_agents[0] in settings.USER_AGENTS
+    assert '--disable-images' not in options.arguments
+    assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+    assert options.page_load_strategy == 'eager'
+
+
+def test_performance_log_only_for_discovery_sessions(monkeypatch):
+    from crawlers.registry import create_crawler
+
+    assert 'goog:loggingPrefs' not in browser_profile.chrome_options({}).to_capabilities()
+    logged = browser_profile.chrome_options({}, network_log=True).to_capabilities()
+    assert logged['goog:loggingPrefs'] == {'performance': 'ALL'}
+
+    crawler = create_crawler('comento')
+    sessions = []
+
+    def setup_driver(network_log=False):
+        sessions.append(network_log)
+        crawler._driver = object()
+        crawler._network_log = network_log
+
+    monkeypatch.setattr(crawler, 'setup_driver', setup_driver)
+    monkeypatch.setattr(crawler, 'close_driver', lambda: setattr(crawler, '_driver', None))
+
+    crawler.driver
+    crawler._discovery_driver()
+    crawler._discovery_driver()
+
+    # 목록 세션은 로그 없이, API 탐색 때만 로그를 켠 세션으로 한 번 다시 띄움
+    assert sessions == [False, True]
+
+
+def test_site_policy_allows_and_denies_patterns():
+    site_config = {'resource_policy': {'allow': ['*.png', '*fonts.g*'], 'deny': ['*ads.example.com*']}}
+
+    patterns = browser_profile.blocked_url_patterns(site_config)
+
+    assert '*.png' not in patterns and '*.jpg' in patterns
+    assert '*fonts.googleapis.com*' not in patterns
+    assert '*ads.example.com*' in patterns
+
+
+def test_apply_network_policy_sends_cdp_commands(monkeypatch):
+    driver = FakeDriver()
+
+    patterns = browser_profile.apply_network_policy(driver, {})
+    monkeypatch.setattr(settings, 'BLOCK_RESOURCES', False)
+    disabled = browser_profile.apply_network_policy(FakeDriver(), {})
+
+    assert [command for command, _ in driver.commands] == ['Network.enable', 'Network.setBlockedURLs']
+    assert driver.commands[1][1]['urls'] == patterns
+    assert disabled == []
@@ -0,0 +1,88 @@
+import sys
+import os
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+# Add project root and scripts/ to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from crawlers.base import engine
+from crawlers.base.card_detector import CardDetector, css_escape, detect
+from crawlers.base.engine import CompiledSpec
+from crawlers.base.spec import FieldSpec, SiteSpec
+from mock_site_server import MockSiteOptions, MockSiteServer, fake_job
+
+SPEC = SiteSpec(name='detected', card_selector='', detect_cards=True, fields={
+    'title': FieldSpec(selectors=('.job_tit a',)),
+    'company': FieldSpec(selectors=('.corp_name a',)),
+})
+
+
+def mock_page(jobs_per_page: int) -> str:
+    return MockSiteServer(MockSiteOptions(jobs_per_page=jobs_per_page)).render_page('saramin', 'React', 1)
+
+
+def test_detects_repeating_cards_without_nested_duplicates():
+    root = lxml.html.document_fromstring(mock_page(5))
+
+    result = detect(root)
+
+    assert result['selector'] == 'div.list_body > div.item_recruit' and result['cards'] == 5
+
+
+def test_classless_markup_selector_is_anchored():
+    cards = ''.join(
+        f'<div><div><a href="/jobs/{i}">백엔드 개발자 {i}</a></div><div>스킬맵 {i} · 서울</div></div>'
+        for i in range(6)
+    )
+    page = f'<html><body><div><div>공지</div></div><div>{cards}</div><div><div>광고</div></div></body></html>'
+    root = lxml.html.document_fromstring(page)
+
+    result = detect(root)
+
+    # 'div > div' 는 중첩된 div 까지 매치하므로 부모를 :nth-child 경로로 고정
+    assert result['selector'] != 'div > div'
+    matched = CSSSelector(result['selector'])(root)
+    assert len(matched) == result['cards'] == 6
+    assert all('백엔드 개발자' in card.text_content() for card in matched)
+
+
+def test_empty_page_keeps_cached_selector(monkeypatch):
+    detector = CardDetector()
+    monkeypatch.setattr(engine, 'card_detector', detector)
+    compiled = CompiledSpec(SPEC)
+    list(compiled.extract_page(mock_page(8)))
+    cached = detector.cached('detected')['selector']
+
+    # 검색 결과가 없는 페이지: 반복되는 묶음은 푸터 링크뿐
+    footer = ''.join(f'<p class="f"><a href="/policy/{i}">이용약관 및 개인정보처리방침 {i}</a></p>' for i in range(4))
+    empty = f'<html><body><div class="list_body"></div><div class="foot">{footer}</div></body></html>'
+
+    assert list(compiled.extract_page(empty)) == []
+    assert detector.cached('detected')['selector'] == cached
+    assert detector.cached('detected')['detections'] == 1
+    assert len(list(compiled.extract_page(mock_page(8)))) == 8
+
+
+def test_engine_caches_detection_and_redetects_on_drop(monkeypatch):
+    detector = CardDetector()
+    monkeypatch.setattr(engine, 'card_detector', detector)
+    compiled = CompiledSpec(SPEC)
+
+    jobs = list(compiled.extract_page(mock_page(8)))
+    list(compiled.extract_page(mock_page(8)))
+    assert detector.cached('detected')['detections'] == 1
+
+    # 카드 수가 절반 아래로 떨어지면 다시 탐지
+    list(compiled.extract_page(mock_page(3)))
+    assert detector.cached('detected')['detections'] == 2
+
+    assert [job['title'] for job in jobs] == [fake_job('saramin', 'React', 1, i)['title'] for i in range(8)]
+
+
+def test_css_escape_handles_tailwind_classes():
+    assert css_escape('sm:text-lg') == r'sm\:text-lg'
+    assert css_escape('2xl') == r'\32 xl'
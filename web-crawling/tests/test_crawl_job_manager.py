@@ -0,0 +1,168 @@
+import asyncio
+import sys
+import os
+import time
+import types
+
+import pytest
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import crawl_job_manager
+from crawl_job_manager import CrawlJobManager, CrawlQueueFullError
+from database.mongo_client import MongoDBClient
+
+
+async def fake_crawl_and_send(sites, keywords, progress=None):
+    await asyncio.sleep(0.2)
+    if 'broken' in sites:
+        raise RuntimeError('site down')
+    progress['crawled'] = len(sites) * len(keywords)
+    return progress
+
+
+def wait_until_finished(manager, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while manager.get(job_id).status in ('queued', 'running'):
+        assert time.time() < deadline
+        time.sleep(0.02)
+    return manager.get(job_id)
+
+
+def test_submit_returns_immediately_and_tracks_progress(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'crawl_and_send', fake_crawl_and_send)
+    manager = CrawlJobManager(max_workers=2)
+
+    started = time.time()
+    ok = manager.submit(['saramin', 'comento'], ['React'])
+    failed = manager.submit(['broken'], ['React'])
+    assert time.time() - started < 0.1
+    assert ok.status in ('queued', 'running')
+
+    assert wait_until_finished(manager, ok.id).counts == {'crawled': 2}
+    assert wait_until_finished(manager, failed.id).error == 'site down'
+    assert manager.get(failed.id).status == 'failed'
+    manager.shutdown(wait=True)
+
+
+def test_submit_rejects_when_queue_is_full(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'crawl_and_send', fake_crawl_and_send)
+    manager = CrawlJobManager(max_workers=1, max_pending=1)
+
+    manager.submit(['saramin'], ['React'])
+    with pytest.raises(CrawlQueueFullError):
+        manager.submit(['saramin'], ['Vue'])
+    manager.shutdown(wait=True)
+
+
+async def fake_iter_crawl_events(sites, keywords, progress=None):
+    for index, site in enumerate(sites):
+        await asyncio.sleep(0.01)
+        progress['tasks_done'] = index + 1
+        yield {'event': 'progress', 'site': site}
+        yield {'event': 'job', 'site': site, 'data': {'title': f'{site} 공고'}}
+    yield {'event': 'done', **progress}
+
+
+def test_stream_yields_events_in_order(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'iter_crawl_events', fake_iter_crawl_events)
+    manager = CrawlJobManager(max_workers=1)
+    state = manager.register_stream(['saramin', 'comento'], ['React'])
+
+    async def collect():
+        return [event async for event in manager.stream(state, queue_size=1)]
+
+    events = asyncio.run(collect())
+    assert [event['event'] for event in events] == ['accepted', 'progress', 'job', 'progress', 'job', 'done']
+    assert events[0]['id'] == state.id
+    assert wait_until_finished(manager, state.id).status == 'completed'
+    manager.shutdown(wait=True)
+
+
+def test_stream_stops_producer_when_consumer_leaves(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'iter_crawl_events', fake_iter_crawl_events)
+    manager = CrawlJobManager(max_workers=1)
+    state = manager.register_stream([f'site{i}' for i in range(50)], ['React'])
+
+    async def read_two():
+        stream = manager.stream(state, queue_size=1)
+        events = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return events
+
+    asyncio.run(read_two())
+    finished = wait_until_finished(manager, state.id)
+    assert finished.status == 'cancelled'
+    assert finished.counts['tasks_done'] < 50
+    manager.shutdown(wait=True)
+
+
+async def failing_iter_crawl_events(sites, keywords, progress=None):
+    yield {'event': 'progress', 'site': sites[0]}
+    raise RuntimeError('site down')
+
+
+def test_stream_delivers_error_event_on_failure(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'iter_crawl_events', failing_iter_crawl_events)
+    manager = CrawlJobManager(max_workers=1)
+
+    for _ in range(5):
+        state = manager.register_stream(['saramin'], ['React'])
+
+        async def collect():
+            return [event async for event in manager.stream(state)]
+
+        events = asyncio.run(collect())
+        assert [event['event'] for event in events] == ['accepted', 'progress', 'error']
+        assert events[-1]['error'] == 'site down'
+        assert wait_until_finished(manager, state.id).status == 'failed'
+    manager.shutdown(wait=True)
+
+
+def test_unread_stream_releases_pending_slot(monkeypatch):
+    monkeypatch.setattr(crawl_job_manager, 'iter_crawl_events', fake_iter_crawl_events)
+    manager = CrawlJobManager(max_workers=1, max_pending=1, stream_start_timeout=0.05)
+
+    state = manager.register_stream(['saramin'], ['React'])
+    with pytest.raises(CrawlQueueFullError):
+        manager.register_stream(['saramin'], ['Vue'])
+
+    assert wait_until_finished(manager, state.id).status == 'cancelled'
+    assert manager.pending_count() == 0
+    manager.register_stream(['saramin'], ['Vue'])
+    manager.shutdown(wait=True)
+
+
+class FakeMotorClient:
+    def __init__(self, uri):
+        self.closed = False
+
+    def __getitem__(self, name):
+        return {'client': self}
+
+    def close(self):
+        self.closed = True
+
+
+def test_each_job_loop_gets_its_own_mongo_client(monkeypatch):
+    fake_motor = types.ModuleType('motor.motor_asyncio')
+    fake_motor.AsyncIOMotorClient = FakeMotorClient
+    monkeypatch.setitem(sys.modules, 'motor.motor_asyncio', fake_motor)
+    client = MongoDBClient()
+    seen = []
+
+    async def use_mongo(sites, keywords, progress=None):
+        seen.append(client.db['client'])
+        assert client.db['client'] is seen[-1]  # 같은 루프에서는 재사용
+
+    monkeypatch.setattr(crawl_job_manager, 'crawl_and_send', use_mongo)
+    manager = CrawlJobManager(max_workers=1)
+    first = manager.submit(['saramin'], ['React'])
+    second = manager.submit(['saramin'], ['Vue'])
+
+    assert wait_until_finished(manager, first.id).status == 'completed'
+    assert wait_until_finished(manager, second.id).status == 'completed'
+    assert seen[0] is not seen[1]
+    assert seen[0].closed  # 닫힌 첫 루프의 클라이언트는 두 번째 연결 때 정리
+    manager.shutdown(wait=True)
@@ -0,0 +1,153 @@
+import asyncio
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawlers.manager.pipeline import CrawlPipeline
+
+
+class FakeCrawler:
+    def __init__(self, site, pages):
+        self.site = site
+        self.pages = pages
+        self.closed = False
+
+    async def iter_jobs(self, keyword):
+        if keyword == 'broken':
+            raise RuntimeError('page load failed')
+        for i in range(self.pages):
+            yield {'site': self.site, 'title': f'{keyword} 개발자 {i % 5}', 'company': '스킬맵'}
+
+    def validate_job_data(self, job):
+        return not job['title'].endswith('4')
+
+    def close_driver(self):
+        self.closed = True
+
+
+class FakeNormalizer:
+    async def normalize_record(self, record):
+        await asyncio.sleep(0)
+        record.quality_score = 1.0
+        return record
+
+
+def test_pipeline_streams_validates_and_deduplicates():
+    crawlers = {'saramin': FakeCrawler('saramin', 20), 'comento': FakeCrawler('comento', 10)}
+    batches = []
+
+    async def sink(batch):
+        batches.append(len(batch))
+        assert all(job['job_title'] and job['source_site'] and job['quality_score'] == 1.0 for job in batch)
+
+    pipeline = CrawlPipeline(crawlers, sink, normalizer=FakeNormalizer(), queue_size=2, batch_size=3)
+    progress = asyncio.run(pipeline.run(['React', 'broken']))
+
+    assert progress['crawled'] == 30
+    assert progress['invalid'] == 6
+    assert progress['normalized'] == 24
+    # 사이트당 고유 제목 4개 (… 0~3)
+    assert progress['sent'] == 8 and progress['duplicates'] == 16
+    assert batches == [3, 3, 2]
+    assert progress['errors'] == 2 and progress['tasks_done'] == 4
+    assert all(crawler.closed for crawler in crawlers.values())
+
+
+class ListSink:
+    def __init__(self):
+        self.jobs = []
+
+    def write(self, job):
+        self.jobs.append(job)
+
+
+def test_crawl_all_streams_sites_through_pipeline():
+    from main import CrawlingManager
+
+    crawlers = {'saramin': FakeCrawler('saramin', 20), 'comento': FakeCrawler('comento', 10)}
+    manager = CrawlingManager(sites=list(crawlers))
+    manager.normalizer = FakeNormalizer()
+    manager.get_crawler = crawlers.__getitem__
+    saved = []
+
+    async def save_jobs(jobs):
+        saved.append(len(jobs))
+        return len(jobs)
+
+    manager.save_jobs = save_jobs
+    sink = ListSink()
+    results = asyncio.run(manager.crawl_all({'sites': ['saramin', 'comento', 'unknown'], 'keyword': 'React'}, sink=sink))
+
+    assert results['sites']['saramin'] == {'crawled': 20, 'processed': 4, 'saved': 4}
+    assert results['sites']['comento'] == {'crawled': 10, 'processed': 4, 'saved': 4}
+    assert results['total']['saved'] == 8 and results['total']['errors'] == 0
+    assert len(sink.jobs) == 8 and sum(saved) == 8
+    assert all(crawler.closed for crawler in crawlers.values())
+
+
+def test_crawl_all_caps_extraction_per_site_with_max_jobs():
+    from main import CrawlingManager
+
+    crawlers = {'saramin': FakeCrawler('saramin', 20), 'comento': FakeCrawler('comento', 3)}
+    manager = CrawlingManager(sites=list(crawlers))
+    manager.normalizer = FakeNormalizer()
+    manager.get_crawler = crawlers.__getitem__
+
+    async def save_jobs(jobs):
+        return len(jobs)
+
+    manager.save_jobs = save_jobs
+    results = asyncio.run(manager.crawl_all({'sites': list(crawlers), 'keyword': 'React', 'max_jobs': 5}))
+
+    assert results['sites']['saramin']['crawled'] == 5
+    assert results['sites']['comento']['crawled'] == 3
+
+
+class StreamingCrawler(FakeCrawler):
+    """두 번째 공고를 내기 전에 첫 공고 이벤트가 소비자에게 도착했는지 기다리는 크롤러"""
+
+    def __init__(self, site, pages, first_seen):
+        super().__init__(site, pages)
+        self.first_seen = first_seen
+        self.active = 0
+        self.max_active = 0
+
+    async def iter_jobs(self, keyword):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            async for job in super().iter_jobs(keyword):
+                yield job
+                await asyncio.wait_for(self.first_seen.wait(), timeout=5)
+        finally:
+            self.active -= 1
+
+
+def test_iter_crawl_events_streams_jobs_through_the_pipeline(monkeypatch):
+    import crawler_runner
+
+    async def scenario():
+        first_seen = asyncio.Event()
+        crawler = StreamingCrawler('saramin', 10, first_seen)
+        monkeypatch.setattr(crawler_runner, 'CRAWLER_SITES', ('saramin',))
+        monkeypatch.setattr(crawler_runner, 'create_crawler', lambda site: crawler)
+
+        events = []
+        async for event in crawler_runner.iter_crawl_events(['saramin'], ['React', 'Vue']):
+            events.append(event)
+            first_seen.set()
+        return crawler, events
+
+    crawler, events = asyncio.run(scenario())
+
+    jobs = [event for event in events if event['event'] == 'job']
+    progress = [event for event in events if event['event'] == 'progress']
+    # 키워드별 고유 제목 4개 (… 4 는 검증 탈락), 같은 사이트의 키워드는 순서대로 추출
+    assert len(jobs) == 8 and all(event['data']['source_site'] == 'saramin' for event in jobs)
+    assert events[0]['event'] == 'job'
+    assert [event['keyword'] for event in progress] == ['React', 'Vue']
+    assert crawler.max_active == 1 and crawler.closed
+    assert events[-1]['event'] == 'done'
+    assert events[-1]['invalid'] == 4 and events[-1]['duplicates'] == 8 and events[-1]['sent'] == 8
@@ -0,0 +1,89 @@
+import asyncio
+import sys
+import os
+
+from aiohttp.test_utils import TestServer
+
+# Add project root and scripts/ to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from config.sites_config import SITES_CONFIG
+from crawlers.base.form_replay import FormReplay, form_state
+from config.settings import settings
+from crawlers.manager.pipeline import CrawlPipeline
+from crawlers.registry import create_crawler, enabled_sites
+from mock_site_server import MockSiteOptions, MockSiteServer, fake_job
+
+FORM_PAGE = """<html><head><meta name="_csrf" content="tok"><meta name="_csrf_header" content="X-XSRF"></head><body>
+<form action="/other.do"><input type="hidden" name="menu" value="1"></form>
+<form action="/wk/a/b/1200/retriveDtlEmpSrchListInPost.do">
+<input type="hidden" name="sortField" value="DATE"><input type="hidden" name="pageIndex" value="1">
+<input type="text" name="srcKeyword"></form></body></html>"""
+
+
+def test_form_state_reads_search_form_and_csrf_meta():
+    hidden, headers = form_state(FORM_PAGE, 'retriveDtlEmpSrchListInPost.do')
+
+    assert hidden == {'sortField': 'DATE', 'pageIndex': '1'}
+    assert headers == {'X-XSRF': 'tok'}
+
+
+def test_form_data_overrides_hidden_fields():
+    form = FormReplay('https://www.work24.go.kr', '/form.do', '/wk/a/b/1200/retriveDtlEmpSrchListInPost.do')
+    form._apply(FORM_PAGE)
+
+    assert form.form_data({'srcKeyword': 'React', 'pageIndex': 3}) == {
+        'sortField': 'DATE', 'pageIndex': '3', 'srcKeyword': 'React'}
+
+
+def test_worknet_new_pages_by_form_post_without_browser(monkeypatch):
+    server = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, pages=2, jobs_per_page=3))
+
+    async def crawl():
+        async with TestServer(server.make_app()) as mock:
+            monkeypatch.setitem(SITES_CONFIG['worknet_new'], 'base_url', str(mock.make_url('/worknet_new')))
+            crawler = create_crawler('worknet_new')
+            jobs = [job async for job in crawler.iter_jobs('React', max_pages=5)]
+            return crawler, jobs
+
+    crawler, jobs = asyncio.run(crawl())
+
+    # 폼 페이지 1번으로 세션/CSRF 를 얻고, 페이지당 POST 1번 (3페이지는 빈 페이지)
+    assert len(jobs) == 6
+    assert jobs[3]['title'] == fake_job('worknet_new', 'React', 2, 0)['title']
+    assert jobs[0]['url'].endswith('/empDetailAuthView.do?wantedAuthNo=K001000')
+    assert server.stats['worknet_new']['form'] == 1
+    assert server.stats['worknet_new']['200'] == 3
+    assert server.stats['worknet_new']['403'] == 0
+    assert crawler._driver is None
+
+
+def test_worknet_new_pipeline_reaches_page_two(monkeypatch):
+    server = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, pages=2, jobs_per_page=3))
+    sent = []
+
+    async def sink(batch):
+        sent.extend(batch)
+
+    async def crawl():
+        async with TestServer(server.make_app()) as mock:
+            monkeypatch.setitem(SITES_CONFIG['worknet_new'], 'base_url', str(mock.make_url('/worknet_new')))
+            # 파이프라인은 max_pages 없이 iter_jobs 를 부름 → SITES_CONFIG max_pages 까지
+            pipeline = CrawlPipeline({'worknet_new': create_crawler('worknet_new')}, sink)
+            return await pipeline.run(['React'])
+
+    progress = asyncio.run(crawl())
+
+    assert progress['crawled'] == 6
+    assert fake_job('worknet_new', 'React', 2, 0)['title'] in {job['job_title'] for job in sent}
+    assert server.stats['worknet_new']['200'] == 3
+
+
+def test_worknet_new_is_opt_in(monkeypatch):
+    monkeypatch.setattr(settings, 'ENABLE_WORKNET_NEW', False)
+    assert enabled_sites() == ['saramin', 'worknet', 'comento', 'securityfarm']
+
+    monkeypatch.setattr(settings, 'ENABLE_WORKNET_NEW', True)
+    assert 'worknet_new' in enabled_sites()
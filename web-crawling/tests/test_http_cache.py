@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import os
+
+from aiohttp import web, ClientSession
+from aiohttp.test_utils import TestServer
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_cache import HttpCache
+
+
+def make_app(calls):
+    async def listing(request):
+        calls.append(dict(request.headers))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304, headers={'ETag': '"v1"'})
+        language = request.headers.get('Accept-Language', '')
+        return web.Response(
+            text=f'<ul><li>채용공고 {language}</li></ul>', content_type='text/html',
+            headers={'ETag': '"v1"', 'Vary': 'Accept-Language'},
+        )
+
+    async def private(request):
+        calls.append(dict(request.headers))
+        return web.Response(text='개인화', headers={'Cache-Control': 'no-store'})
+
+    app = web.Application()
+    app.router.add_get('/jobs', listing)
+    app.router.add_get('/private', private)
+    return app
+
+
+async def run_fetches(cache, steps):
+    calls = []
+    server = TestServer(make_app(calls))
+    await server.start_server()
+    try:
+        async with ClientSession() as session:
+            responses = [
+                await cache.fetch(session, str(server.make_url(path)), headers=headers, ttl=ttl)
+                for path, headers, ttl in steps
+            ]
+    finally:
+        await server.close()
+    return responses, calls
+
+
+def test_fresh_hit_then_conditional_revalidation(tmp_path):
+    cache = HttpCache(directory=str(tmp_path))
+    korean = {'Accept-Language': 'ko-KR'}
+    responses, calls = asyncio.run(run_fetches(cache, [
+        ('/jobs', korean, 60),   # 네트워크
+        ('/jobs', korean, 60),   # TTL 안 → 요청 없음
+        ('/jobs', korean, 0),    # TTL 만료 → If-None-Match → 304
+    ]))
+
+    assert [response.source for response in responses] == ['network', 'fresh', 'revalidated']
+    assert len(calls) == 2
+    assert calls[1]['If-None-Match'] == '"v1"'
+    assert responses[2].status == 200
+    assert responses[2].text() == '<ul><li>채용공고 ko-KR</li></ul>'
+
+
+def test_vary_headers_and_no_store(tmp_path):
+    cache = HttpCache(directory=str(tmp_path))
+    responses, calls = asyncio.run(run_fetches(cache, [
+        ('/jobs', {'Accept-Language': 'ko-KR'}, 60),
+        ('/jobs', {'Accept-Language': 'en-US'}, 60),  # 다른 Vary 값 → 별도 항목
+        ('/private', {}, 60),
+        ('/private', {}, 60),                          # no-store → 매번 네트워크
+    ]))
+
+    assert [response.source for response in responses] == ['network'] * 4
+    assert 'en-US' in responses[1].text()
+    assert len(calls) == 4
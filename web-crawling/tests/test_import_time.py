@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 진입점 임포트만으로 올라오면 안 되는 무거운 모듈 (scripts/bench_import.py 와 동일)
+HEAVY_MODULES = ('google.generativeai', 'selenium', 'motor', 'pymongo', 'pyarrow', 'aiohttp', 'bs4')
+
+
+def loaded_after_import(statement: str):
+    code = (f"import sys; {statement}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.strip().splitlines()
+    return [name for name in (output[-1].split(',') if output else []) if name]
+
+
+@pytest.mark.parametrize('statement', [
+    'import main',
+    'import main_api',
+    'import crawler_runner',
+    'import crawlers.registry',
+])
+def test_entry_points_do_not_import_heavy_layers(statement):
+    assert loaded_after_import(statement) == []
+
+
+def test_registry_imports_only_requested_site():
+    code = ("import sys; from crawlers.registry import get_spec; "
+            "get_spec('worknet'); "
+            "print(','.join(sorted(m for m in sys.modules "
+            "if m.startswith('crawlers.sites.') or m.endswith('_crawler') or m == 'selenium')))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.strip().splitlines()[-1]
+    assert output.split(',') == ['crawlers.sites.worknet']
+
+
+def test_form_site_crawler_does_not_load_selenium():
+    # 폼/HTTP/API 사이트는 드라이버를 쓰기 전까지 selenium·bs4 를 올리지 않음
+    loaded = loaded_after_import("from crawlers.registry import create_crawler; create_crawler('worknet_new')")
+    assert 'selenium' not in loaded and 'bs4' not in loaded
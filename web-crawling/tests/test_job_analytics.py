@@ -0,0 +1,36 @@
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors.job_analytics import JobAnalytics
+
+
+JOBS = [
+    {'job_title': 'Go 백엔드 개발자', 'keywords': ['Go', 'Kubernetes'], 'work_location': '서울 강남구', 'experience': '신입'},
+    {'title': 'Google Ads 마케터', 'tags': ['SEO'], 'location': '서울', 'experience': '경력 3년 이상'},
+    {'job_title': 'MySQL DBA', 'keywords': [], 'work_location': '경기 성남 판교', 'experience': '경력무관'},
+]
+
+
+def test_tech_stack_counts_respect_word_boundaries():
+    analytics = JobAnalytics()
+    tables = analytics.summary_tables(JOBS)
+    tech = {row['name']: row['count'] for row in tables['기술스택']}
+
+    assert tech['Go'] == 1
+    assert tech['MySQL'] == 1
+    assert 'SQL' not in tech
+
+
+def test_distributions_accept_crawler_keys():
+    tables = JobAnalytics().summary_tables(JOBS)
+    locations = {row['name']: row['count'] for row in tables['근무지역']}
+    experience = {row['name']: row['count'] for row in tables['경력 요건']}
+    keywords = {row['name'] for row in tables['태깅 키워드']}
+
+    assert locations == {'서울': 2, '경기': 1}
+    assert experience == {'신입': 1, '경력무관': 1, '3-5년': 1}
+    assert keywords == {'Go', 'Kubernetes', 'SEO'}
+    assert '마케팅' in {row['name'] for row in tables['직군']}
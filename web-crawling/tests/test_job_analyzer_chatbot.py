@@ -0,0 +1,111 @@
+import asyncio
+import json
+import re
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.job_analyzer_chatbot import ANALYSIS_CONTEXT_TOKENS, JobAnalyzerChatbot
+from ai.job_quality_scorer import estimate_tokens
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """map 프롬프트에는 청크 키워드 추출 JSON, 그 외에는 보고서를 돌려주는 모델"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        if '"highlights": [' in prompt:
+            numbers = re.findall(r'--- 채용 공고 (\d+) ---', prompt)
+            return FakeResponse(json.dumps({
+                # 공고에 없는 키워드(Rust)도 섞어 로컬 집계에서 걸러지는지 확인
+                'keywords': {'프로그래밍/자동화': ['Python', 'Rust']},
+                'industries': {number: '금융' for number in numbers},
+                'highlights': [],
+            }, ensure_ascii=False))
+        return FakeResponse('보고서')
+
+
+def make_postings(n):
+    return [
+        {'company_name': f'회사{i}', 'job_title': '보안관제', 'requirements': 'Python 로그 분석 ' * 20}
+        for i in range(n)
+    ]
+
+
+def make_chatbot(model):
+    chatbot = JobAnalyzerChatbot()
+    chatbot.ai_model = model
+    return chatbot
+
+
+def test_small_posting_set_uses_single_call():
+    model = FakeModel()
+    result = asyncio.run(make_chatbot(model).analyze_job_postings(make_postings(3)))
+
+    assert result == '보고서'
+    assert len(model.prompts) == 1
+
+
+def test_sample_mode_uses_local_tables_and_sampled_postings():
+    model = FakeModel()
+    result = asyncio.run(make_chatbot(model).analyze_job_postings(make_postings(600), mode='sample'))
+
+    assert result == '보고서'
+    assert len(model.prompts) == 1
+    assert '- Python: 600건 (100.0%)' in model.prompts[0]
+    assert model.prompts[0].count('--- 채용 공고') < 100
+
+
+def test_auto_mode_falls_back_to_map_reduce_over_budget():
+    model = FakeModel()
+    result = asyncio.run(make_chatbot(model).analyze_job_postings(make_postings(600)))
+
+    assert result == '보고서'
+    assert len(model.prompts) > 2
+    assert '"Python": 600' in model.prompts[-1]
+
+
+def test_single_mode_trims_postings_to_budget():
+    model = FakeModel()
+    result = asyncio.run(make_chatbot(model).analyze_job_postings(make_postings(600), mode='single'))
+
+    assert result == '보고서'
+    assert len(model.prompts) == 1
+    assert estimate_tokens(model.prompts[0]) <= ANALYSIS_CONTEXT_TOKENS
+    assert '- Python: 600건 (100.0%)' in model.prompts[0]
+
+
+def test_map_reduce_mode_merges_chunk_counts_locally():
+    model = FakeModel()
+    chatbot = make_chatbot(model)
+    postings = make_postings(600)
+    result = asyncio.run(chatbot.analyze_job_postings(postings, mode='map_reduce'))
+
+    chunks = chatbot.chunk_summaries(
+        [chatbot.summarize_job(i + 1, job) for i, job in enumerate(postings)]
+    )
+    assert result == '보고서'
+    assert len(chunks) > 1
+    assert len(model.prompts) == len(chunks) + 1
+    assert '"Python": 600' in model.prompts[-1]
+
+
+def test_map_reduce_counts_come_from_postings_not_the_model():
+    model = FakeModel()
+    asyncio.run(make_chatbot(model).analyze_job_postings(make_postings(600), mode='map_reduce'))
+
+    assert all('빈도를 세십시오' not in prompt for prompt in model.prompts)
+    final = model.prompts[-1]
+    assert '"Python": 600' in final
+    assert '"Rust"' not in final
+    assert '"금융": 600' in final
@@ -0,0 +1,99 @@
+import asyncio
+import re
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.job_quality_scorer import JobQualityScorer, SCORE_OUTPUT_TOKENS, TOKENS_PER_SCORE
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """drop_first면 첫 호출에서 마지막 공고 점수를 빼먹는 모델"""
+
+    def __init__(self, drop_first=False):
+        self.drop_first = drop_first
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        count = len(re.findall(r'^\d+\. 회사:', prompt, re.MULTILINE))
+        if self.drop_first and len(self.prompts) == 1:
+            count -= 1
+        return FakeResponse(str({str(i + 1): 80 for i in range(count)}).replace("'", '"'))
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    """ai_score_hash로 저장된 점수를 돌려주는 job_postings 대역"""
+
+    def __init__(self, docs=None):
+        self.docs = docs or []
+
+    def find(self, query, projection=None):
+        wanted = set(query['ai_score_hash']['$in'])
+        return FakeCursor([doc for doc in self.docs if doc['ai_score_hash'] in wanted])
+
+
+def make_jobs(n):
+    return [{'company_name': f'회사{i}', 'job_title': f'백엔드 개발자 {i}'} for i in range(n)]
+
+
+def test_parse_scores_accepts_object_and_matching_array():
+    assert JobQualityScorer.parse_scores('{"1": 90, "2": 150}', 2) == [90.0, 100.0]
+    assert JobQualityScorer.parse_scores('```json\n[70, 60]\n```', 2) == [70.0, 60.0]
+    assert JobQualityScorer.parse_scores('[70]', 2) == [None, None]
+    assert JobQualityScorer.parse_scores('not json', 1) == [None]
+
+
+def test_pack_batches_respects_output_limit():
+    jobs = make_jobs(2000)
+    scorer = JobQualityScorer(FakeModel(), collection=FakeCollection())
+    batches = scorer.pack_batches(jobs, list(range(len(jobs))))
+
+    assert sum(len(batch) for batch in batches) == len(jobs)
+    assert all(len(batch) * TOKENS_PER_SCORE <= SCORE_OUTPUT_TOKENS for batch in batches)
+    assert len(batches) < len(jobs) // 5
+
+
+def test_score_jobs_reasks_only_missing_subset():
+    model = FakeModel(drop_first=True)
+    scorer = JobQualityScorer(model, collection=FakeCollection())
+    scores = asyncio.run(scorer.score_jobs(make_jobs(10)))
+
+    assert scores == [80.0] * 10
+    assert len(model.prompts) == 2
+    assert model.prompts[1].count('회사:') == 1
+
+
+def test_score_jobs_sends_only_new_or_changed_content():
+    model = FakeModel()
+    jobs = make_jobs(3)
+    probe = JobQualityScorer(model, collection=FakeCollection())
+    stored = [{'ai_score_hash': probe.content_hash(job), 'ai_quality_score': 91} for job in jobs[:2]]
+    scorer = JobQualityScorer(model, collection=FakeCollection(stored))
+
+    jobs[1]['job_title'] = '변경된 직무'
+    scores = asyncio.run(scorer.score_jobs(jobs + [dict(jobs[2])]))
+
+    assert scores[0] == 91.0
+    assert scores[1] is not None and scores[1] != 91.0
+    assert jobs[0]['ai_score_hash'] == stored[0]['ai_score_hash']
+    assert sum(prompt.count('회사:') for prompt in model.prompts) == 2
@@ -0,0 +1,52 @@
+import asyncio
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors.data_normalizer import DataNormalizer
+from processors.job_record import JobRecord, posting_id
+
+
+RAW = {
+    'title': ' 백엔드 개발자 ',
+    'company': '(주)스킬맵',
+    'location': '서울특별시',
+    'salary': '3,000~4,000만원',
+    'tags': 'python, aws, mongo',
+    'url': 'https://example.com/1',
+    'ai_quality_score': 82,
+}
+
+
+def test_from_raw_maps_crawler_keys_and_keeps_extras():
+    record = JobRecord.from_raw(RAW, site='saramin')
+
+    assert record.job_title == '백엔드 개발자'
+    assert record.company_name == '(주)스킬맵'
+    assert record.keywords == ['python', 'aws', 'mongo']
+    assert record.source_site == 'saramin'
+    # 원본 키는 서버 목록 API 가 읽으므로 그대로 보존
+    assert record.extra['ai_quality_score'] == 82 and record.extra['company'] == '(주)스킬맵'
+    assert not hasattr(record, '__dict__')
+
+    data = record.to_dict()
+    assert data['work_location'] == '서울특별시' and data['ai_quality_score'] == 82
+    assert data['title'] == ' 백엔드 개발자 ' and data['tags'] == 'python, aws, mongo'
+    # 정규화 키가 원본 키보다 우선
+    assert JobRecord.from_raw({'title': 'a', 'job_title': 'b'}).job_title == 'b'
+    assert posting_id(RAW) == posting_id({'job_title': ' 백엔드 개발자 ', 'company_name': '(주)스킬맵'})
+
+
+def test_normalizer_now_sees_crawler_fields():
+    normalized = asyncio.run(DataNormalizer().normalize(RAW))
+
+    assert normalized['company_name'] == '스킬맵'
+    assert normalized['work_location'] == '서울'
+    assert normalized['keywords'] == ['Python', 'AWS', 'MongoDB']
+    assert normalized['salary_range'] == {'min': 3000, 'max': 4000, 'negotiable': False}
+    assert normalized['quality_score'] == 1.0
+    assert RAW['company'] == '(주)스킬맵'
+    # 서버가 읽는 원본 키 유지
+    assert normalized['title'] == RAW['title'] and normalized['company'] == RAW['company']
@@ -0,0 +1,105 @@
+import asyncio
+import importlib
+import sys
+import os
+
+# Add project root to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from config.settings import settings
+from crawlers.base.engine import compile_spec
+from crawlers.base_crawler import GeminiAICrawler
+from crawlers.registry import create_crawler
+from processors.data_normalizer import DataNormalizer
+from processors.local_quality_scorer import LocalQualityScorer
+
+
+RICH_JOB = {
+    'job_title': 'React 프론트엔드 개발자',
+    'company_name': '네이버',
+    'job_category': 'IT/개발',
+    'work_location': '경기 성남 판교',
+    'keywords': ['React', 'TypeScript', 'GraphQL'],
+    'salary_range': '4000만원 이상',
+}
+EMPTY_JOB = {'title': '채용', 'company': ''}
+
+
+def test_completeness_matches_normalizer_quality_score():
+    scorer = LocalQualityScorer()
+    normalizer = DataNormalizer()
+    jobs = [RICH_JOB, {'job_title': 'PM', 'company_name': '카카오', 'keywords': ['Jira']}]
+
+    completeness = scorer.completeness(jobs)
+    for job, value in zip(jobs, completeness):
+        assert abs(normalizer.calculate_quality_score(job) - value) < 1e-9
+
+
+def test_score_batch_is_deterministic_and_ranks_rich_postings_higher():
+    scorer = LocalQualityScorer()
+    crawled = {'title': '백엔드 개발자 (Python, Django)', 'company': '토스', 'location': '서울'}
+    jobs = [RICH_JOB, crawled, EMPTY_JOB]
+
+    scores = scorer.score_batch(jobs)
+    assert list(scores) == list(scorer.score_batch(jobs))
+    assert scores[0] > scores[1] > scores[2]
+    assert all(0 <= score <= 100 for score in scores)
+    assert len(scorer.score_batch([])) == 0
+
+
+def test_salary_info_uses_parsed_amount():
+    scorer = LocalQualityScorer()
+    normalizer = DataNormalizer()
+    no_salary = normalizer.salary_normalizer.normalize('회사내규에 따름')
+    with_salary = normalizer.salary_normalizer.normalize('3,000~4,000만원')
+    jobs = [{**RICH_JOB, 'salary_range': no_salary}, {**RICH_JOB, 'salary_range': with_salary}]
+
+    # 정규화 후 급여는 항상 dict 이므로 금액(min/max)이 있어야 급여 정보로 인정
+    assert list(scorer.features(jobs)[:, -1]) == [0.0, 1.0]
+    assert normalizer.calculate_quality_score(jobs[0]) < normalizer.calculate_quality_score(jobs[1])
+    assert list(scorer.completeness(jobs)) == [normalizer.calculate_quality_score(job) for job in jobs]
+
+
+def saved_postings(site):
+    """저장된 페이지 소스에서 크롤러가 실제로 넘기는 원본 공고"""
+    crawler = create_crawler(site)
+    spec = importlib.import_module(f'crawlers.sites.{site}').SPEC
+    with open(os.path.join(ROOT, f'{site}_page_source.html'), encoding='utf-8') as f:
+        html = f.read()
+    jobs = [job for job in compile_spec(spec).extract_page(html, 'https://example.com') if crawler.validate_job_data(job)]
+    return crawler, jobs
+
+
+def test_saved_page_postings_clear_the_reject_threshold():
+    scorer = LocalQualityScorer()
+    for site in ('comento', 'securityfarm'):
+        _, jobs = saved_postings(site)
+        scores = scorer.score_batch(jobs)
+
+        assert len(jobs) > 40
+        assert scores.min() >= settings.LOCAL_SCORE_REJECT
+    # 제목·회사가 비었거나 부가 필드가 없는 메뉴성 항목은 탈락
+    junk = scorer.score_batch([EMPTY_JOB, {'title': '서비스 소개', 'company': '코멘토'}])
+    assert junk.max() < settings.LOCAL_SCORE_REJECT
+
+
+def test_score_does_not_depend_on_batch_makeup():
+    scorer = LocalQualityScorer()
+    _, jobs = saved_postings('securityfarm')
+
+    together = scorer.score_batch(jobs)
+    alone = [scorer.score_batch([job])[0] for job in jobs]
+    assert list(together) == alone
+    assert scorer.score_batch([jobs[0], RICH_JOB])[0] == together[0]
+
+
+def test_offline_filter_keeps_borderline_saved_postings():
+    _, jobs = saved_postings('securityfarm')
+    crawler = GeminiAICrawler('securityfarm', {})
+    crawler.ai_model = None
+
+    filtered = asyncio.run(crawler.ai_filter_jobs(jobs))
+
+    assert len(filtered) == len(jobs)
+    assert all(job['ai_score_source'] == 'local' for job in filtered)
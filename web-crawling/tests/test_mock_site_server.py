@@ -0,0 +1,47 @@
+import asyncio
+import sys
+import os
+
+from aiohttp.test_utils import TestClient, TestServer
+
+# Add project root and scripts/ to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from mock_site_server import MockSiteOptions, MockSiteServer
+
+
+async def fetch(server, path):
+    async with TestClient(TestServer(server.make_app())) as client:
+        response = await client.get(path)
+        return response.status, response.headers, await response.text()
+
+
+def test_pages_are_deterministic_and_paginated():
+    server = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, pages=2, jobs_per_page=3))
+    path = '/saramin/zf_user/search/recruit?searchword=React&recruitPage=1'
+
+    status, _, first = asyncio.run(fetch(server, path))
+    _, _, again = asyncio.run(fetch(server, path))
+    _, _, past_end = asyncio.run(fetch(server, path.replace('recruitPage=1', 'recruitPage=3')))
+
+    assert status == 200
+    assert first == again
+    assert first.count('class="item_recruit"') == 3
+    assert '[React]' in first
+    assert 'recruitPage=2' in first
+    assert 'item_recruit' not in past_end
+
+
+def test_throttle_and_error_responses_are_counted():
+    throttled = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, throttle_rate=1.0, retry_after=7))
+    status, headers, _ = asyncio.run(fetch(throttled, '/worknet/empInfo/empInfoSrch/list/dtlEmpSrchList.do'))
+    assert status == 429
+    assert headers['Retry-After'] == '7'
+    assert throttled.summary()['worknet']['429'] == 1
+
+    failing = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, error_rate=1.0))
+    status, _, _ = asyncio.run(fetch(failing, '/comento/career/recruit?query=React'))
+    assert status == 500
+    assert failing.summary()['comento']['500'] == 1
@@ -0,0 +1,65 @@
+import asyncio
+import gzip
+import json
+import sys
+import os
+
+import httpx
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.mongodb_connector import MongoDBConnector
+
+
+class FakeBulkServer:
+    """멱등 키마다 처음 한 번은 503 을 돌려주는 /jobs/bulk"""
+
+    def __init__(self, reject_status=None):
+        self.requests = []
+        self.seen_keys = set()
+        self.reject_status = reject_status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        key = request.headers['Idempotency-Key']
+        jobs = json.loads(gzip.decompress(request.content))['jobs']
+        self.requests.append((key, len(jobs)))
+
+        if self.reject_status:
+            return httpx.Response(self.reject_status, json={'success': False})
+        if key not in self.seen_keys:
+            self.seen_keys.add(key)
+            return httpx.Response(503, json={'success': False})
+        return httpx.Response(201, json={
+            'success': True,
+            'data': {'created': len(jobs) - 1, 'updated': 1, 'failed': 0, 'total': len(jobs)},
+        })
+
+
+def make_connector(server, **kwargs):
+    connector = MongoDBConnector(transport=httpx.MockTransport(server), base_delay=0, **kwargs)
+    connector.internal_api_token = 'token'
+    return connector
+
+
+def test_chunks_are_retried_and_counts_aggregated():
+    server = FakeBulkServer()
+    connector = make_connector(server, chunk_size=4, max_concurrency=2)
+    jobs = [{'job_title': f'공고 {i}'} for i in range(10)]
+
+    response = asyncio.run(connector.send_jobs_to_server(jobs))
+
+    assert response == {'success': True, 'data': {'created': 7, 'updated': 3, 'failed': 0, 'total': 10}}
+    # 청크 3개 × (503 한 번 + 성공 한 번), 재시도는 같은 멱등 키로
+    assert sorted(size for _, size in server.requests) == [2, 2, 4, 4, 4, 4]
+    assert len({key for key, _ in server.requests}) == 3
+
+
+def test_client_errors_are_not_retried():
+    server = FakeBulkServer(reject_status=400)
+    connector = make_connector(server, chunk_size=5)
+
+    response = asyncio.run(connector.send_jobs_to_server([{'job_title': 'a'}] * 7))
+
+    assert response is None
+    assert len(server.requests) == 2
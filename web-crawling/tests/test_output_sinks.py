@@ -0,0 +1,89 @@
+import gzip
+import json
+import sys
+import os
+
+import pyarrow.parquet as pq
+import pytest
+import zstandard
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.output_sinks import JobSink, NDJSONSink, ParquetSink, open_sink
+
+JOBS = [
+    {'job_title': '백엔드 개발자', 'keywords': ['Python', 'AWS'], 'quality_score': 1, 'source': {'site': 'saramin'}},
+    {'job_title': '프론트엔드 개발자', 'keywords': ['React'], 'quality_score': 0.8, 'source': {'site': 'comento'}},
+    {'job_title': '데이터 엔지니어', 'keywords': [], 'quality_score': 0.5, 'extra': 'dropped'},
+]
+
+
+def read_lines(path, opener):
+    with opener(path) as f:
+        return [json.loads(line) for line in f.read().decode('utf-8').splitlines()]
+
+
+@pytest.mark.parametrize('suffix, opener', [
+    ('.ndjson', lambda path: open(path, 'rb')),
+    ('.jsonl.gz', gzip.open),
+    ('.ndjson.zst', lambda path: zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))),
+])
+def test_ndjson_sinks_round_trip(tmp_path, suffix, opener):
+    path = str(tmp_path / f'jobs{suffix}')
+    with open_sink(path) as sink:
+        assert isinstance(sink, NDJSONSink)
+        for job in JOBS:
+            sink.write(job)
+
+    assert read_lines(path, opener) == JOBS
+
+
+def test_parquet_sink_writes_row_groups_with_fixed_schema(tmp_path):
+    path = str(tmp_path / 'jobs.parquet')
+    with open_sink(path, row_group_size=2) as sink:
+        assert isinstance(sink, ParquetSink)
+        for job in JOBS:
+            sink.write(job)
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    rows = parquet.read().to_pylist()
+    assert [row['job_title'] for row in rows] == [job['job_title'] for job in JOBS]
+    assert rows[0]['quality_score'] == 1.0
+    assert json.loads(rows[1]['source']) == {'site': 'comento'}
+    assert 'extra' not in rows[2] and rows[2]['source'] is None
+
+
+def test_parquet_sink_keeps_job_types_when_first_group_is_empty(tmp_path):
+    # 첫 row group 에서 전부 None/빈 리스트인 필드도 이후 그룹에 값이 들어갈 수 있어야 함
+    path = str(tmp_path / 'jobs.parquet')
+    jobs = [
+        {'job_title': '백엔드 개발자', 'keywords': [], 'salary_range': None, 'quality_score': None,
+         'scraped_at': None, 'note': None},
+        {'job_title': '데이터 엔지니어', 'keywords': ['Spark'], 'salary_range': {'min': 4000, 'max': 6000},
+         'quality_score': 0.7, 'scraped_at': 1700000000.0, 'note': '재택'},
+    ]
+    with ParquetSink(path, row_group_size=1) as sink:
+        assert isinstance(sink, JobSink)
+        for job in jobs:
+            sink.write(job)
+
+    rows = pq.ParquetFile(path).read().to_pylist()
+    assert rows[0]['keywords'] == [] and rows[0]['salary_range'] is None
+    assert rows[1]['keywords'] == ['Spark']
+    assert json.loads(rows[1]['salary_range']) == {'min': 4000, 'max': 6000}
+    assert rows[1]['quality_score'] == 0.7
+    assert rows[1]['scraped_at'].timestamp() == 1700000000.0
+    assert rows[1]['note'] == '재택'
+
+
+def test_job_sink_is_abstract():
+    with pytest.raises(TypeError):
+        JobSink('jobs.out')
+
+
+def test_json_output_keeps_summary_mode(tmp_path):
+    assert open_sink(str(tmp_path / 'summary.json')) is None
+    with pytest.raises(ValueError):
+        open_sink(str(tmp_path / 'jobs.csv'))
@@ -0,0 +1,98 @@
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawlers.base import selector_plan
+from crawlers.base.engine import CompiledSpec
+from crawlers.base.selector_plan import SelectorPlan, SelectorStats
+from crawlers.base.spec import FieldSpec, SiteSpec
+
+CARD = '<div class="card"><span class="name">{}</span></div>'
+
+
+def run(plan, hit_index, matched=()):
+    for index in plan.order():
+        plan.record(index, index == hit_index or index in matched, index == hit_index)
+        if index == hit_index:
+            return
+
+
+def test_plan_keeps_spec_order_and_demotes_unmatched_or_invalid():
+    plan = SelectorPlan(['.never', '.invalid', '.specific', '.generic'])
+    for i in range(selector_plan.WARMUP):
+        run(plan, hit_index=2 if i % 3 == 0 else 3, matched=(1,))
+
+    order = plan.order()
+    stats = {row['selector']: row for row in plan.stats()}
+
+    # .generic 이 더 자주 채택돼도 명세 순서 유지, 매치된 적 없거나 검증을 통과한 값을 못 낸 선택자만 뒤로
+    assert order == [2, 3, 0, 1]
+    assert stats['.never']['pruned'] and stats['.invalid']['pruned']
+    assert not stats['.specific']['pruned'] and not stats['.generic']['pruned']
+
+
+def test_catch_all_selector_reading_whole_card_is_demoted(monkeypatch):
+    stats = SelectorStats()
+    monkeypatch.setattr('crawlers.base.engine.selector_stats', stats)
+    spec = SiteSpec(name='catch_all', card_selector='div.card', fields={
+        'location': FieldSpec(selectors=('div, span, p', '.loc')),
+        'title': FieldSpec(selectors=('span, b', '.title'), min_length=4),
+    })
+    compiled = CompiledSpec(spec)
+    html = ('<html><body><div class="card"><div class="wrap"><b>회사</b>'
+            '<p class="title">보안관제 요원</p><span class="loc">서울</span></div></div></body></html>')
+
+    jobs = []
+    for _ in range(selector_plan.WARMUP + 5):
+        jobs += list(compiled.extract_page(html))
+
+    snapshot = stats.snapshot()['catch_all']
+    assert {job['location'] for job in jobs} == {'서울'}
+    assert {job['title'] for job in jobs} == {'보안관제 요원'}
+    # 카드 전체 텍스트(div)나 min_length 미달 값(b '회사')만 내던 포괄 선택자는 매치돼도 뒤로
+    assert [row['pruned'] for row in snapshot['location']['selectors']] == [True, False]
+    assert [row['pruned'] for row in snapshot['title']['selectors']] == [True, False]
+
+
+def test_replan_does_not_change_extracted_values(monkeypatch):
+    monkeypatch.setattr('crawlers.base.engine.selector_stats', SelectorStats())
+    spec = SiteSpec(name='stable', card_selector='div.card', fields={
+        'title': FieldSpec(selectors=('.job_tit a', 'strong')),
+    })
+    compiled = CompiledSpec(spec)
+    # 세 카드 중 하나만 .job_tit 가 있고, 그 카드의 strong 은 회사 배지
+    cards = ''.join(
+        f'<div class="card"><div class="job_tit"><a>제목 {i}</a></div><strong>배지 {i}</strong></div>'
+        if i % 3 == 0 else f'<div class="card"><strong>제목 {i}</strong></div>'
+        for i in range(12)
+    )
+    html = f'<html><body>{cards}</body></html>'
+
+    first = [job['title'] for job in compiled.extract_page(html)]
+    for _ in range(selector_plan.REPLAN_EVERY // 12 + 2):
+        later = [job['title'] for job in compiled.extract_page(html)]
+
+    assert first == [f'제목 {i}' for i in range(12)]
+    assert later == first
+
+
+def test_demoted_selector_still_used_when_planned_ones_miss(monkeypatch):
+    stats = SelectorStats()
+    monkeypatch.setattr('crawlers.base.engine.selector_stats', stats)
+    spec = SiteSpec(name='planned', card_selector='div.card', fields={
+        'title': FieldSpec(selectors=('.title', '.name')),
+    })
+    compiled = CompiledSpec(spec)
+
+    titles = []
+    for _ in range(selector_plan.WARMUP + 5):
+        html = '<html><body><div class="card"><b class="title">제목</b></div></body></html>'
+        titles += [job['title'] for job in compiled.extract_page(html)]
+    late = list(compiled.extract_page(f'<html><body>{CARD.format("이름")}</body></html>'))
+
+    snapshot = stats.snapshot()['planned']['title']
+    assert set(titles) == {'제목'}
+    assert late[0]['title'] == '이름'
+    assert [row['pruned'] for row in snapshot['selectors']] == [False, True]
@@ -0,0 +1,51 @@
+import importlib
+import sys
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+from bson import ObjectId
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors.job_record import JobRecord
+import utils.serialization
+
+
+@pytest.fixture(params=['installed', 'json'])
+def serialization(request, monkeypatch):
+    if request.param == 'json':
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        monkeypatch.setitem(sys.modules, 'msgspec', None)
+    module = importlib.reload(utils.serialization)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(utils.serialization)
+
+
+def test_round_trip_handles_mongo_and_record_types(serialization):
+    record = JobRecord.from_raw({'title': '백엔드', 'company': '스킬맵', 'ai_score_source': 'local'})
+    payload = {
+        '_id': ObjectId('65a000000000000000000001'),
+        'scraped_at': datetime(2024, 1, 2, 3, 4, 5),
+        'score': np.float32(0.5),
+        'tags': {'React'},
+        'record': record,
+    }
+
+    decoded = serialization.loads(serialization.dumps(payload))
+
+    assert decoded['_id'] == '65a000000000000000000001'
+    assert decoded['scraped_at'] == '2024-01-02T03:04:05'
+    assert decoded['score'] == 0.5
+    assert decoded['tags'] == ['React']
+    assert decoded['record']['job_title'] == '백엔드'
+    assert decoded['record']['ai_score_source'] == 'local'
+    assert '백엔드' in serialization.dumps_str(payload, indent=True)
+
+
+def test_decode_errors_are_json_decode_errors(serialization):
+    with pytest.raises(serialization.DecodeError):
+        serialization.loads('{"broken": ')
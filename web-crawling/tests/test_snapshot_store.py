@@ -0,0 +1,75 @@
+import sys
+import os
+import time
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.snapshot_store import SnapshotStore, read_snapshot
+
+
+class FakeDriver:
+    current_url = 'https://example.com/jobs'
+
+    def __init__(self):
+        self.reads = 0
+
+    @property
+    def page_source(self):
+        self.reads += 1
+        return '<html><body>채용공고</body></html>'
+
+
+def test_snapshots_are_content_addressed_and_compressed(tmp_path):
+    store = SnapshotStore(directory=str(tmp_path), sample_rate=1.0)
+    first = store.save('saramin', '<html>같은 페이지</html>', url='https://example.com').result()
+    second = store.save('saramin', '<html>같은 페이지</html>').result()
+
+    assert first == second
+    assert len(os.listdir(tmp_path / 'saramin')) == 1
+    meta, html = read_snapshot(first)
+    assert html == '<html>같은 페이지</html>'
+    assert meta['url'] == 'https://example.com'
+    assert store.latest('saramin') == first
+
+
+def test_sampling_skips_page_source_but_keeps_timeouts(tmp_path):
+    store = SnapshotStore(directory=str(tmp_path), sample_rate=0.0)
+    driver = FakeDriver()
+
+    assert store.capture('comento', driver) is None
+    assert driver.reads == 0
+
+    path = store.capture('comento', driver, reason='timeout').result()
+    assert driver.reads == 1
+    assert read_snapshot(path)[0]['reason'] == 'timeout'
+
+
+def test_retention_by_age_and_size(tmp_path):
+    store = SnapshotStore(directory=str(tmp_path), sample_rate=1.0, max_bytes=10 ** 9, max_age_days=1)
+    old = store.save('worknet', '<html>old</html>').result()
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(old, (two_days_ago, two_days_ago))
+    newest = store.save('worknet', '<html>new</html>').result()
+
+    assert not os.path.exists(old)
+    assert os.path.exists(newest)
+
+    store.max_bytes = 1
+    assert store.enforce_retention() == 1
+    assert store.latest('worknet') is None
+
+
+def test_size_budget_counts_only_kept_snapshots(tmp_path):
+    store = SnapshotStore(directory=str(tmp_path), sample_rate=1.0, max_bytes=10 ** 9, max_age_days=1)
+    now = time.time()
+    paths = []
+    # 최신 → 오래된 순: 작은 파일, 압축되지 않는 큰 파일, 작은 파일
+    for age, html in ((10, '<html>a</html>'), (20, os.urandom(20000).hex()), (30, '<html>c</html>')):
+        path = store.save('saramin', html).result()
+        os.utime(path, (now - age, now - age))
+        paths.append(path)
+
+    store.max_bytes = os.path.getsize(paths[0]) + os.path.getsize(paths[2])
+    assert store.enforce_retention() == 1
+    assert [os.path.exists(path) for path in paths] == [True, False, True]
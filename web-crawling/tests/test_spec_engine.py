@@ -0,0 +1,83 @@
+import asyncio
+import dataclasses
+import sys
+import os
+
+from aiohttp.test_utils import TestServer
+
+# Add project root and scripts/ to Python path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'scripts'))
+
+from config.sites_config import SITES_CONFIG
+from crawlers.base.engine import compile_spec
+from crawlers.registry import create_crawler, get_spec
+from crawlers.spec_crawler import SpecCrawler
+from mock_site_server import MockSiteOptions, MockSiteServer, fake_job
+from utils.http_cache import HttpCache
+
+
+def test_compiled_spec_extracts_mock_saramin_page():
+    server = MockSiteServer(MockSiteOptions(jobs_per_page=3))
+    html = server.render_page('saramin', 'React', 1)
+
+    jobs = list(compile_spec(get_spec('saramin')).extract_page(html, 'https://www.saramin.co.kr'))
+    expected = fake_job('saramin', 'React', 1, 0)
+
+    assert len(jobs) == 3
+    assert jobs[0]['title'] == expected['title']
+    assert jobs[0]['company'] == expected['company']
+    assert jobs[0]['salary'] == expected['salary']
+    assert jobs[0]['url'].startswith('https://www.saramin.co.kr/zf_user/jobs/relay/view')
+
+
+def test_comento_saved_page_fields_do_not_take_whole_card_text():
+    with open(os.path.join(ROOT, 'comento_page_source.html'), encoding='utf-8') as f:
+        html = f.read()
+
+    jobs = list(compile_spec(get_spec('comento')).extract_page(html, 'https://comento.kr'))
+    job = next(job for job in jobs if job['company'] == '와이에스생명과학')
+
+    assert len(jobs) == 78
+    assert job['title'] == '미래과제팀 채용'
+    assert job['deadline'] == '오늘 마감'
+    assert job['location'] == '' and job['experience'] == '' and job['tags'] == []
+
+
+def test_first_line_title_fallback():
+    html = '<div class="item_recruit"><p>메뉴</p><p>백엔드 개발자 채용</p><span class="corp_name"><a>회사</a></span></div>'
+
+    jobs = list(compile_spec(get_spec('saramin')).extract_page(html))
+
+    assert jobs[0]['title'] == '백엔드 개발자 채용'
+
+
+def test_spec_crawler_paginates_over_http(monkeypatch, tmp_path):
+    server = MockSiteServer(MockSiteOptions(latency_ms=0, jitter_ms=0, pages=2, jobs_per_page=3))
+    monkeypatch.setattr('crawlers.spec_crawler.http_cache', HttpCache(directory=str(tmp_path)))
+    spec = dataclasses.replace(get_spec('worknet'), fetch='http')
+
+    async def crawl():
+        async with TestServer(server.make_app()) as mock:
+            monkeypatch.setitem(SITES_CONFIG['worknet'], 'base_url', str(mock.make_url('/worknet')))
+            crawler = SpecCrawler(spec)
+
+            async def no_delay():
+                pass
+            crawler.delay = no_delay
+            return [job async for job in crawler.iter_jobs('React', max_pages=5)]
+
+    jobs = asyncio.run(crawl())
+
+    # 2페이지 이후 빈 페이지에서 멈춤
+    assert len(jobs) == 6
+    assert jobs[3]['title'] == fake_job('worknet', 'React', 2, 0)['title']
+    assert server.stats['worknet']['requests'] == 3
+
+
+def test_create_crawler_builds_spec_crawler_without_driver():
+    crawler = create_crawler('securityfarm')
+
+    assert isinstance(crawler, SpecCrawler)
+    assert crawler._driver is None
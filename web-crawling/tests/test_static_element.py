@@ -0,0 +1,35 @@
+import sys
+import os
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawlers.base.static_element import SoupElement, LxmlElement
+
+HTML = """
+<ul id="jobs">
+  <li class="item"><h3><a href="/job/1">백엔드 개발자</a></h3><span class="company">스킬맵</span></li>
+  <li class="item"><h3><a href="/job/2">프론트엔드 개발자</a></h3></li>
+</ul>
+"""
+
+
+@pytest.mark.parametrize('parse', [
+    lambda html: SoupElement.parse(html, 'https://example.com'),
+    lambda html: SoupElement.parse(html, 'https://example.com', parser='lxml'),
+    lambda html: LxmlElement.parse(html, 'https://example.com'),
+])
+def test_static_elements_behave_like_web_elements(parse):
+    root = parse(HTML)
+    cards = root.find_element(By.ID, 'jobs').find_elements(By.CSS_SELECTOR, 'li.item')
+
+    assert len(cards) == 2
+    assert cards[0].find_element(By.CSS_SELECTOR, 'h3').text == '백엔드 개발자'
+    assert cards[0].find_element(By.TAG_NAME, 'a').get_attribute('href') == 'https://example.com/job/1'
+    assert cards[0].text.split('\n') == ['백엔드 개발자', '스킬맵']
+    with pytest.raises(NoSuchElementException):
+        cards[1].find_element(By.CSS_SELECTOR, '.company')
@@ -0,0 +1,127 @@
+import asyncio
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors.trend_aggregator import TrendAggregator
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeTrendsCollection:
+    """UpdateOne($inc) 와 단순 $group 만 흉내내는 job_trends 대역"""
+
+    def __init__(self):
+        self.rows = {}
+        self.aggregate_calls = 0
+
+    async def create_index(self, keys):
+        return None
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            doc = operation._doc
+            key = tuple(operation._filter['_id'].items())
+            row = self.rows.setdefault(key, dict(doc['$setOnInsert'], count=0, postings=0))
+            for field, amount in doc['$inc'].items():
+                row[field] += amount
+
+    def aggregate(self, pipeline):
+        self.aggregate_calls += 1
+        match, group = pipeline[0]['$match'], pipeline[1]['$group']
+        totals = {}
+        for row in self.rows.values():
+            if row['day'] < match['day']['$gte']:
+                continue
+            if any(row[field] != value for field, value in match.items() if field != 'day'):
+                continue
+            key = tuple((name, row[path[1:]]) for name, path in group['_id'].items())
+            totals[key] = totals.get(key, 0) + row[group['count']['$sum'][1:]]
+        docs = [{'_id': dict(key), 'count': count} for key, count in totals.items()]
+        return FakeCursor(sorted(docs, key=lambda doc: -doc['count']))
+
+
+JOBS = [
+    {'job_category': 'IT/개발', 'keywords': ['React', 'TypeScript'], 'work_location': '서울 강남구'},
+    {'category': 'IT/개발', 'tags': ['React'], 'location': '경기 성남 판교'},
+    {'job_category': '보안', 'keywords': [], 'work_location': ''},
+]
+
+
+def test_rollup_counts_cover_every_dimension():
+    aggregator = TrendAggregator(collection=FakeTrendsCollection())
+    counts = aggregator.rollup_counts(JOBS)
+
+    assert sum(counts.values()) == 4
+    assert {key[1:] for key in counts} == {
+        ('IT/개발', 'React', '서울'),
+        ('IT/개발', 'TypeScript', '서울'),
+        ('IT/개발', 'React', '경기'),
+        ('보안', '미분류', '미분류'),
+    }
+
+
+def test_updates_are_incremental_and_queries_are_cached():
+    collection = FakeTrendsCollection()
+    aggregator = TrendAggregator(collection=collection, ttl=3600)
+
+    async def scenario():
+        await aggregator.update_from_jobs(JOBS)
+        first = await aggregator.get_trends(group_by=('skill',), category='IT/개발')
+        cached = await aggregator.get_trends(group_by=('skill',), category='IT/개발')
+        await aggregator.update_from_jobs(JOBS[:1])
+        refreshed = await aggregator.get_trends(group_by=('skill',), category='IT/개발')
+        return first, cached, refreshed
+
+    first, cached, refreshed = asyncio.run(scenario())
+
+    assert first == [{'skill': 'React', 'count': 2}, {'skill': 'TypeScript', 'count': 1}]
+    assert cached is first
+    assert refreshed[0] == {'skill': 'React', 'count': 3}
+    assert collection.aggregate_calls == 2
+
+
+def test_multi_skill_posting_counts_once_per_category_and_location():
+    collection = FakeTrendsCollection()
+    aggregator = TrendAggregator(collection=collection)
+    jobs = [
+        {'job_category': '보안', 'keywords': ['SIEM', 'EDR', 'Python'], 'work_location': '서울 중구'},
+        {'job_category': '보안', 'keywords': ['SIEM'], 'work_location': '서울 강남구'},
+    ]
+
+    async def scenario():
+        await aggregator.update_from_jobs(jobs)
+        return (
+            await aggregator.get_trends(group_by=('category',)),
+            await aggregator.get_trends(group_by=('location',)),
+            await aggregator.get_trends(group_by=('skill',)),
+        )
+
+    by_category, by_location, by_skill = asyncio.run(scenario())
+
+    assert by_category == [{'category': '보안', 'count': 2}]
+    assert by_location == [{'location': '서울', 'count': 2}]
+    assert by_skill[0] == {'skill': 'SIEM', 'count': 2}
+    assert all(isinstance(key, tuple) and dict(key)['skill'] for key in collection.rows)
+
+
+def test_iso_string_scraped_at_sets_the_day():
+    aggregator = TrendAggregator(collection=FakeTrendsCollection())
+    counts = aggregator.rollup_counts([
+        {'job_category': '보안', 'keywords': ['EDR'], 'scraped_at': '2025-03-01T23:30:00Z'},
+        {'job_category': '보안', 'keywords': ['EDR'], 'scraped_at': '2025-03-02T08:00:00+09:00'},
+    ])
+
+    assert {key[0] for key in counts} == {'2025-03-01'}
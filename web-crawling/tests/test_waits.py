@@ -0,0 +1,99 @@
+import json
+import sys
+import os
+import time
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawlers.base import waits
+from crawlers.base.waits import AdaptiveTimeouts, NetworkMonitor
+
+
+class FakePage:
+    """스크롤할 때마다 카드가 batch 개씩 늘고, 마지막 변경 시각을 기록하는 가짜 드라이버"""
+
+    def __init__(self, cards=10, batch=10, total=30):
+        self.cards, self.batch, self.total = cards, batch, total
+        self.scrolls = 0
+        self.changed = time.monotonic()
+        self.logs = []
+
+    def execute_script(self, script, *args):
+        if script == waits._SCROLL_SCRIPT:
+            self.scrolls += 1
+            if self.cards < self.total:
+                self.cards += self.batch
+                self.changed = time.monotonic()
+            return None
+        if script == waits._COUNT_SCRIPT:
+            return self.cards
+        return (time.monotonic() - self.changed) * 1000
+
+    def get_log(self, name):
+        logs, self.logs = self.logs, []
+        return logs
+
+
+def event(method, request_id, url='https://example.com/api'):
+    params = {'requestId': request_id, 'request': {'url': url}}
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def test_scroll_stops_when_card_count_stabilizes():
+    page = FakePage()
+
+    count = waits.scroll_until_stable(page, '.card', max_scrolls=10, settle_ms=50, timeout=1)
+
+    assert count == 30
+    assert page.scrolls == 3  # 20, 30 다음 스크롤에서 변화 없음
+
+
+def test_dom_quiet_returns_without_full_timeout():
+    page = FakePage()
+    started = time.monotonic()
+
+    assert waits.wait_for_dom_quiet(page, quiet_ms=100, timeout=5)
+    assert time.monotonic() - started < 1
+
+
+def test_network_monitor_tracks_inflight_requests():
+    page = FakePage()
+    monitor = NetworkMonitor(page)
+    page.logs = [event('Network.requestWillBeSent', '1'), event('Network.requestWillBeSent', '2'),
+                 event('Network.loadingFinished', '1')]
+
+    assert not monitor.is_idle(idle_ms=0)
+    assert list(monitor.inflight) == ['2']
+
+    page.logs = [event('Network.loadingFailed', '2')]
+    assert monitor.wait_idle(idle_ms=50, timeout=2)
+
+
+def test_adaptive_timeout_learns_from_observed_waits():
+    timeouts = AdaptiveTimeouts()
+    assert timeouts.timeout('site', 'ready', default=10) == 10
+
+    for elapsed in (0.4, 0.6, 0.5):
+        timeouts.record('site', 'ready', elapsed)
+    assert timeouts.timeout('site', 'ready', default=10) == 1.2
+
+    timeouts.record('site', 'ready', 1.2, ok=False)
+    assert timeouts.timeout('site', 'ready', default=10) == 4.8
+
+
+def test_adaptive_timeout_caps_escalation_and_skips_ignored_waits():
+    timeouts = AdaptiveTimeouts()
+    for elapsed in (0.4, 0.6, 0.5):
+        timeouts.record('site', 'ready', elapsed)
+        timeouts.record('site', 'dom_quiet', elapsed)
+
+    # 반복 타임아웃도 설정한 기본값을 넘지 않음
+    for _ in range(3):
+        timeouts.record('site', 'ready', timeouts.timeout('site', 'ready', default=5), ok=False)
+    assert timeouts.timeout('site', 'ready', default=5) == 5
+
+    # 실패를 무시하는 대기는 횟수만 세고 타임아웃은 그대로
+    timeouts.record('site', 'dom_quiet', 1.2, ok=False, escalate=False)
+    assert timeouts.timeout('site', 'dom_quiet', default=5) == 1.2
+    assert timeouts.snapshot()['site:dom_quiet']['timeouts'] == 1
@@ -0,0 +1,185 @@
+import asyncio
+import gzip
+import hashlib
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from config.settings import settings
+from utils.logger import setup_logger
+from utils.serialization import dumps, loads, DecodeError
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = setup_logger("http_cache")
+
+# 재검증에 쓰는 응답 헤더만 보관
+STORED_HEADERS = ('etag', 'last-modified', 'content-type', 'vary')
+
+
+@dataclass
+class CachedResponse:
+    """캐시를 거친 GET 응답
+
+    source: 'network' (새로 받음), 'fresh' (TTL 안이라 요청 안 함), 'revalidated' (304)
+    """
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    source: str = 'network'
+
+    @property
+    def from_cache(self) -> bool:
+        return self.source != 'network'
+
+    def text(self) -> str:
+        content_type = self.headers.get('content-type', '')
+        charset = 'utf-8'
+        if 'charset=' in content_type:
+            charset = content_type.split('charset=', 1)[1].split(';')[0].strip().strip('"') or charset
+        return self.body.decode(charset, errors='replace')
+
+
+class HttpCache:
+    """requests 경로용 디스크 HTTP 캐시
+
+    URL + Vary 헤더 값으로 키를 만들고 본문을 압축해 저장합니다. TTL(사이트별
+    freshness) 안이면 네트워크 없이 돌려주고, 지나면 If-None-Match /
+    If-Modified-Since 로 재검증해 304 면 저장본을 그대로 씁니다.
+    """
+
+    def __init__(self, directory: str = settings.HTTP_CACHE_DIR, default_ttl: float = 3600):
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.suffix = '.zst' if zstandard is not None else '.gz'
+        self.stats = Counter()
+
+    # ---- 키 / 경로 ----
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    def _url_dir(self, url: str) -> str:
+        url_hash = self._hash(url)
+        return os.path.join(self.directory, url_hash[:2], url_hash)
+
+    def _variant_path(self, url: str, vary: List[str], request_headers: Dict[str, str]) -> str:
+        lowered = {key.lower(): value for key, value in request_headers.items()}
+        variant = '\n'.join(f"{name}:{lowered.get(name, '')}" for name in vary)
+        return os.path.join(self._url_dir(url), self._hash(variant) + self.suffix)
+
+    # ---- 압축 저장 ----
+
+    def _compress(self, data: bytes) -> bytes:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=3).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self.suffix == '.zst':
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _read_vary(self, url: str) -> List[str]:
+        path = os.path.join(self._url_dir(url), 'vary.json')
+        try:
+            with open(path, 'rb') as f:
+                return loads(f.read())
+        except (OSError, DecodeError):
+            return []
+
+    def _load(self, url: str, request_headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        path = self._variant_path(url, self._read_vary(url), request_headers)
+        try:
+            with open(path, 'rb') as f:
+                meta_line, body = self._decompress(f.read()).split(b'\n', 1)
+            meta = loads(meta_line)
+            meta['body'] = body
+            return meta
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"캐시 항목 손상, 무시: {url} ({e})")
+            return None
+
+    def _store(self, url: str, request_headers: Dict[str, str], meta: Dict[str, Any], body: bytes):
+        vary = [name.strip().lower() for name in meta['headers'].get('vary', '').split(',') if name.strip()]
+        self._write_atomic(os.path.join(self._url_dir(url), 'vary.json'), dumps(vary))
+        path = self._variant_path(url, vary, request_headers)
+        self._write_atomic(path, self._compress(dumps(meta) + b'\n' + body))
+
+    # ---- 공개 API ----
+
+    @staticmethod
+    def _cacheable(headers: Dict[str, str]) -> bool:
+        cache_control = headers.get('cache-control', '').lower()
+        return 'no-store' not in cache_control and headers.get('vary', '').strip() != '*'
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: Optional[float] = None,
+        timeout: float = 30,
+    ) -> CachedResponse:
+        """캐시를 거쳐 GET (200 만 저장, 304 는 저장본으로 응답)"""
+        headers = dict(headers or {})
+        ttl = self.default_ttl if ttl is None else ttl
+        cached = await asyncio.to_thread(self._load, url, headers)
+
+        if cached is not None:
+            if time.time() - cached['stored_at'] < ttl:
+                self.stats['fresh'] += 1
+                return CachedResponse(url, cached['status'], cached['body'], cached['headers'], 'fresh')
+            if cached['headers'].get('etag'):
+                headers['If-None-Match'] = cached['headers']['etag']
+            if cached['headers'].get('last-modified'):
+                headers['If-Modified-Since'] = cached['headers']['last-modified']
+
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+
+            if response.status == 304 and cached is not None:
+                self.stats['revalidated'] += 1
+                # 304 에 새 검증자가 오면 갱신
+                for name in ('etag', 'last-modified'):
+                    if response_headers.get(name):
+                        cached['headers'][name] = response_headers[name]
+                body = cached.pop('body')
+                cached['stored_at'] = time.time()
+                await asyncio.to_thread(self._store, url, headers, cached, body)
+                return CachedResponse(url, cached['status'], body, cached['headers'], 'revalidated')
+
+            body = await response.read()
+            self.stats['miss'] += 1
+            stored_headers = {name: response_headers[name] for name in STORED_HEADERS if name in response_headers}
+
+            if response.status == 200 and self._cacheable(response_headers):
+                meta = {'url': url, 'status': 200, 'headers': stored_headers, 'stored_at': time.time()}
+                try:
+                    await asyncio.to_thread(self._store, url, headers, meta, body)
+                except OSError as e:
+                    logger.warning(f"HTTP 캐시 저장 실패: {e}")
+
+            return CachedResponse(url, response.status, body, stored_headers, 'network')
+
+
+http_cache = HttpCache()
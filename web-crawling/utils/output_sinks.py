@@ -0,0 +1,200 @@
+import gzip
+from abc import ABC, abstractmethod
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Union
+from processors.job_record import JobRecord
+from utils.logger import setup_logger
+from utils.serialization import dumps, dumps_str
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# pyarrow 는 임포트만 0.1초가 넘어 ParquetSink 를 만들 때 로드
+pa = None
+pq = None
+
+logger = setup_logger("output_sinks")
+
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+class JobSink(ABC):
+    """정규화된 공고를 생성되는 즉시 기록하는 출력 대상"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+
+    @abstractmethod
+    def write(self, job: Union[Dict[str, Any], JobRecord]):
+        """공고 하나 기록"""
+
+    @abstractmethod
+    def close(self):
+        """남은 버퍼를 쓰고 파일을 닫음"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class NDJSONSink(JobSink):
+    """한 줄에 공고 하나 (gzip / zstd 압축 선택)"""
+
+    def __init__(self, path: str, compression: Optional[str] = None):
+        super().__init__(path)
+        self.compression = compression
+        self._raw = None
+
+        if compression == 'gzip':
+            self._file = gzip.open(path, 'wb', compresslevel=6)
+        elif compression == 'zstd':
+            if zstandard is None:
+                raise ImportError("zstd 출력에는 zstandard 패키지가 필요합니다 (pip install zstandard)")
+            self._raw = open(path, 'wb')
+            self._file = zstandard.ZstdCompressor(level=3).stream_writer(self._raw)
+        elif compression is None:
+            self._file = open(path, 'wb')
+        else:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+
+    def write(self, job: Union[Dict[str, Any], JobRecord]):
+        if isinstance(job, JobRecord):
+            job = job.to_dict()
+        self._file.write(dumps(job) + b'\n')
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+        if self._raw is not None:
+            self._raw.close()
+        logger.info(f"NDJSON 저장 완료: {self.path} ({self.count}개)")
+
+
+class ParquetSink(JobSink):
+    """row_group_size 개씩 모아 Parquet row group 으로 기록
+
+    메모리에는 한 row group 분량만 머뭅니다. JobRecord 필드는 고정 스키마(job_schema)를
+    쓰고, 그 밖의 필드는 첫 row group 에서 추론해 고정합니다 (이후 새로 등장한 필드는
+    버리고 빠진 필드는 null, 첫 그룹에서 전부 비어 있던 필드는 문자열로). 중첩 dict 는
+    JSON 문자열, 리스트는 문자열 리스트, 숫자는 float 로 맞춰 배치 간 타입이 흔들리지 않게 합니다.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 1000):
+        global pa, pq
+        if pa is None:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("Parquet 출력에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+        super().__init__(path)
+        self.row_group_size = max(1, row_group_size)
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = None
+
+    @staticmethod
+    def job_schema() -> Dict[str, Any]:
+        """JobRecord 필드 → pyarrow 타입"""
+        types = {f.name: pa.string() for f in fields(JobRecord) if f.name != 'extra'}
+        types.update({
+            'keywords': pa.list_(pa.string()),
+            'scraped_at': pa.timestamp('us', tz='UTC'),
+            'quality_score': pa.float64(),
+        })
+        return types
+
+    @staticmethod
+    def _prepare_timestamp(value: Any) -> Optional[datetime]:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        return None
+
+    @staticmethod
+    def _prepare_value(value: Any) -> Any:
+        if value is None or isinstance(value, (str, bool, datetime)):
+            return value
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, (list, tuple, set)):
+            return [str(item) for item in value]
+        if isinstance(value, dict):
+            return dumps_str(value)
+        return str(value)
+
+    def write(self, job: Union[Dict[str, Any], JobRecord]):
+        if isinstance(job, JobRecord):
+            job = job.to_dict()
+        row = {key: self._prepare_value(value) for key, value in job.items()}
+        if 'scraped_at' in row:
+            row['scraped_at'] = self._prepare_timestamp(job['scraped_at'])
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self._schema(), compression='zstd')
+        table = pa.Table.from_pylist(self._rows, schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def _schema(self):
+        """JobRecord 고정 스키마 + 첫 row group 에서 추론한 나머지 필드"""
+        known = self.job_schema()
+        schema_fields = [pa.field(name, type_) for name, type_ in known.items()]
+        inferred = pa.Table.from_pylist([
+            {key: value for key, value in row.items() if key not in known} for row in self._rows
+        ]).schema
+        for inferred_field in inferred:
+            type_ = inferred_field.type
+            if pa.types.is_null(type_):
+                type_ = pa.string()
+            elif pa.types.is_list(type_) and pa.types.is_null(type_.value_type):
+                type_ = pa.list_(pa.string())
+            schema_fields.append(pa.field(inferred_field.name, type_))
+        return pa.schema(schema_fields)
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        logger.info(f"Parquet 저장 완료: {self.path} ({self.count}개)")
+
+
+def open_sink(path: str, row_group_size: int = 1000) -> Optional[JobSink]:
+    """경로 확장자로 출력 대상 결정 (.json 은 요약 파일이므로 None)
+
+    .ndjson / .jsonl (+ .gz / .zst), .parquet
+    """
+    lowered = path.lower()
+    compression = None
+    for suffix, name in COMPRESSION_SUFFIXES.items():
+        if lowered.endswith(suffix):
+            compression = name
+            lowered = lowered[:-len(suffix)]
+            break
+
+    if lowered.endswith(NDJSON_SUFFIXES):
+        return NDJSONSink(path, compression=compression)
+    if lowered.endswith('.parquet') and compression is None:
+        return ParquetSink(path, row_group_size=row_group_size)
+    if lowered.endswith('.json') and compression is None:
+        return None
+    raise ValueError(f"지원하지 않는 출력 형식: {path}")
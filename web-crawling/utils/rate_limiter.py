@@ -0,0 +1,35 @@
+import asyncio
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """초당 rate 회로 요청 시작 간격을 제한
+
+    같은 이벤트 루프의 여러 태스크가 공유해도 요청 시작 시각이 1/rate 초씩 벌어집니다.
+    예약 시각 계산과 갱신 사이에 await 가 없으므로 락이 필요 없습니다. rate 가 0 이하면 제한하지 않음.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+
+    async def wait(self) -> float:
+        """다음 요청 차례까지 기다림 (기다린 초 반환)"""
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_site_limiters: Dict[str, RateLimiter] = {}
+
+
+def site_rate_limiter(site: str, site_config: Dict) -> RateLimiter:
+    """SITES_CONFIG 의 rate_limit (초당 요청 수) 로 만든 사이트별 공용 제한기"""
+    if site not in _site_limiters:
+        _site_limiters[site] = RateLimiter(site_config.get('rate_limit', 1))
+    return _site_limiters[site]
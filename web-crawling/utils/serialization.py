@@ -0,0 +1,101 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from bson import ObjectId
+except ImportError:
+    ObjectId = None
+
+# 설치된 것 중 가장 빠른 구현: orjson → msgspec → 표준 json
+BACKEND = 'orjson' if orjson else ('msgspec' if msgspec else 'json')
+
+# 디코딩 실패는 구현과 관계없이 json.JSONDecodeError (ValueError) 로 통일
+DecodeError = json.JSONDecodeError
+
+
+def _default(value: Any) -> Any:
+    """기본 인코더가 모르는 타입 처리 (ObjectId, datetime, JobRecord 등)"""
+    if ObjectId is not None and isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'tolist'):  # numpy 배열/스칼라
+        return value.tolist()
+    return str(value)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+elif msgspec is not None:
+    _encoder = msgspec.json.Encoder(enc_hook=_default)
+    _decoder = msgspec.json.Decoder()
+
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        if hasattr(obj, 'to_dict'):
+            obj = obj.to_dict()
+        encoded = _encoder.encode(obj)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as e:
+            text = data.decode('utf-8', 'replace') if isinstance(data, bytes) else data
+            raise DecodeError(str(e), text, 0) from e
+
+else:
+    def _dumps(obj: Any, indent: bool) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, default=_default, indent=2 if indent else None,
+            separators=None if indent else (',', ':'),
+        ).encode('utf-8')
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """객체 → UTF-8 JSON 바이트"""
+    return _dumps(obj, indent)
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """객체 → JSON 문자열"""
+    return _dumps(obj, indent).decode('utf-8')
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """JSON 바이트/문자열 → 객체 (실패 시 DecodeError)"""
+    return _loads(data)
+
+
+def dump_file(obj: Any, path: str, indent: bool = False):
+    """JSON 파일로 저장"""
+    with open(path, 'wb') as f:
+        f.write(_dumps(obj, indent))
@@ -0,0 +1,152 @@
+import gzip
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from config.settings import settings
+from utils.logger import setup_logger
+from utils.serialization import dumps, loads
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = setup_logger("snapshot_store")
+
+SNAPSHOT_SUFFIXES = ('.html.zst', '.html.gz')
+# 샘플링과 무관하게 항상 남기는 사유 (타임아웃/오류 디버깅용)
+ALWAYS_KEEP = ('timeout', 'error')
+
+
+def read_snapshot(path: str) -> Tuple[Dict[str, Any], str]:
+    """저장된 스냅샷 → (메타데이터, HTML)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("zstd 스냅샷을 읽으려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        data = gzip.decompress(data)
+    meta_line, html = data.split(b'\n', 1)
+    return loads(meta_line), html.decode('utf-8')
+
+
+class SnapshotStore:
+    """크롤링한 페이지 소스를 압축해 보관하는 저장소
+
+    <directory>/<site>/<sha256>.html.zst 로 내용 주소화하므로 같은 페이지는 한 번만
+    저장되고(mtime 만 갱신), 압축/쓰기는 전용 스레드에서 처리해 크롤링 루프를 막지
+    않습니다. 쓰기 후 max_age_days 보다 오래됐거나 max_bytes 를 넘는 분량은 오래된
+    순서로 지웁니다.
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.SNAPSHOT_DIR,
+        sample_rate: float = settings.SNAPSHOT_SAMPLE_RATE,
+        max_bytes: int = settings.SNAPSHOT_MAX_MB * 1024 * 1024,
+        max_age_days: float = settings.SNAPSHOT_MAX_AGE_DAYS,
+    ):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.suffix = SNAPSHOT_SUFFIXES[0] if zstandard is not None else SNAPSHOT_SUFFIXES[1]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot')
+
+    def should_capture(self, reason: str = 'crawl') -> bool:
+        if reason in ALWAYS_KEEP:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def capture(self, site: str, driver, reason: str = 'crawl') -> Optional[Future]:
+        """샘플에 걸린 경우에만 page_source 를 읽어 백그라운드로 저장"""
+        if not self.should_capture(reason):
+            return None
+        try:
+            html = driver.page_source
+            url = driver.current_url
+        except Exception as e:
+            logger.warning(f"스냅샷용 페이지 소스 읽기 실패: {e}")
+            return None
+        return self.save(site, html, url=url, reason=reason)
+
+    def save(self, site: str, html: str, url: str = '', reason: str = 'crawl') -> Future:
+        """HTML 저장을 예약 (Future 결과는 저장 경로)"""
+        return self._executor.submit(self._write, site, html, url, reason)
+
+    def _compress(self, data: bytes) -> bytes:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def _write(self, site: str, html: str, url: str, reason: str) -> Optional[str]:
+        try:
+            body = html.encode('utf-8')
+            digest = hashlib.sha256(body).hexdigest()
+            site_dir = os.path.join(self.directory, site)
+            path = os.path.join(site_dir, digest + self.suffix)
+
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                os.makedirs(site_dir, exist_ok=True)
+                meta = {'site': site, 'url': url, 'reason': reason, 'captured_at': time.time(), 'size': len(body)}
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(self._compress(dumps(meta) + b'\n' + body))
+                os.replace(tmp_path, path)
+                logger.info(f"스냅샷 저장: {path} ({reason})")
+
+            self.enforce_retention()
+            return path
+        except Exception as e:
+            logger.warning(f"스냅샷 저장 실패: {e}")
+            return None
+
+    def _entries(self) -> Iterator[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return
+        for site_entry in os.scandir(self.directory):
+            if site_entry.is_dir():
+                for entry in os.scandir(site_entry.path):
+                    if entry.name.endswith(SNAPSHOT_SUFFIXES):
+                        yield entry
+
+    def enforce_retention(self) -> int:
+        """기간/용량 초과분 삭제, 지운 개수 반환"""
+        now = time.time()
+        entries = sorted(
+            ((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._entries()),
+            reverse=True,
+        )
+        removed = 0
+        total = 0
+        for mtime, size, path in entries:
+            # 지운 파일은 용량에 넣지 않음 (큰 파일 하나 때문에 더 오래된 작은 파일까지 지우지 않도록)
+            if now - mtime > self.max_age or total + size > self.max_bytes:
+                os.remove(path)
+                removed += 1
+            else:
+                total += size
+        return removed
+
+    def latest(self, site: str) -> Optional[str]:
+        """사이트의 가장 최근 스냅샷 경로"""
+        site_dir = os.path.join(self.directory, site)
+        if not os.path.isdir(site_dir):
+            return None
+        paths = [entry for entry in os.scandir(site_dir) if entry.name.endswith(SNAPSHOT_SUFFIXES)]
+        return max(paths, key=lambda entry: entry.stat().st_mtime).path if paths else None
+
+    def flush(self):
+        """예약된 저장을 모두 마칠 때까지 대기"""
+        self._executor.submit(lambda: None).result()
+
+
+snapshot_store = SnapshotStore()